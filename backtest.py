@@ -0,0 +1,88 @@
+import argparse
+import json
+
+
+# Extra history so EMA-200 and friends have settled by the start
+WARMUP_DAYS = 300
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Recommendation Backtest")
+    parser.add_argument(
+        "--years",
+        type=float,
+        default=5,
+        help="Years of signals to replay"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore the local OHLCV cache and refetch full history"
+    )
+    parser.add_argument(
+        "--trades",
+        default=None,
+        help="Write the simulated trades to this CSV file"
+    )
+    parser.add_argument(
+        "--sweep",
+        action="store_true",
+        help="Run the parameter sweep in config/sweep.json instead"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    # Deferred so --help and argument errors return without
+    # loading pandas and the pipeline
+    import pandas as pd
+
+    from src.backtest.backtest_engine import BacktestEngine
+    from src.backtest.backtest_report import BacktestReport
+    from src.backtest.parameter_sweep import ParameterSweep
+    from src.data_layer.indicator_engine import IndicatorEngine
+    from src.data_layer.market_data_loader import MarketDataLoader
+    from src.data_layer.universe_loader import StockUniverseLoader
+
+    print("Running Backtest...\n")
+
+    universe = StockUniverseLoader("config/universe.csv").load()
+    with open("config/market_indices.json", "r", encoding="utf-8") as f:
+        primary_index = json.load(f)["primary_index"]["symbol"]
+
+    history_days = int(args.years * 365)
+    ohlcv_data = MarketDataLoader("config/market_data.json").fetch(
+        universe.symbols + [primary_index],
+        lookback_days=history_days + WARMUP_DAYS,
+        refresh=args.refresh
+    )
+    panel = IndicatorEngine().compute_panel(ohlcv_data)
+
+    start = str((panel.dates[-1] - pd.Timedelta(days=history_days)).date())
+
+    if args.sweep:
+        sweep = ParameterSweep()
+        results = sweep.run(
+            panel, panel.get(primary_index), universe.symbols, start=start
+        )
+        print(BacktestReport.rounded(results.head(20)).to_string(index=False))
+        return
+
+    result = BacktestEngine().run(
+        panel,
+        panel.get(primary_index),
+        symbols=universe.symbols,
+        start=start
+    )
+
+    print(result.report.to_string())
+
+    if args.trades:
+        result.trades.to_csv(args.trades, index=False)
+        print(f"\nTrades written to {args.trades}")
+
+
+if __name__ == "__main__":
+    main()
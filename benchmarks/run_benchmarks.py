@@ -0,0 +1,319 @@
+"""
+Synthetic-universe benchmarks for every pipeline stage.
+
+Usage (from the repository root):
+
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --sizes 100 1000 --label before
+    python -m benchmarks.run_benchmarks --compare benchmarks/baselines/before.json
+
+Results are written as JSON to benchmarks/baselines/<label>.json
+(or --output-dir) so runs from different commits can be compared.
+Caches, stores and logs used while benchmarking live in a temporary
+directory; the real data/ tree is never touched.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from src.core.config_loader import load_config
+from src.core.recommendation_orchestrator import RecommendationOrchestrator
+from src.data_layer.indicator_engine import IndicatorEngine
+from src.data_layer.market_data_loader import MarketDataLoader
+from src.data_layer.providers.synthetic_provider import (
+    SyntheticDataProvider,
+    generate_synthetic_ohlcv
+)
+from src.data_layer.universe_loader import StockUniverseLoader
+from src.decision.buy_plan_generator import BuyPlanGenerator
+from src.decision.evidence_builder import EvidenceBuilder
+from src.decision.scoring_engine import ScoringEngine
+from src.intelligence.fundamental_filter import FundamentalFilter
+from src.intelligence.liquidity_volatility_filter import LiquidityVolatilityFilter
+from src.intelligence.relative_strength_engine import RelativeStrengthEngine
+from src.persistence.recommendation_logger import RecommendationLogger
+from src.setups.setup_engine import SetupDetectionEngine
+from src.setups.trend_analyzer import TrendAnalyzer
+
+
+BASELINE_DIR = Path("benchmarks/baselines")
+SECTORS = ["IT", "BANKING", "ENERGY", "PHARMA", "FMCG"]
+
+
+def timed(results: Dict, name: str, fn, *args, repeat: int = 1):
+    """
+    Runs fn `repeat` times, stores the best wall time, returns
+    the result of the last call.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn(*args)
+        best = min(best, time.perf_counter() - start)
+
+    results[name] = round(best, 6)
+    print(f"  {name:<28} {best:10.4f}s")
+    return out
+
+
+def synthetic_fundamentals(symbols: List[str], seed: int) -> Dict[str, Dict]:
+    rng = np.random.default_rng(seed)
+    return {
+        s: {
+            "roe": rng.uniform(0, 30),
+            "roce": rng.uniform(0, 30),
+            "debt_to_equity": rng.uniform(0, 1.5),
+            "sales_growth_3y": rng.uniform(-5, 25),
+            "profit_growth_3y": rng.uniform(-5, 25),
+            "operating_cash_flow": rng.uniform(-100, 500)
+        }
+        for s in symbols
+    }
+
+
+def bench_stages(n: int, days: int, seed: int, repeat: int, workdir: Path) -> Dict:
+    results = {}
+    symbols = [f"SYN{i:05d}" for i in range(n)]
+
+    data = timed(results, "generate", generate_synthetic_ohlcv,
+                 symbols, days, seed)
+
+    engine = IndicatorEngine()
+    timed(results, "indicators.compute", engine.compute, data, repeat=repeat)
+    panel = timed(results, "indicators.compute_panel", engine.compute_panel,
+                  data, repeat=repeat)
+    frames = {s: panel[s] for s in panel}
+
+    liquidity = LiquidityVolatilityFilter("config/liquidity_rules.json")
+    fundamental = FundamentalFilter("config/fundamental_rules.json")
+    fundamentals = synthetic_fundamentals(symbols, seed)
+
+    timed(results, "filters.liquidity", liquidity.evaluate, frames,
+          repeat=repeat)
+    timed(results, "filters.liquidity_batch", liquidity.evaluate_batch,
+          panel.symbols, panel.last_valid("vol_avg_20"),
+          panel.last_valid("atr_14"), panel.last_valid("close"),
+          repeat=repeat)
+    # First synthetic symbol stands in for the index
+    close = panel.matrix("close")
+    timed(results, "relative_strength.rank",
+          RelativeStrengthEngine("config/relative_strength_rules.json").rank,
+          close, close[:, 0], panel.symbols, repeat=repeat)
+    timed(results, "filters.fundamental", fundamental.evaluate, fundamentals,
+          repeat=repeat)
+    timed(results, "filters.fundamental_table", fundamental.evaluate_table,
+          pd.DataFrame.from_dict(fundamentals, orient="index"), repeat=repeat)
+
+    trend = TrendAnalyzer("config/trend_rules.json")
+    setups_engine = SetupDetectionEngine()
+
+    snapshots = timed(results, "snapshots", lambda: {
+        s: panel.snapshot(s) for s in frames
+    }, repeat=repeat)
+
+    trends = timed(results, "trend", lambda: {
+        s: trend.analyze(snap) for s, snap in snapshots.items()
+    }, repeat=repeat)
+
+    setups = timed(results, "setups", lambda: {
+        s: setups_engine.detect_setups(snap, trends[s])
+        for s, snap in snapshots.items()
+    }, repeat=repeat)
+
+    candidates = [s for s in frames if setups[s]]
+    results["candidates"] = len(candidates)
+
+    contexts = {
+        s: {
+            "symbol": s,
+            "fundamental": {"approved": True},
+            "liquidity": {"tradable": True},
+            "market_regime": {"regime": "BULLISH"},
+            "sector_strength": {"strength": "NEUTRAL"},
+            "trend": trends[s],
+            "setups": setups[s],
+            "position_state": "NO_POSITION"
+        }
+        for s in candidates
+    }
+
+    scoring = ScoringEngine("config/scoring_weights.json")
+    scores = timed(results, "scoring", lambda: {
+        s: scoring.score(ctx) for s, ctx in contexts.items()
+    }, repeat=repeat)
+    candidate_table = scoring.candidate_table(list(contexts.values()))
+    timed(results, "scoring_table", scoring.score_table, candidate_table,
+          repeat=repeat)
+
+    planner = BuyPlanGenerator()
+    plans = timed(results, "buy_plan", lambda: {
+        s: planner.generate({
+            "indicator_df": frames[s],
+            "snapshot": snapshots[s],
+            "setups": setups[s],
+            "trend": trends[s]
+        })
+        for s in candidates
+    }, repeat=repeat)
+    timed(results, "buy_plan_batch", planner.generate_batch,
+          planner.setup_codes([setups[s][0]["setup_type"] for s in candidates]),
+          *(
+              np.array([snapshots[s].latest[f] for s in candidates], dtype=np.float64)
+              for f in ("high", "close", "ema_20", "atr_14")
+          ),
+          np.array([snapshots[s].low_5 for s in candidates], dtype=np.float64),
+          repeat=repeat)
+
+    builder = EvidenceBuilder()
+    evidence = [
+        builder.build({**contexts[s], "score": scores[s], "buy_plan": plans[s]})
+        for s in candidates
+    ]
+
+    logger = RecommendationLogger(str(workdir / f"logs_{n}"))
+    def log_all():
+        logger.start_run()
+        for e in evidence:
+            logger.log(e)
+        logger.flush()
+
+    timed(results, "logger", log_all)
+
+    timed(results, "orchestrator.run", run_orchestrator,
+          symbols, days, seed, workdir)
+
+    return results
+
+
+def run_orchestrator(symbols: List[str], days: int, seed: int, workdir: Path):
+    universe_csv = workdir / f"universe_{len(symbols)}.csv"
+    with open(universe_csv, "w", encoding="utf-8") as f:
+        f.write("symbol,exchange,sector,enabled\n")
+        for i, s in enumerate(symbols):
+            f.write(f"{s},NSE,{SECTORS[i % len(SECTORS)]},1\n")
+
+    # Shipped configs, with every store and cache under workdir
+    market_data = load_config("config/market_data.json")
+    market_data["cache"]["enabled"] = False
+    market_data_json = workdir / "market_data.json"
+    market_data_json.write_text(json.dumps(market_data), encoding="utf-8")
+
+    fundamentals_csv = workdir / f"fundamentals_{len(symbols)}.csv"
+    pd.DataFrame.from_dict(
+        synthetic_fundamentals(symbols, seed), orient="index"
+    ).rename_axis("symbol").to_csv(fundamentals_csv)
+
+    orchestrator = RecommendationOrchestrator(profile=False)
+    orchestrator.universe_loader = StockUniverseLoader(str(universe_csv))
+    orchestrator.market_loader = MarketDataLoader(str(market_data_json))
+    orchestrator.market_loader.provider = SyntheticDataProvider(
+        days=days, seed=seed
+    )
+    orchestrator.daily_cache = None
+    orchestrator.fundamentals_config = {
+        **orchestrator.fundamentals_config,
+        "db_path": str(workdir / f"fundamentals_{len(symbols)}.db"),
+        "source_csv": str(fundamentals_csv)
+    }
+    orchestrator.logger = RecommendationLogger(
+        str(workdir / f"run_logs_{len(symbols)}")
+    )
+
+    return orchestrator.run()
+
+
+# -------------------------------
+# Baselines
+# -------------------------------
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(current: Dict, baseline_path: str, threshold: float) -> bool:
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    ok = True
+    print(f"\nComparison against {baseline_path} ({baseline['commit']})")
+
+    for size, stages in current["results"].items():
+        previous = baseline["results"].get(size, {})
+        for stage, seconds in stages.items():
+            before = previous.get(stage)
+            if not before or stage == "candidates":
+                continue
+
+            ratio = seconds / before
+            flag = "REGRESSION" if ratio > threshold else ""
+            ok = ok and not flag
+            print(f"  {size:>6} {stage:<28} {before:9.4f}s -> "
+                  f"{seconds:9.4f}s  x{ratio:5.2f} {flag}")
+
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[100, 1000, 5000])
+    parser.add_argument("--days", type=int, default=260)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--label", default=None,
+                        help="Baseline file name (default: git commit)")
+    parser.add_argument("--output-dir", default=str(BASELINE_DIR),
+                        help="Directory for the baseline JSON")
+    parser.add_argument("--compare", default=None,
+                        help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="Slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "days": args.days,
+        "seed": args.seed,
+        "results": {}
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes:
+            print(f"\n{n} symbols x {args.days} days")
+            report["results"][str(n)] = bench_stages(
+                n, args.days, args.seed, args.repeat, Path(tmp)
+            )
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    out = output_dir / f"{args.label or commit}.json"
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved {out}")
+
+    if args.compare and not compare(report, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,64 @@
-from src.core.recommendation_orchestrator import RecommendationOrchestrator
+import argparse
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Recommendation Engine")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore the local OHLCV cache and refetch full history"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes for the per-symbol stage (default: config/pipeline.json)"
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["batch", "streaming"],
+        default=None,
+        help="Run stages one after another or overlap them (default: config/pipeline.json)"
+    )
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=None,
+        help="Build buy plans for the K best candidates only (default: config/pipeline.json)"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=None,
+        help="Write a timing/memory profile for this run"
+    )
+    return parser.parse_args()
+
+
+def print_candidate(outcome):
+    if outcome["eligible"]:
+        print(f"Candidate: {outcome['symbol']} (score {outcome['score']})")
 
 
 def main():
+    args = parse_args()
+
+    # Deferred so --help and argument errors return without
+    # loading pandas and the pipeline
+    from src.core.recommendation_orchestrator import RecommendationOrchestrator
+
     print("Running Recommendation Engine...\n")
 
-    orchestrator = RecommendationOrchestrator()
-    buy_list = orchestrator.run()
+    orchestrator = RecommendationOrchestrator(
+        workers=args.workers,
+        mode=args.mode,
+        profile=args.profile
+    )
+    buy_list = orchestrator.run(
+        refresh=args.refresh,
+        on_outcome=print_candidate,
+        top_k=args.top_k
+    )
 
     if not buy_list:
         print("No recommendations today.")
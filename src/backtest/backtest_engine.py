@@ -0,0 +1,409 @@
+from typing import Dict, List, NamedTuple, Optional
+import numpy as np
+import pandas as pd
+
+from src.core.run_profiler import Stopwatch
+from src.data_layer.indicator_panel import IndicatorPanel
+from src.intelligence.liquidity_volatility_filter import LiquidityVolatilityFilter
+from src.intelligence.market_regime_analyzer import MarketRegimeAnalyzer, REGIMES
+from src.intelligence.relative_strength_engine import RelativeStrengthEngine
+from src.setups.trend_analyzer import TrendAnalyzer
+from src.setups.setup_engine import SetupDetectionEngine
+from src.setups.signal_cube import SignalCube
+from src.decision.eligibility_engine import EligibilityEngine
+from src.decision.scoring_engine import ScoringEngine
+from src.decision.buy_plan_generator import BuyPlanGenerator
+from src.core.config_loader import load_config
+
+from .trade_simulator import TradeSimulator
+from .backtest_report import BacktestReport
+
+
+class BacktestResult(NamedTuple):
+    trades: pd.DataFrame
+    report: pd.DataFrame
+    timings: Dict[str, float]
+
+
+class BacktestEngine:
+    """
+    Replays trend -> setups -> eligibility -> scoring -> buy plan
+    over the full history of an IndicatorPanel and simulates every
+    plan on its OHLCV matrices.
+
+    Each stage runs once on full-history arrays (trend labels, the
+    setup signal cube, regime / RS per date), so a candidate on any
+    date gets the same score and plan the live pipeline would have
+    produced on that day's data.
+
+    Point-in-time fundamentals and sector history are not
+    available: every symbol is treated as approved and sector
+    NEUTRAL. A symbol with a live plan or open trade takes no new
+    signal (the position-state gate).
+    """
+
+    def __init__(self, rules_path: str = "config/backtest_rules.json"):
+        self.rules = self._load_rules(rules_path)
+
+        self.trend_analyzer = TrendAnalyzer("config/trend_rules.json")
+        self.setup_engine = SetupDetectionEngine("config/setup_rules.json")
+        self.liquidity_filter = LiquidityVolatilityFilter("config/liquidity_rules.json")
+        self.market_regime = MarketRegimeAnalyzer("config/market_regime_rules.json")
+        self.relative_strength = RelativeStrengthEngine("config/relative_strength_rules.json")
+        self.eligibility_engine = EligibilityEngine("config/eligibility_rules.json")
+        self.scoring_engine = ScoringEngine("config/scoring_weights.json")
+        self.buy_plan_generator = BuyPlanGenerator()
+
+        self.simulator = TradeSimulator(
+            max_holding_days=self.rules.get("max_holding_days", 20),
+            chunk_size=self.rules.get("simulation_chunk_size", 20000)
+        )
+
+    # -----------------------------
+    # Parameter overrides
+    # -----------------------------
+
+    # Sections whose rules change the signal cube
+    SIGNAL_SECTIONS = ("trend", "setups")
+
+    def rule_sets(self) -> Dict[str, Dict]:
+        """
+        Rules edited by a parameter name's first part, e.g.
+        "scoring.setup" or "setups.breakout.min_margin".
+        """
+        return {
+            "backtest": self.rules,
+            "trend": self.trend_analyzer.rules,
+            "setups": self.setup_engine.rules,
+            "liquidity": self.liquidity_filter.rules,
+            "eligibility": self.eligibility_engine.rules,
+            "scoring": self.scoring_engine.weights
+        }
+
+    def apply_overrides(self, overrides: Dict[str, object]):
+        """
+        Sets dotted rule names to new values in place; only
+        existing rules can be overridden.
+        """
+        sections = self.rule_sets()
+
+        for name, value in overrides.items():
+            section, *path = name.split(".")
+            target = sections.get(section)
+
+            for key in path[:-1]:
+                target = target.get(key) if isinstance(target, dict) else None
+
+            if not path or not isinstance(target, dict) or path[-1] not in target:
+                raise KeyError(f"Unknown rule: {name}")
+
+            target[path[-1]] = value
+
+        self.simulator = TradeSimulator(
+            max_holding_days=self.rules.get("max_holding_days", 20),
+            chunk_size=self.rules.get("simulation_chunk_size", 20000)
+        )
+
+    def signal_cube(
+        self,
+        panel: IndicatorPanel,
+        symbols: Optional[List[str]] = None
+    ) -> SignalCube:
+        return self.setup_engine.signal_cube(panel, self.trend_analyzer, symbols)
+
+    def run(
+        self,
+        panel: IndicatorPanel,
+        index_df: Optional[pd.DataFrame] = None,
+        symbols: Optional[List[str]] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        cube: Optional[SignalCube] = None,
+        rounded: bool = True
+    ) -> BacktestResult:
+        """
+        `index_df` is the primary index with indicators, for the
+        market regime and relative strength (NEUTRAL / 0 without it).
+        `start` / `end` bound the signal dates (default: backtest rules).
+        A precomputed `cube` (same trend / setup rules) is reused.
+        `rounded=False` keeps the report at full precision.
+        """
+        watch = Stopwatch()
+
+        candidates = self.candidates(
+            panel, index_df, symbols, start, end, cube, watch
+        )
+
+        prices = {
+            f: panel.matrix(f) for f in ("open", "high", "low", "close")
+        }
+        rows = candidates["row"].to_numpy()
+        cols = candidates["col"].to_numpy()
+
+        simulated = self.simulator.simulate(prices, rows, cols, candidates)
+        watch.lap("simulation")
+
+        taken = self._select(
+            rows,
+            cols,
+            candidates["score"].to_numpy(),
+            simulated["end_row"].to_numpy(),
+            self.rules.get("max_signals_per_day")
+        )
+        trades = self._trades(
+            candidates[taken], simulated[taken], panel.dates
+        )
+        watch.lap("selection")
+
+        report = BacktestReport.summarize(trades, rounded=rounded)
+        watch.lap("report")
+
+        return BacktestResult(trades, report, watch.timings)
+
+    def candidates(
+        self,
+        panel: IndicatorPanel,
+        index_df: Optional[pd.DataFrame] = None,
+        symbols: Optional[List[str]] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        cube: Optional[SignalCube] = None,
+        watch=None
+    ) -> pd.DataFrame:
+        """
+        Every eligible (date, symbol) in the backtest window with its
+        primary setup, score and buy plan, in date then universe order.
+        `row` / `col` index the panel's dates / symbols.
+        """
+        watch = watch or Stopwatch()
+
+        if cube is None:
+            cube = self.signal_cube(panel, symbols)
+        watch.lap("signals")
+
+        positions = {s: i for i, s in enumerate(panel.symbols)}
+        panel_cols = np.array([positions[s] for s in cube.symbols], dtype=np.int64)
+
+        def matrix(field):
+            return panel.matrix(field)[:, panel_cols]
+
+        close = matrix("close")
+
+        trend, trend_strength = self.trend_analyzer.analyze_arrays(
+            close, matrix("ema_20"), matrix("ema_50"), matrix("ema_200"),
+            matrix("rsi_14")
+        )
+
+        regime, rs = self._market_context(cube.dates, close, index_df)
+        watch.lap("context")
+
+        # -------- Signal cells in the backtest window --------
+        first, last = self._window(
+            cube.dates,
+            start or self.rules.get("start"),
+            end or self.rules.get("end")
+        )
+        fired = cube.signals.any(axis=2)
+        fired[:first] = False
+        fired[last:] = False
+
+        rows, cols = np.nonzero(fired)
+
+        def at(values):
+            return values[rows, cols]
+
+        tradable = self.liquidity_filter.evaluate_batch(
+            np.arange(len(rows)),
+            at(matrix("vol_avg_20")),
+            at(matrix("atr_14")),
+            at(close)
+        )["tradable"].to_numpy()
+
+        # Position state is applied while selecting trades
+        eligible = self.eligibility_engine.evaluate_table(pd.DataFrame({
+            "fundamental_approved": True,
+            "tradable": tradable,
+            "has_setup": True,
+            "position_open": False,
+            "regime": np.asarray(REGIMES)[regime[rows]],
+            "trend": at(trend),
+            "sector_strength": "NEUTRAL"
+        }, index=np.arange(len(rows)))).to_numpy()
+
+        rows, cols = rows[eligible], cols[eligible]
+        watch.lap("eligibility")
+
+        # -------- Scoring --------
+        signals = cube.signals[rows, cols]
+        setup_types = np.asarray(cube.setups)[signals.argmax(axis=1)]
+
+        # Strongest setup label as `score` picks it (max of the labels)
+        setup_strength = np.full(len(rows), "", dtype="<U16")
+        volume_multiple = np.full(len(rows), np.nan)
+
+        for k, detector in enumerate(self.setup_engine.detectors):
+            fired_k = signals[:, k]
+            setup_strength = np.where(
+                fired_k & (setup_strength < detector.strength),
+                detector.strength,
+                setup_strength
+            )
+
+            # First setup whose volume multiple reaches a scoring tier
+            multiple = at(cube.evidence_matrix(detector.setup_type, "volume_multiple"))
+            volume_multiple = np.where(
+                np.isnan(volume_multiple) & fired_k & (multiple >= 1.3),
+                multiple,
+                volume_multiple
+            )
+
+        scores = self.scoring_engine.score_table(pd.DataFrame({
+            "setup_strength": setup_strength,
+            "volume_multiple": volume_multiple,
+            "trend": at(trend),
+            "trend_strength": at(trend_strength),
+            "sector_strength": "NEUTRAL",
+            "regime": np.asarray(REGIMES)[regime[rows]],
+            "relative_strength": np.nan_to_num(at(rs), nan=0.0)
+        }))["score"].to_numpy()
+
+        keep = scores >= self.rules.get("min_score", 0)
+        rows, cols, scores, setup_types = (
+            rows[keep], cols[keep], scores[keep], setup_types[keep]
+        )
+        watch.lap("scoring")
+
+        # -------- Buy plans --------
+        plans = self.buy_plan_generator.generate_batch(
+            self.buy_plan_generator.setup_codes(setup_types),
+            at(matrix("high")),
+            at(close),
+            at(matrix("ema_20")),
+            at(matrix("atr_14")),
+            at(self._low_5(panel, panel_cols))
+        )
+        watch.lap("buy_plans")
+
+        table = pd.DataFrame({
+            "row": rows,
+            "col": panel_cols[cols],
+            "date": cube.dates[rows],
+            "symbol": np.asarray(cube.symbols, dtype=object)[cols],
+            "setup_type": setup_types,
+            "score": scores
+        })
+        return pd.concat([table, plans], axis=1)
+
+    # -----------------------------
+    # Internal helpers
+    # -----------------------------
+
+    def _market_context(self, dates, close, index_df):
+        """
+        Regime code per date and date x symbol RS, as the
+        orchestrator would see them on each day.
+        """
+        if index_df is None or index_df.empty:
+            return (
+                np.zeros(len(dates), dtype=np.int8),
+                np.full(close.shape, np.nan)
+            )
+
+        regime = self.market_regime.analyze_series(index_df, "backtest")
+        index_close = (
+            index_df.set_index("date")["close"]
+              .reindex(dates)
+              .to_numpy(dtype=np.float64)
+        )
+
+        return (
+            regime.codes_asof(dates),
+            self.relative_strength.rs_series(close, index_close)
+        )
+
+    @staticmethod
+    def _window(dates: pd.DatetimeIndex, start, end):
+        first = dates.searchsorted(pd.Timestamp(start)) if start else 0
+        last = dates.searchsorted(pd.Timestamp(end), side="right") if end else len(dates)
+
+        return first, last
+
+    @staticmethod
+    def _low_5(panel: IndicatorPanel, panel_cols: np.ndarray) -> np.ndarray:
+        """
+        Lowest low of each symbol's last 5 bars on every date.
+        """
+        low = pd.DataFrame(panel.matrix("low")[:, panel_cols])
+        out = low.rolling(5, min_periods=1).min().to_numpy()
+
+        # Over the symbol's own bars when it has missing sessions
+        for j in np.flatnonzero(panel.has_gaps[panel_cols]):
+            bars = low[j].dropna()
+            out[:, j] = (
+                bars.rolling(5, min_periods=1).min()
+                    .reindex(low.index)
+                    .to_numpy()
+            )
+
+        return out
+
+    @staticmethod
+    def _select(
+        rows: np.ndarray,
+        cols: np.ndarray,
+        scores: np.ndarray,
+        end_rows: np.ndarray,
+        max_per_day: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Walks candidates by date and score; a symbol is skipped
+        while an earlier plan or trade of it is still live.
+        """
+        taken = np.zeros(len(rows), dtype=bool)
+        busy_until = {}
+
+        current, count = -1, 0
+        for i in np.lexsort((cols, -scores, rows)):
+            row, col = rows[i], cols[i]
+
+            if row != current:
+                current, count = row, 0
+            if max_per_day and count >= max_per_day:
+                continue
+            if row <= busy_until.get(col, -1):
+                continue
+
+            taken[i] = True
+            busy_until[col] = end_rows[i]
+            count += 1
+
+        return taken
+
+    @staticmethod
+    def _trades(
+        candidates: pd.DataFrame,
+        simulated: pd.DataFrame,
+        dates: pd.DatetimeIndex
+    ) -> pd.DataFrame:
+
+        def on(rows):
+            rows = rows.to_numpy()
+            return dates[np.maximum(rows, 0)].where(rows >= 0)
+
+        trades = pd.concat(
+            [candidates.drop(columns=["row", "col"]), simulated], axis=1
+        )
+        trades.insert(
+            trades.columns.get_loc("fill_price"), "fill_date",
+            on(simulated["fill_row"])
+        )
+        trades.insert(
+            trades.columns.get_loc("exit_price"), "exit_date",
+            on(simulated["exit_row"])
+        )
+
+        return trades.reset_index(drop=True)
+
+    @staticmethod
+    def _load_rules(path: str) -> Dict:
+        return load_config(path)
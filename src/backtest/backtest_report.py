@@ -0,0 +1,115 @@
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from .trade_simulator import TradeSimulator
+
+
+class BacktestReport:
+    """
+    Per-setup performance summary of simulated trades.
+
+    Only closed trades (target, stop or timeout) count towards
+    hit rate, expectancy and drawdown. Drawdown is measured in R
+    on the equity curve of one-R-per-trade positions, ordered by
+    exit date.
+    """
+
+    CLOSED = TradeSimulator.CLOSED
+
+    COLUMNS = (
+        "plans",
+        "filled",
+        "closed",
+        "open",
+        "hit_rate",
+        "target_rate",
+        "avg_win_pct",
+        "avg_loss_pct",
+        "expectancy_pct",
+        "expectancy_r",
+        "max_drawdown_r",
+        "avg_holding_days"
+    )
+
+    # Decimals kept for display; counts are left alone
+    DECIMALS = {
+        "hit_rate": 1,
+        "target_rate": 1,
+        "avg_win_pct": 2,
+        "avg_loss_pct": 2,
+        "expectancy_pct": 2,
+        "expectancy_r": 2,
+        "max_drawdown_r": 2,
+        "avg_holding_days": 2
+    }
+
+    @classmethod
+    def summarize(cls, trades: pd.DataFrame, rounded: bool = True) -> pd.DataFrame:
+        """
+        One row per setup type plus "ALL". With `rounded=False`
+        metrics keep full precision (e.g. for ranking sweeps).
+        """
+        rows = {
+            setup: cls._summary(group)
+            for setup, group in trades.groupby("setup_type", sort=True, observed=True)
+        }
+        rows["ALL"] = cls._summary(trades)
+
+        table = pd.DataFrame.from_dict(rows, orient="index", columns=list(cls.COLUMNS))
+        table.index.name = "setup_type"
+        return cls.rounded(table) if rounded else table
+
+    @classmethod
+    def rounded(cls, table: pd.DataFrame) -> pd.DataFrame:
+        """
+        `table` with every report metric it has rounded for display.
+        """
+        decimals: Dict[str, int] = {
+            c: d for c, d in cls.DECIMALS.items() if c in table.columns
+        }
+        return table.round(decimals)
+
+    @classmethod
+    def _summary(cls, trades: pd.DataFrame) -> dict:
+        outcome = trades["outcome"].astype(str)
+        closed = trades[outcome.isin(cls.CLOSED)]
+
+        returns = closed["return_pct"].to_numpy(dtype=np.float64)
+        wins = returns[returns > 0]
+        losses = returns[returns <= 0]
+
+        def mean(values):
+            return float(values.mean()) if len(values) else np.nan
+
+        def rate(mask):
+            return float(mask.mean()) * 100 if len(mask) else np.nan
+
+        return {
+            "plans": len(trades),
+            "filled": int((trades["fill_row"] >= 0).sum()),
+            "closed": len(closed),
+            "open": int((outcome == "OPEN").sum()),
+            "hit_rate": rate(returns > 0),
+            "target_rate": rate(closed["outcome"].astype(str).to_numpy() == "TARGET"),
+            "avg_win_pct": mean(wins),
+            "avg_loss_pct": mean(losses),
+            "expectancy_pct": mean(returns),
+            "expectancy_r": mean(closed["r_multiple"].dropna().to_numpy()),
+            "max_drawdown_r": cls._max_drawdown(closed),
+            "avg_holding_days": mean(closed["holding_days"].to_numpy(dtype=np.float64))
+        }
+
+    @staticmethod
+    def _max_drawdown(closed: pd.DataFrame) -> float:
+        if closed.empty:
+            return np.nan
+
+        ordered = closed.sort_values(["exit_row", "fill_row"], kind="stable")
+        equity = np.concatenate(
+            [[0.0], np.cumsum(ordered["r_multiple"].fillna(0).to_numpy())]
+        )
+        drawdown = np.maximum.accumulate(equity) - equity
+
+        return float(drawdown.max())
@@ -0,0 +1,230 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from typing import Dict, List, Optional
+import json
+import time
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+from src.data_layer.indicator_panel import IndicatorPanel
+from src.data_layer.shared_panel import SharedPanel
+from src.core.config_loader import load_config
+
+from .backtest_engine import BacktestEngine
+from .backtest_report import BacktestReport
+
+
+# Per-process state, populated by _init_worker
+_WORKER: Dict = {}
+
+
+class ParameterSweep:
+    """
+    Backtests a grid or random sample of rule overrides
+    (BacktestEngine.apply_overrides names) and ranks them.
+
+    Indicators are computed once by the caller; the panel is shared
+    with worker processes through shared memory. Parameter sets are
+    grouped by their trend / setup values, so each group's signal
+    cube is built once and reused by every set in it.
+    """
+
+    SUMMARY_COLUMNS = (
+        "plans",
+        "closed",
+        "hit_rate",
+        "expectancy_pct",
+        "expectancy_r",
+        "max_drawdown_r"
+    )
+
+    def __init__(
+        self,
+        config_path: str = "config/sweep.json",
+        rules_path: str = "config/backtest_rules.json"
+    ):
+        self.config = self._load_config(config_path)
+        self.rules_path = rules_path
+        self.workers = self.config.get("workers", 1)
+
+    def parameter_sets(self) -> List[Dict]:
+        """
+        Grid: every combination of the listed values.
+        Random: `samples` draws; lists are sampled as choices and
+        {"min", "max"} ranges uniformly (integers if both bounds are).
+        """
+        parameters = self.config["parameters"]
+        names = list(parameters)
+
+        if self.config.get("method", "grid") == "grid":
+            return [
+                dict(zip(names, values))
+                for values in product(*(self._grid(parameters[n]) for n in names))
+            ]
+
+        rng = np.random.default_rng(self.config.get("seed", 0))
+        return [
+            {n: self._draw(parameters[n], rng) for n in names}
+            for _ in range(self.config.get("samples", 50))
+        ]
+
+    def run(
+        self,
+        panel: IndicatorPanel,
+        index_df: Optional[pd.DataFrame] = None,
+        symbols: Optional[List[str]] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Ranked results table, one row per parameter set, with
+        unrounded metrics; written (rounded) to `output_path` when
+        configured.
+        """
+        sets = self.parameter_sets()
+        groups = self._group(sets)
+
+        context = {
+            "index_df": index_df,
+            "symbols": symbols,
+            "start": start,
+            "end": end,
+            "rules_path": self.rules_path
+        }
+
+        if self.workers > 1 and len(groups) > 1:
+            with SharedPanel(panel) as shared, ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(shared.spec, context)
+            ) as pool:
+                results = [r for group in pool.map(_evaluate_group, groups) for r in group]
+        else:
+            _WORKER.update(context, panel=panel)
+            try:
+                results = [r for group in groups for r in _evaluate_group(group)]
+            finally:
+                _WORKER.clear()
+
+        table = self.rank(pd.DataFrame(results), list(self.config["parameters"]))
+
+        output_path = self.config.get("output_path")
+        if output_path:
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            BacktestReport.rounded(table).to_csv(output_path, index=False)
+
+        return table
+
+    def rank(self, results: pd.DataFrame, names: List[str]) -> pd.DataFrame:
+        """
+        Best `rank_by` first (higher is better); sets with fewer
+        than `min_closed_trades` closed trades rank last.
+        """
+        metric = self.config.get("rank_by", "expectancy_r")
+        qualified = results["closed"] >= self.config.get("min_closed_trades", 0)
+
+        ranked = (
+            results.assign(qualified=qualified)
+              .sort_values(
+                  ["qualified", metric, "set"],
+                  ascending=[False, False, True],
+                  na_position="last",
+                  kind="stable"
+              )
+              .reset_index(drop=True)
+        )
+        ranked.insert(0, "rank", np.arange(1, len(ranked) + 1))
+
+        return ranked[
+            ["rank", "set", *names, *self.SUMMARY_COLUMNS, "qualified", "seconds"]
+        ]
+
+    # -----------------------------
+    # Internal helpers
+    # -----------------------------
+
+    @staticmethod
+    def _group(sets: List[Dict]) -> List[List[Dict]]:
+        """
+        Numbered sets, grouped by their signal-cube parameters
+        in order of first appearance.
+        """
+        groups: Dict[str, List[Dict]] = {}
+
+        for i, params in enumerate(sets):
+            key = json.dumps({
+                name: value for name, value in params.items()
+                if name.split(".")[0] in BacktestEngine.SIGNAL_SECTIONS
+            }, sort_keys=True)
+            groups.setdefault(key, []).append({"set": i, "params": params})
+
+        return list(groups.values())
+
+    @staticmethod
+    def _grid(spec) -> List:
+        if isinstance(spec, dict):
+            values = np.arange(spec["min"], spec["max"] + spec["step"] / 2, spec["step"])
+            return [v.item() for v in np.round(values, 10)]
+        return list(spec)
+
+    @staticmethod
+    def _draw(spec, rng: np.random.Generator):
+        if isinstance(spec, dict):
+            low, high = spec["min"], spec["max"]
+            if isinstance(low, int) and isinstance(high, int):
+                return int(rng.integers(low, high + 1))
+            return float(rng.uniform(low, high))
+        return spec[int(rng.integers(len(spec)))]
+
+    @staticmethod
+    def _load_config(path: str) -> dict:
+        return load_config(path)
+
+
+# -------------------------------
+# Worker side
+# -------------------------------
+
+def _init_worker(spec: Dict, context: Dict):
+    _WORKER.update(context)
+    _WORKER["shm"], _WORKER["panel"] = SharedPanel.attach(spec)
+
+
+def _evaluate_group(group: List[Dict]) -> List[Dict]:
+    panel = _WORKER["panel"]
+    symbols = _WORKER["symbols"]
+
+    cube = None
+    results = []
+
+    for item in group:
+        started = time.perf_counter()
+
+        engine = BacktestEngine(_WORKER["rules_path"])
+        engine.apply_overrides(item["params"])
+
+        # Same trend / setup rules across the group
+        if cube is None:
+            cube = engine.signal_cube(panel, symbols)
+
+        result = engine.run(
+            panel,
+            _WORKER["index_df"],
+            symbols,
+            _WORKER["start"],
+            _WORKER["end"],
+            cube=cube,
+            rounded=False
+        )
+        results.append({
+            "set": item["set"],
+            **item["params"],
+            **{
+                c: result.report.at["ALL", c]
+                for c in ParameterSweep.SUMMARY_COLUMNS
+            },
+            "seconds": round(time.perf_counter() - started, 3)
+        })
+
+    return results
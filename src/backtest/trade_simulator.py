@@ -0,0 +1,181 @@
+from typing import Dict
+import numpy as np
+import pandas as pd
+
+
+class TradeSimulator:
+    """
+    Replays buy plans on daily OHLCV matrices.
+
+    A plan is issued after the close of its signal bar and rests
+    as a limit band [entry_low, entry_high] for `validity_days`
+    bars. It fills on the first bar that trades through the band,
+    at the open clipped into the band. From the fill bar on, the
+    first bar touching the stop or primary target closes the trade
+    (stop first when both are touched on one bar; gaps through a
+    level fill at the open). Trades still open after
+    `max_holding_days` bars, counting the fill bar, exit at the
+    close of the last one.
+
+    All plans are simulated at once on (plan, bar) windows.
+    """
+
+    # Outcome codes
+    OUTCOMES = ("EXPIRED", "TARGET", "STOP", "TIMEOUT", "OPEN", "PENDING")
+    CLOSED = ("TARGET", "STOP", "TIMEOUT")
+
+    def __init__(self, max_holding_days: int = 20, chunk_size: int = 20000):
+        if max_holding_days < 1:
+            raise ValueError("max_holding_days must be at least 1")
+
+        self.max_holding_days = max_holding_days
+        self.chunk_size = chunk_size
+
+    def simulate(
+        self,
+        prices: Dict[str, np.ndarray],
+        rows: np.ndarray,
+        cols: np.ndarray,
+        plans: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        `prices` holds date x symbol "open"/"high"/"low"/"close"
+        matrices; plan i was issued on bar rows[i] of column cols[i].
+        `plans` has the BuyPlanGenerator.generate_batch columns.
+
+        Returns per plan: outcome, fill_row, fill_price, exit_row,
+        exit_price, return_pct, r_multiple, holding_days and
+        end_row (last bar the plan or trade was live).
+        """
+        results = [
+            self._simulate_chunk(
+                prices,
+                rows[start:start + self.chunk_size],
+                cols[start:start + self.chunk_size],
+                plans.iloc[start:start + self.chunk_size]
+            )
+            for start in range(0, len(rows), self.chunk_size)
+        ]
+
+        if not results:
+            return self._frame({k: np.empty(0) for k in self._COLUMNS}, plans.index)
+
+        return pd.concat(results).set_axis(plans.index)
+
+    # -----------------------------
+    # Internal helpers
+    # -----------------------------
+
+    _COLUMNS = (
+        "outcome", "fill_row", "fill_price", "exit_row", "exit_price",
+        "return_pct", "r_multiple", "holding_days", "end_row"
+    )
+
+    def _simulate_chunk(self, prices, rows, cols, plans) -> pd.DataFrame:
+        n_dates = prices["close"].shape[0]
+        n = len(rows)
+
+        validity = plans["validity_days"].to_numpy(dtype=np.int64)
+        width = int(validity.max(initial=0)) + self.max_holding_days
+        steps = np.arange(width)
+
+        # Bars after the signal bar, NaN past the end of the data
+        bar_rows = rows[:, None] + 1 + steps
+        in_data = bar_rows < n_dates
+        take = np.minimum(bar_rows, n_dates - 1), cols[:, None]
+
+        o, h, l, c = (
+            np.where(in_data, prices[f][take], np.nan)
+            for f in ("open", "high", "low", "close")
+        )
+
+        entry_low = plans["entry_low"].to_numpy(dtype=np.float64)[:, None]
+        entry_high = plans["entry_high"].to_numpy(dtype=np.float64)[:, None]
+        stop = plans["stop_loss"].to_numpy(dtype=np.float64)[:, None]
+        target = plans["target_primary"].to_numpy(dtype=np.float64)[:, None]
+
+        # -------- Entry --------
+        fills = (steps < validity[:, None]) & (h >= entry_low) & (l <= entry_high)
+        filled = fills.any(axis=1)
+        fill_k = fills.argmax(axis=1)
+
+        pick = np.arange(n), fill_k
+        fill_price = np.fmin(np.fmax(o[pick], entry_low[:, 0]), entry_high[:, 0])
+
+        # -------- Exit --------
+        timeout_k = fill_k + self.max_holding_days - 1
+
+        holding = (
+            filled[:, None]
+            & (steps >= fill_k[:, None])
+            & (steps <= timeout_k[:, None])
+        )
+        stop_hit = holding & (l <= stop)
+        target_hit = holding & (h >= target)
+
+        stop_k = np.where(stop_hit.any(axis=1), stop_hit.argmax(axis=1), width)
+        target_k = np.where(target_hit.any(axis=1), target_hit.argmax(axis=1), width)
+
+        complete = (timeout_k < width) & (rows + 1 + timeout_k < n_dates)
+
+        # Last bar with a close inside the holding window
+        closes = holding & ~np.isnan(c)
+        last_k = width - 1 - closes[:, ::-1].argmax(axis=1)
+
+        hit_stop = filled & (stop_k <= target_k) & (stop_k < width)
+        hit_target = filled & ~hit_stop & (target_k < width)
+        timed_out = filled & ~hit_stop & ~hit_target & complete
+        still_open = filled & ~hit_stop & ~hit_target & ~complete
+
+        exit_k = np.select(
+            [hit_stop, hit_target, filled],
+            [stop_k, target_k, last_k],
+            -1
+        )
+        at_exit = np.arange(n), np.maximum(exit_k, 0)
+        gapped = exit_k > fill_k
+
+        exit_price = np.select(
+            [hit_stop, hit_target, filled],
+            [
+                np.where(gapped, np.fmin(o[at_exit], stop[:, 0]), stop[:, 0]),
+                np.where(gapped, np.fmax(o[at_exit], target[:, 0]), target[:, 0]),
+                c[at_exit]
+            ],
+            np.nan
+        )
+
+        expired = ~filled & (rows + validity < n_dates)
+        outcome = np.select(
+            [expired, hit_target, hit_stop, timed_out, still_open],
+            [0, 1, 2, 3, 4],
+            5
+        ).astype(np.int8)
+
+        risk = fill_price - stop[:, 0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return_pct = np.where(filled, (exit_price / fill_price - 1) * 100, np.nan)
+            r_multiple = np.where(
+                filled & (risk > 0), (exit_price - fill_price) / risk, np.nan
+            )
+
+        end_k = np.where(filled, exit_k, validity - 1)
+
+        return self._frame({
+            "outcome": outcome,
+            "fill_row": np.where(filled, rows + 1 + fill_k, -1),
+            "fill_price": np.where(filled, fill_price, np.nan),
+            "exit_row": np.where(filled, rows + 1 + exit_k, -1),
+            "exit_price": exit_price,
+            "return_pct": return_pct,
+            "r_multiple": r_multiple,
+            "holding_days": np.where(filled, exit_k - fill_k + 1, 0),
+            "end_row": rows + 1 + end_k
+        }, plans.index)
+
+    def _frame(self, columns: Dict, index) -> pd.DataFrame:
+        frame = pd.DataFrame(columns, index=index)
+        frame["outcome"] = pd.Categorical.from_codes(
+            frame["outcome"].to_numpy(dtype=np.int8), categories=self.OUTCOMES
+        )
+        return frame
@@ -0,0 +1,21 @@
+import copy
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+
+
+def load_config(path: str) -> dict:
+    """
+    Parsed JSON config, read from disk once per process (and
+    again only when the file changes). Each caller gets its own
+    copy, so components can adjust their rules freely.
+    """
+    resolved = str(Path(path).resolve())
+    return copy.deepcopy(_parse(resolved, os.stat(resolved).st_mtime_ns))
+
+
+@lru_cache(maxsize=64)
+def _parse(path: str, mtime_ns: int) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
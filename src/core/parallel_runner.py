@@ -0,0 +1,78 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+from src.data_layer.indicator_panel import IndicatorPanel
+from src.data_layer.shared_panel import SharedPanel
+from .symbol_pipeline import SymbolPipeline
+
+
+# Per-process state, populated by _init_worker
+_WORKER: Dict = {}
+
+
+class ParallelSymbolRunner:
+    """
+    Fans SymbolPipeline.evaluate out over a process pool.
+
+    The indicator panel is copied once into shared memory;
+    workers map it back as a zero-copy IndicatorPanel, so only
+    symbol names and outcome records cross process boundaries.
+    """
+
+    def __init__(self, workers: int, chunk_size: int = 64, timed: bool = False):
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.timed = timed
+
+    def run(
+        self,
+        panel: IndicatorPanel,
+        symbols: List[str],
+        run_context: Dict
+    ) -> List[Dict]:
+
+        order = [s for s in symbols if s in panel]
+        if not order:
+            return []
+
+        chunks = [
+            order[i:i + self.chunk_size]
+            for i in range(0, len(order), self.chunk_size)
+        ]
+
+        outcomes = []
+
+        with SharedPanel(panel) as shared, ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(shared.spec, run_context, self.timed)
+        ) as pool:
+            # map() yields in submission order, keeping the
+            # merge deterministic regardless of completion order
+            for chunk_outcomes in pool.map(_evaluate_chunk, chunks):
+                outcomes.extend(chunk_outcomes)
+
+        return outcomes
+
+
+# -------------------------------
+# Worker side
+# -------------------------------
+
+def _init_worker(spec: Dict, run_context: Dict, timed: bool):
+    _WORKER["shm"], _WORKER["panel"] = SharedPanel.attach(spec)
+    _WORKER["pipeline"] = SymbolPipeline.from_config(timed=timed)
+    _WORKER["run_context"] = run_context
+
+
+def _evaluate_chunk(symbols: List[str]) -> List[Dict]:
+    panel = _WORKER["panel"]
+    pipeline = _WORKER["pipeline"]
+    run_context = _WORKER["run_context"]
+
+    return [
+        pipeline.evaluate(
+            symbol, panel[symbol], run_context, panel.snapshot(symbol)
+        )
+        for symbol in symbols
+    ]
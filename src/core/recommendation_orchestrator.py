@@ -1,4 +1,7 @@
-from typing import List, Dict
+from functools import cached_property
+from typing import Callable, List, Dict, Optional
+
+import pandas as pd
 
 from src.data_layer.universe_loader import StockUniverseLoader
 from src.data_layer.market_data_loader import MarketDataLoader
@@ -8,6 +11,7 @@ from src.intelligence.fundamental_filter import FundamentalFilter
 from src.intelligence.liquidity_volatility_filter import LiquidityVolatilityFilter
 from src.intelligence.market_regime_analyzer import MarketRegimeAnalyzer
 from src.intelligence.sector_strength_analyzer import SectorStrengthAnalyzer
+from src.intelligence.relative_strength_engine import RelativeStrengthEngine
 
 from src.setups.trend_analyzer import TrendAnalyzer
 from src.setups.setup_engine import SetupDetectionEngine
@@ -18,114 +22,511 @@ from src.decision.buy_plan_generator import BuyPlanGenerator
 from src.decision.evidence_builder import EvidenceBuilder
 
 from src.persistence.recommendation_logger import RecommendationLogger
+from src.persistence.fundamentals_store import FundamentalsStore
+from src.persistence.daily_cache import DailyCache
+from .config_loader import load_config
+
+from .symbol_pipeline import SymbolPipeline
+from .parallel_runner import ParallelSymbolRunner
+from .streaming_pipeline import StreamingPipeline
+from .run_profiler import RunProfiler
+from .sector_strength_stage import SectorStrengthStage
+from .top_k import TopKSelector
 
 
 class RecommendationOrchestrator:
 
-    def __init__(self):
-        # Data
-        self.universe_loader = StockUniverseLoader("config/universe.csv")
-        self.market_loader = MarketDataLoader("config/market_data.json")
-        self.indicator_engine = IndicatorEngine()
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        mode: Optional[str] = None,
+        profile: Optional[bool] = None
+    ):
+        self.config = self._load_config("config/pipeline.json")
+        self.workers = workers or self.config.get("workers", 1)
+        self.mode = mode or self.config.get("mode", "batch")
+
+        self.profiling = self.config.get("profiling", {})
+        if profile is not None:
+            self.profiling = {**self.profiling, "enabled": profile}
+        self.profiler = RunProfiler()
+        self._defer_plans = False
 
-        # Intelligence
-        self.fundamental_filter = FundamentalFilter("config/fundamental_rules.json")
-        self.liquidity_filter = LiquidityVolatilityFilter("config/liquidity_rules.json")
-        self.market_regime = MarketRegimeAnalyzer("config/market_regime_rules.json")
-        self.sector_analyzer = SectorStrengthAnalyzer("config/sector_strength_rules.json")
+    # ---------------------------------------------------
+    # Components, built on first use
+    # ---------------------------------------------------
 
-        # Setups
-        self.trend_analyzer = TrendAnalyzer("config/trend_rules.json")
-        self.setup_engine = SetupDetectionEngine()
+    # Data
+    @cached_property
+    def universe_loader(self) -> StockUniverseLoader:
+        return StockUniverseLoader("config/universe.csv")
+
+    @cached_property
+    def market_loader(self) -> MarketDataLoader:
+        return MarketDataLoader("config/market_data.json")
+
+    @cached_property
+    def indicator_engine(self) -> IndicatorEngine:
+        return IndicatorEngine()
+
+    # Intelligence
+    @cached_property
+    def fundamental_filter(self) -> FundamentalFilter:
+        return FundamentalFilter("config/fundamental_rules.json")
+
+    @cached_property
+    def liquidity_filter(self) -> LiquidityVolatilityFilter:
+        return LiquidityVolatilityFilter("config/liquidity_rules.json")
+
+    @cached_property
+    def market_regime(self) -> MarketRegimeAnalyzer:
+        return MarketRegimeAnalyzer("config/market_regime_rules.json")
+
+    @cached_property
+    def sector_analyzer(self) -> SectorStrengthAnalyzer:
+        return SectorStrengthAnalyzer("config/sector_strength_rules.json")
+
+    @cached_property
+    def relative_strength(self) -> RelativeStrengthEngine:
+        return RelativeStrengthEngine("config/relative_strength_rules.json")
+
+    # Setups
+    @cached_property
+    def trend_analyzer(self) -> TrendAnalyzer:
+        return TrendAnalyzer("config/trend_rules.json")
+
+    @cached_property
+    def setup_engine(self) -> SetupDetectionEngine:
+        return SetupDetectionEngine("config/setup_rules.json")
+
+    # Decision
+    @cached_property
+    def eligibility_engine(self) -> EligibilityEngine:
+        return EligibilityEngine("config/eligibility_rules.json")
+
+    @cached_property
+    def scoring_engine(self) -> ScoringEngine:
+        return ScoringEngine("config/scoring_weights.json")
+
+    @cached_property
+    def buy_plan_generator(self) -> BuyPlanGenerator:
+        return BuyPlanGenerator()
+
+    @cached_property
+    def evidence_builder(self) -> EvidenceBuilder:
+        return EvidenceBuilder()
+
+    # Persistence
+    @cached_property
+    def logger(self) -> RecommendationLogger:
+        return RecommendationLogger()
+
+    @cached_property
+    def fundamentals_config(self) -> dict:
+        return self._load_config("config/fundamentals.json")
+
+    @cached_property
+    def fundamentals_store(self) -> FundamentalsStore:
+        return FundamentalsStore(
+            self.fundamentals_config["db_path"],
+            cache_ttl_seconds=self.fundamentals_config.get("cache_ttl_seconds", 86400)
+        )
 
-        # Decision
-        self.eligibility_engine = EligibilityEngine("config/eligibility_rules.json")
-        self.scoring_engine = ScoringEngine("config/scoring_weights.json")
-        self.buy_plan_generator = BuyPlanGenerator()
-        self.evidence_builder = EvidenceBuilder()
+    @cached_property
+    def daily_cache(self) -> Optional[DailyCache]:
+        cache_cfg = self.config.get("daily_cache", {})
+        return (
+            DailyCache(cache_cfg.get("path", "data/daily_cache"))
+            if cache_cfg.get("enabled", False) else None
+        )
+
+    @cached_property
+    def primary_index(self) -> str:
+        return self._load_config(
+            "config/market_indices.json"
+        )["primary_index"]["symbol"]
+
+    @cached_property
+    def sector_stage(self) -> SectorStrengthStage:
+        return SectorStrengthStage(
+            analyzer=self.sector_analyzer,
+            indicator_engine=self.indicator_engine,
+            sector_indices=self._load_config("config/sector_indices.json"),
+            primary_index=self.primary_index,
+            cache=self.daily_cache
+        )
 
-        # Persistence
-        self.logger = RecommendationLogger()
+    # Per-symbol stage
+    @cached_property
+    def symbol_pipeline(self) -> SymbolPipeline:
+        return SymbolPipeline(
+            liquidity_filter=self.liquidity_filter,
+            trend_analyzer=self.trend_analyzer,
+            setup_engine=self.setup_engine,
+            eligibility_engine=self.eligibility_engine,
+            scoring_engine=self.scoring_engine,
+            buy_plan_generator=self.buy_plan_generator,
+            evidence_builder=self.evidence_builder,
+            relative_strength_engine=self.relative_strength
+        )
 
     # ---------------------------------------------------
 
-    def run(self) -> List[Dict]:
+    def run(
+        self,
+        refresh: bool = False,
+        on_outcome: Optional[Callable[[Dict], None]] = None,
+        quotes: Optional[Dict[str, Dict]] = None,
+        top_k: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        `quotes` is an optional L1 snapshot {symbol: {"bid", "ask"}}
+        used by the liquidity spread check.
+
+        `top_k` (default: config/pipeline.json "top_k") keeps only the
+        K best scored candidates while evaluating; buy plans and
+        evidence are built for those alone, the other eligible
+        symbols are logged as score-only records.
+        """
+        top_k = top_k if top_k is not None else self.config.get("top_k")
+        selector = TopKSelector(top_k) if top_k else None
+        score_only = []
+        self._defer_plans = selector is not None
+
+        def collect(outcome):
+            if selector is not None:
+                evicted = selector.push(outcome)
+                if evicted is not None:
+                    score_only.append(self.symbol_pipeline.score_only(evicted))
+
+            if on_outcome:
+                on_outcome(outcome)
+
+        self.profiler = RunProfiler(
+            enabled=self.profiling.get("enabled", False),
+            track_memory=self.profiling.get("track_memory", False)
+        )
+        self.symbol_pipeline.timed = self.profiler.enabled
+        self.logger.start_run(self.profiler.run_id)
+
+        profiler = self.profiler
+
+        # Buffered evidence is written even if the run fails midway
+        try:
+            # 1️⃣ Load universe
+            with profiler.span("universe_load"):
+                universe = self.universe_loader.load()
+
+            if self.mode == "streaming":
+                with profiler.span("streaming"):
+                    outcomes = self._run_streaming(
+                        universe, refresh, collect, quotes
+                    )
+            else:
+                outcomes = self._run_batch(universe, refresh, collect, quotes)
+
+            # 6️⃣ Sort by score (or finish the top K)
+            if selector is not None:
+                with profiler.span("top_k"):
+                    recommendations = self._finalize_top_k(selector, score_only)
+            else:
+                recommendations = self._rank(outcomes)
+        finally:
+            with profiler.span("logging_flush"):
+                self.logger.flush()
+
+        profiler.record_outcomes(outcomes)
+        self._write_profile()
 
-        recommendations = []
+        return recommendations
+
+    # ---------------------------------------------------
 
-        # 1️⃣ Load universe
-        universe = self.universe_loader.load()
+    def _run_batch(self, universe, refresh, on_outcome, quotes) -> List[Dict]:
+        profiler = self.profiler
         symbols = universe.symbols
 
+        # Market + sector indices ride along in the same fetch;
+        # sector indices are skipped when today's result is cached
+        sectors = None if refresh else self.sector_stage.load_cached(universe)
+        index_symbols = (
+            [self.primary_index] if sectors
+            else self.sector_stage.index_symbols(universe)
+        )
+
         # 2️⃣ Fetch market + stock data
-        ohlcv_data = self.market_loader.fetch(symbols)
+        with profiler.span("fetch"):
+            ohlcv_data = self.market_loader.fetch(
+                symbols + index_symbols, refresh=refresh
+            )
 
         # 3️⃣ Compute indicators
-        indicator_data = self.indicator_engine.compute(ohlcv_data)
-
-        # 4️⃣ Market regime (use index symbol separately in production)
-        # For now assume NIFTY included in config
-        # Example placeholder:
-        # market_state = self.market_regime.analyze(index_df)
-        market_state = {"regime": "BULLISH"}
-
-        # 5️⃣ Loop per stock
-        for symbol in symbols:
-
-            df = indicator_data.get(symbol)
-            if df is None:
-                continue
-
-            # Placeholder fundamental & sector data (to integrate properly later)
-            fundamental_status = {"approved": True}
-            liquidity_status = self.liquidity_filter.evaluate({symbol: df})[symbol]
-            sector_status = {"strength": "STRONG"}  # integrate properly later
-
-            trend_info = self.trend_analyzer.analyze(df)
-            setups = self.setup_engine.detect_setups(df, trend_info)
-
-            context = {
-                "symbol": symbol,
-                "fundamental": fundamental_status,
-                "liquidity": liquidity_status,
-                "market_regime": market_state,
-                "sector_strength": sector_status,
-                "trend": trend_info,
-                "setups": setups,
-                "position_state": "NO_POSITION"
-            }
+        with profiler.span("indicators"):
+            indicator_data = self.indicator_engine.compute_panel(ohlcv_data)
+
+        # 4️⃣ Run-level context: fundamentals, market regime, sectors
+        run_context = self._run_context(symbols)
+
+        with profiler.span("market_regime"):
+            run_context["market_regime"] = self._market_regime(
+                indicator_data.get(self.primary_index)
+            )
+
+        with profiler.span("sector_strength"):
+            if sectors is None:
+                sectors = self.sector_stage.compute(universe, indicator_data)
+            run_context["sector_strength"] = self.sector_stage.by_symbol(
+                universe, sectors
+            )
+
+        with profiler.span("relative_strength"):
+            run_context["relative_strength"] = self._relative_strength(
+                indicator_data, symbols
+            )
+
+        with profiler.span("liquidity"):
+            run_context["liquidity"] = self._liquidity_statuses(
+                indicator_data, quotes
+            )
+
+        # 5️⃣ Per-stock stage (sequential or process pool)
+        with profiler.span("symbol_stage"):
+            if self.workers > 1:
+                runner = ParallelSymbolRunner(
+                    workers=self.workers,
+                    chunk_size=self.config.get("chunk_size", 64),
+                    timed=profiler.enabled
+                )
+                outcomes = runner.run(indicator_data, symbols, run_context)
+            else:
+                outcomes = [
+                    self.symbol_pipeline.evaluate(
+                        symbol,
+                        indicator_data[symbol],
+                        run_context,
+                        indicator_data.snapshot(symbol)
+                    )
+                    for symbol in symbols
+                    if symbol in indicator_data
+                ]
+
+        profiler.incr("symbols_missing_data", value=len(symbols) - len(outcomes))
+
+        # Outcomes are in universe order, so logging and the
+        # stable sort are deterministic for any worker count
+        with profiler.span("logging"):
+            for outcome in outcomes:
+                record = SymbolPipeline.log_record(outcome)
+                if record is not None:
+                    self.logger.log(record)
+
+                if on_outcome:
+                    on_outcome(outcome)
+
+        return outcomes
+
+    def _run_streaming(self, universe, refresh, on_outcome, quotes) -> List[Dict]:
+        """
+        Fetch, indicators, per-symbol stage and logging overlap
+        through bounded queues instead of running one after another.
+        """
+        symbols = universe.symbols
+        pipeline = StreamingPipeline(
+            market_loader=self.market_loader,
+            indicator_engine=self.indicator_engine,
+            symbol_pipeline=self.symbol_pipeline,
+            logger=self.logger,
+            config=self.config.get("streaming", {})
+        )
 
-            eligibility = self.eligibility_engine.evaluate(context)
+        run_context = self._run_context(symbols)
+        run_context["quotes"] = quotes or {}
 
-            if not eligibility["eligible"]:
-                continue
+        with self.profiler.span("market_sector_prefetch"):
+            sectors, index_df = self._prefetch_indices(universe, refresh)
 
-            score_result = self.scoring_engine.score(context)
+        run_context["market_regime"] = self._market_regime(index_df)
+        run_context["market_index"] = index_df
+        run_context["sector_strength"] = self.sector_stage.by_symbol(
+            universe, sectors
+        )
 
-            context["score"] = score_result
+        return pipeline.run(
+            symbols,
+            run_context,
+            refresh=refresh,
+            on_outcome=on_outcome
+        )
 
-            buy_plan = self.buy_plan_generator.generate({
-                "indicator_df": df,
-                "setups": setups,
-                "trend": trend_info
-            })
+    def _prefetch_indices(self, universe, refresh):
+        """
+        Market regime and sector strength have to be known before
+        the stream starts: fetch the indices, plus constituents only
+        for sectors whose index is unavailable.
+        Returns (sector results, primary index frame or None).
+        """
+        sectors = None if refresh else self.sector_stage.load_cached(universe)
+
+        ohlcv_data = self.market_loader.fetch(
+            [self.primary_index] if sectors
+            else self.sector_stage.index_symbols(universe),
+            refresh=refresh
+        )
+
+        if sectors is None:
+            missing = set(self.sector_stage.missing_sectors(universe, ohlcv_data))
+            constituents = [
+                s.symbol for s in universe.stocks if s.sector in missing
+            ]
+            if constituents:
+                ohlcv_data.update(
+                    self.market_loader.fetch(constituents, refresh=refresh)
+                )
+
+        panel = self.indicator_engine.compute_panel(ohlcv_data)
+
+        if sectors is None:
+            sectors = self.sector_stage.compute(universe, panel)
+
+        return sectors, panel.get(self.primary_index)
+
+    def _write_profile(self):
+        if not self.profiler.enabled:
+            return
+
+        output_dir = self.profiling.get("output_dir", "run_profiles")
+        self.profiler.write_json(output_dir)
+
+        if self.profiling.get("prometheus", False):
+            self.profiler.write_prometheus(output_dir)
+
+    def _run_context(self, symbols: List[str]) -> Dict:
+        with self.profiler.span("fundamentals"):
+            fundamental = self.fundamental_filter.statuses(
+                self._load_fundamentals(), symbols
+            )
+
+        return {
+            "fundamental": fundamental,
+            "defer_plans": self._defer_plans
+        }
+
+    def _market_regime(self, index_df) -> Dict:
+        """
+        Latest row of the primary index regime series.
+        Without index data the market is treated as NEUTRAL.
+        """
+        if index_df is None or index_df.empty:
+            self.profiler.incr("market_index_missing")
+            return {
+                "regime": "NEUTRAL",
+                "confidence": 0.0,
+                "signals": {"trend": "SIDEWAYS", "volatility": "NORMAL"}
+            }
+
+        series = self.market_regime.analyze_series(
+            index_df, key=self.primary_index
+        )
+        return series.latest()
+
+    def _relative_strength(self, panel, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        One cross-sectional ranking pass over the close panel
+        against the primary index.
+        """
+        if self.primary_index not in panel:
+            return {}
+
+        position = {s: i for i, s in enumerate(panel.symbols)}
+        ranked = [s for s in symbols if s in position]
+
+        close = panel.matrix("close")
+        table = self.relative_strength.rank(
+            close[:, [position[s] for s in ranked]],
+            close[:, position[self.primary_index]],
+            ranked
+        )
 
-            context["buy_plan"] = buy_plan
+        return self.relative_strength.statuses(table)
+
+    def _liquidity_statuses(self, panel, quotes) -> Dict[str, Dict]:
+        """
+        One vectorized liquidity pass over the last bar of every
+        symbol in the panel.
+        """
+        symbols = list(panel.symbols)
+
+        table = self.liquidity_filter.evaluate_batch(
+            symbols,
+            vol_avg=panel.last_valid("vol_avg_20"),
+            atr=panel.last_valid("atr_14"),
+            close=panel.last_valid("close"),
+            spread_percent=self.liquidity_filter.spread_percent(symbols, quotes)
+        )
 
-            evidence = self.evidence_builder.build(context)
+        return self.liquidity_filter.statuses(table)
+
+    def _load_fundamentals(self) -> pd.DataFrame:
+        """
+        Universe-wide latest fundamentals, indexed by symbol.
+        The CSV dump is only re-imported when it has changed.
+        """
+        source = self.fundamentals_config.get("source_csv")
+        if source:
+            self.fundamentals_store.import_csv(source)
+
+        # Quarterly data: flag runs whose newest period is overdue
+        refresh_days = self.fundamentals_config.get("refresh_interval_days", 90)
+        if self.fundamentals_store.is_stale(refresh_days):
+            self.profiler.incr("fundamentals_stale")
+
+        return self.fundamentals_store.latest()
+
+    def _finalize_top_k(
+        self,
+        selector: TopKSelector,
+        score_only: List[Dict]
+    ) -> List[Dict]:
+        """
+        Buy plans + evidence for the kept candidates only.
+        """
+        recommendations = []
 
-            self.logger.log(evidence)
+        for outcome in selector.ranked():
+            self.symbol_pipeline.finalize(outcome)
+            self.logger.log(outcome["evidence"])
 
             recommendations.append({
-                "symbol": symbol,
-                "score": score_result["score"],
-                "buy_plan": buy_plan
+                "symbol": outcome["symbol"],
+                "score": outcome["score"],
+                "buy_plan": outcome["buy_plan"]
             })
 
-        # 6️⃣ Sort by score
+        for outcome in score_only:
+            self.logger.log(outcome["evidence"])
+
+        self.profiler.incr("top_k_score_only", value=len(score_only))
+        return recommendations
+
+    @staticmethod
+    def _rank(outcomes: List[Dict]) -> List[Dict]:
+        recommendations = [
+            {
+                "symbol": outcome["symbol"],
+                "score": outcome["score"],
+                "buy_plan": outcome["buy_plan"]
+            }
+            for outcome in outcomes
+            if outcome["eligible"]
+        ]
+
         recommendations.sort(
             key=lambda x: x["score"],
             reverse=True
         )
 
         return recommendations
+
+    @staticmethod
+    def _load_config(path: str) -> dict:
+        return load_config(path)
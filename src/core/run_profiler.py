@@ -0,0 +1,263 @@
+import json
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+_NULL_SPAN = nullcontext()
+
+
+def _max_rss_bytes() -> Optional[int]:
+    """
+    Peak RSS of this process, or None where `resource` is
+    unavailable (Windows). ru_maxrss is KiB on Linux, bytes on macOS.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss * 1024 if sys.platform.startswith("linux") else max_rss
+
+
+class Stopwatch:
+    """
+    Lap timer for the sub-stages of one symbol.
+    """
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+        self._last = time.perf_counter()
+
+    def lap(self, stage: str):
+        now = time.perf_counter()
+        self.timings[stage] = now - self._last
+        self._last = now
+
+
+class NullStopwatch:
+
+    timings = None
+
+    def lap(self, stage: str):
+        pass
+
+
+NULL_STOPWATCH = NullStopwatch()
+
+
+class _Span:
+
+    def __init__(self, profiler: "RunProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.peak = 0
+
+    def __enter__(self):
+        self.profiler._enter(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler._exit(self, time.perf_counter() - self.start)
+        return False
+
+
+class RunProfiler:
+    """
+    Collects wall time and peak traced memory per run stage,
+    per-symbol stage timings and labelled counters.
+
+    When disabled every call is a no-op returning shared
+    null objects, so instrumented code pays almost nothing.
+    """
+
+    def __init__(self, enabled: bool = False, track_memory: bool = False):
+        self.enabled = enabled
+        self.track_memory = enabled and track_memory
+
+        self.run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        self.spans: List[Dict] = []
+        self.symbols: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, Dict[tuple, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+
+        self._stack: List[_Span] = []
+        self._started_tracing = False
+
+    # -------------------------------
+    # Recording
+    # -------------------------------
+
+    def span(self, name: str):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def stopwatch(self):
+        return Stopwatch() if self.enabled else NULL_STOPWATCH
+
+    def incr(self, name: str, labels: Optional[Dict] = None, value: float = 1):
+        if not self.enabled:
+            return
+        key = tuple(sorted((labels or {}).items()))
+        self.counters[name][key] += value
+
+    def record_symbol(self, symbol: str, timings: Optional[Dict[str, float]]):
+        if self.enabled and timings:
+            self.symbols[symbol] = timings
+
+    def record_outcomes(self, outcomes: List[Dict]):
+        """
+        Per-symbol timings and eligibility counters from
+        SymbolPipeline outcome records.
+        """
+        if not self.enabled:
+            return
+
+        for outcome in outcomes:
+            self.record_symbol(outcome["symbol"], outcome.get("timings"))
+            self.incr("symbols_evaluated")
+
+            if outcome["eligible"]:
+                self.incr("symbols_eligible")
+
+            for reason in outcome["blocking_reasons"]:
+                self.incr("eligibility_rejections", {"reason": reason})
+
+    # -------------------------------
+    # Reporting
+    # -------------------------------
+
+    def report(self) -> Dict:
+        stage_totals = defaultdict(lambda: {"count": 0, "total_seconds": 0.0,
+                                            "max_seconds": 0.0})
+        for timings in self.symbols.values():
+            for stage, seconds in timings.items():
+                totals = stage_totals[stage]
+                totals["count"] += 1
+                totals["total_seconds"] += seconds
+                totals["max_seconds"] = max(totals["max_seconds"], seconds)
+
+        return {
+            "run_id": self.run_id,
+            "max_rss_bytes": _max_rss_bytes(),
+            "stages": self.spans,
+            "symbol_stages": dict(stage_totals),
+            "symbols": self.symbols,
+            "counters": {
+                name: [
+                    {"labels": dict(key), "value": value}
+                    for key, value in values.items()
+                ]
+                for name, values in self.counters.items()
+            }
+        }
+
+    def write_json(self, output_dir: str) -> Path:
+        path = Path(output_dir) / f"profile_{self.run_id}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+
+        return path
+
+    def write_prometheus(self, output_dir: str) -> Path:
+        path = Path(output_dir) / f"metrics_{self.run_id}.prom"
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.prometheus_text())
+
+        return path
+
+    def prometheus_text(self) -> str:
+        report = self.report()
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP pfm_{name} {help_text}")
+            lines.append(f"# TYPE pfm_{name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(
+                    f'{k}="{v}"' for k, v in labels.items()
+                )
+                suffix = f"{{{label_text}}}" if label_text else ""
+                lines.append(f"pfm_{name}{suffix} {value}")
+
+        metric(
+            "stage_seconds", "gauge", "Wall time per run stage",
+            [({"stage": s["name"]}, s["wall_seconds"]) for s in report["stages"]]
+        )
+
+        if self.track_memory:
+            metric(
+                "stage_peak_memory_bytes", "gauge",
+                "Peak traced memory per run stage",
+                [({"stage": s["name"]}, s["peak_memory_bytes"])
+                 for s in report["stages"]]
+            )
+
+        metric(
+            "symbol_stage_seconds_total", "counter",
+            "Summed per-symbol wall time per stage",
+            [({"stage": stage}, totals["total_seconds"])
+             for stage, totals in report["symbol_stages"].items()]
+        )
+
+        for name, samples in report["counters"].items():
+            metric(
+                f"{name}_total", "counter", name.replace("_", " "),
+                [(s["labels"], s["value"]) for s in samples]
+            )
+
+        if report["max_rss_bytes"] is not None:
+            metric("max_rss_bytes", "gauge", "Peak resident set size",
+                   [({}, report["max_rss_bytes"])])
+
+        return "\n".join(lines) + "\n"
+
+    # -------------------------------
+    # Span bookkeeping
+    # -------------------------------
+
+    def _enter(self, span: _Span):
+        if self.track_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+
+            # Fold the peak reached so far into the enclosing
+            # span before resetting it for this one
+            _, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1].peak = max(self._stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+
+        self._stack.append(span)
+
+    def _exit(self, span: _Span, elapsed: float):
+        self._stack.pop()
+
+        record = {"name": span.name, "wall_seconds": elapsed}
+
+        if self.track_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            span.peak = max(span.peak, peak)
+            record["peak_memory_bytes"] = span.peak
+
+            if self._stack:
+                self._stack[-1].peak = max(self._stack[-1].peak, span.peak)
+            elif self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+        self.spans.append(record)
@@ -0,0 +1,211 @@
+import hashlib
+import json
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from src.data_layer.indicator_engine import IndicatorEngine
+from src.data_layer.indicator_panel import IndicatorPanel
+from src.data_layer.universe_loader import StockUniverse
+from src.intelligence.sector_strength_analyzer import SectorStrengthAnalyzer
+from src.persistence.daily_cache import DailyCache
+
+
+class SectorStrengthStage:
+    """
+    Run-level sector strength: one status per sector, computed
+    once and mapped to each symbol through its universe sector.
+
+    Sectors (or the primary index) whose index data is missing
+    are scored from an equal- or volume-weighted composite of
+    their universe constituents.
+
+    Results are cached per trading day and universe membership,
+    and only when every configured index was available, so a
+    failed index fetch is retried on the next run.
+    """
+
+    CACHE_NAME = "sector_strength"
+    MARKET = "__MARKET__"
+    WEIGHTINGS = ("equal", "volume")
+
+    def __init__(
+        self,
+        analyzer: SectorStrengthAnalyzer,
+        indicator_engine: IndicatorEngine,
+        sector_indices: Dict[str, str],
+        primary_index: str,
+        cache: Optional[DailyCache] = None
+    ):
+        self.analyzer = analyzer
+        self.indicator_engine = indicator_engine
+        self.sector_indices = sector_indices
+        self.primary_index = primary_index
+        self.cache = cache
+
+        self.weighting = analyzer.rules.get("composite_weighting", "equal")
+        if self.weighting not in self.WEIGHTINGS:
+            raise ValueError(f"Unknown composite weighting: {self.weighting}")
+
+    def index_symbols(self, universe: StockUniverse) -> List[str]:
+        """
+        Primary index + the index of every sector in the universe,
+        to be fetched alongside the stocks.
+        """
+        symbols = [self.primary_index]
+        symbols += [
+            self.sector_indices[sector]
+            for sector in universe.sectors
+            if sector in self.sector_indices
+        ]
+        return symbols
+
+    def missing_sectors(self, universe: StockUniverse, available) -> List[str]:
+        """
+        Sectors that need a constituent composite, given the
+        symbols that were actually fetched.
+        """
+        if self.primary_index not in available:
+            return list(universe.sectors)
+
+        return [
+            sector for sector in universe.sectors
+            if self.sector_indices.get(sector) not in available
+        ]
+
+    def load_cached(self, universe: StockUniverse) -> Optional[Dict[str, Dict]]:
+        if self.cache is None:
+            return None
+
+        cached = self.cache.get(self._cache_name(universe))
+        if not cached or not set(universe.sectors) <= set(cached):
+            return None
+
+        # Entries built from a composite stand-in are not reused
+        if any(
+            status.get("source") != "index"
+            for sector, status in cached.items()
+            if sector in self.sector_indices
+        ):
+            return None
+
+        return cached
+
+    def compute(
+        self,
+        universe: StockUniverse,
+        panel: IndicatorPanel
+    ) -> Dict[str, Dict]:
+        """
+        Sector -> {"strength", "relative_return", "trend", "source"}.
+        """
+        members = defaultdict(list)
+        for stock in universe.stocks:
+            if stock.symbol in panel:
+                members[stock.sector].append(stock.symbol)
+
+        sector_data = {}
+        composites = {}
+        sources = {}
+
+        for sector in universe.sectors:
+            index = self.sector_indices.get(sector)
+
+            if index in panel:
+                sector_data[sector] = panel[index]
+                sources[sector] = "index"
+            elif members[sector]:
+                composites[sector] = members[sector]
+                sources[sector] = "composite"
+
+        if self.primary_index not in panel:
+            composites[self.MARKET] = [s for group in members.values() for s in group]
+
+        built = self.indicator_engine.compute({
+            name: self._composite(panel, symbols)
+            for name, symbols in composites.items()
+            if symbols
+        })
+
+        index_df = panel[self.primary_index] if self.primary_index in panel \
+            else built.pop(self.MARKET, None)
+
+        if index_df is None:
+            return {}
+
+        sector_data.update(built)
+        results = self.analyzer.analyze(sector_data, index_df)
+
+        for sector, status in results.items():
+            status["source"] = sources[sector]
+
+        complete = self.primary_index in panel and all(
+            sources.get(sector) != "composite"
+            for sector in results
+            if sector in self.sector_indices
+        )
+        if self.cache is not None and complete:
+            self.cache.put(self._cache_name(universe), results)
+
+        return results
+
+    @staticmethod
+    def by_symbol(
+        universe: StockUniverse,
+        sector_results: Dict[str, Dict]
+    ) -> Dict[str, Dict]:
+        return {
+            stock.symbol: {"sector": stock.sector, **sector_results[stock.sector]}
+            for stock in universe.stocks
+            if stock.sector in sector_results
+        }
+
+    # -----------------------------
+    # Internal helpers
+    # -----------------------------
+
+    def _cache_name(self, universe: StockUniverse) -> str:
+        """
+        Cache entry for this universe's sector membership and
+        index configuration; composites depend on both.
+        """
+        key = json.dumps({
+            "members": sorted([s.sector, s.symbol] for s in universe.stocks),
+            "sector_indices": self.sector_indices,
+            "primary_index": self.primary_index,
+            "weighting": self.weighting
+        }, sort_keys=True)
+
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+        return f"{self.CACHE_NAME}_{digest}"
+
+    def _composite(self, panel: IndicatorPanel, symbols: List[str]) -> pd.DataFrame:
+        """
+        Synthetic index (base 100) from constituent daily returns.
+        Volume weighting uses each member's previous-day volume.
+        """
+        close = panel.wide("close")[symbols]
+        volume = panel.wide("volume")[symbols]
+        returns = close.pct_change(fill_method=None)
+
+        if self.weighting == "volume":
+            weights = volume.shift(1).where(returns.notna())
+            daily = (
+                (returns * weights).sum(axis=1, min_count=1)
+                / weights.sum(axis=1, min_count=1)
+            )
+        else:
+            daily = returns.mean(axis=1)
+
+        traded = close.notna().any(axis=1)
+        level = (100 * (1 + daily.fillna(0)).cumprod())[traded]
+
+        return pd.DataFrame({
+            "date": level.index,
+            "open": level.values,
+            "high": level.values,
+            "low": level.values,
+            "close": level.values,
+            "volume": volume.sum(axis=1)[traded].values
+        })
@@ -0,0 +1,158 @@
+import asyncio
+from typing import Callable, Dict, List, Optional
+
+from .symbol_pipeline import SymbolPipeline
+
+
+class StreamingPipeline:
+    """
+    Streams symbols through bounded asyncio queues:
+
+        fetch -> indicators -> evaluate -> log
+
+    Blocking stage work runs in worker threads, so network I/O
+    of later batches overlaps indicator/setup work of earlier
+    ones. Bounded queues give backpressure: a slow stage
+    pauses the stages feeding it.
+    """
+
+    def __init__(
+        self,
+        market_loader,
+        indicator_engine,
+        symbol_pipeline,
+        logger,
+        config: Optional[Dict] = None
+    ):
+        self.market_loader = market_loader
+        self.indicator_engine = indicator_engine
+        self.symbol_pipeline = symbol_pipeline
+        self.logger = logger
+
+        config = config or {}
+        queue_sizes = config.get("queue_sizes", {})
+        concurrency = config.get("concurrency", {})
+
+        self.fetch_batch_size = config.get("fetch_batch_size", 50)
+
+        self.queue_sizes = {
+            stage: queue_sizes.get(stage, 256)
+            for stage in ("indicators", "evaluate", "log")
+        }
+        self.concurrency = {
+            stage: max(1, concurrency.get(stage, 1))
+            for stage in ("fetch", "indicators", "evaluate", "log")
+        }
+
+    def run(
+        self,
+        symbols: List[str],
+        run_context: Dict,
+        refresh: bool = False,
+        on_outcome: Optional[Callable[[Dict], None]] = None
+    ) -> List[Dict]:
+        """
+        Returns outcome records in universe order.
+        `on_outcome` is called as soon as each symbol finishes.
+        """
+        return asyncio.run(
+            self._run(symbols, run_context, refresh, on_outcome)
+        )
+
+    # -------------------------------
+    # Stages
+    # -------------------------------
+
+    async def _run(self, symbols, run_context, refresh, on_outcome):
+        order = {symbol: i for i, symbol in enumerate(symbols)}
+
+        batches = asyncio.Queue()
+        for start in range(0, len(symbols), self.fetch_batch_size):
+            batches.put_nowait(symbols[start:start + self.fetch_batch_size])
+
+        indicator_q = asyncio.Queue(maxsize=self.queue_sizes["indicators"])
+        evaluate_q = asyncio.Queue(maxsize=self.queue_sizes["evaluate"])
+        log_q = asyncio.Queue(maxsize=self.queue_sizes["log"])
+
+        outcomes = []
+
+        async def fetch_worker():
+            while not batches.empty():
+                batch = batches.get_nowait()
+                data = await asyncio.to_thread(
+                    self.market_loader.fetch, batch, refresh=refresh
+                )
+                for symbol in batch:
+                    if symbol in data:
+                        await indicator_q.put((symbol, data[symbol]))
+
+        async def indicator_worker():
+            while (item := await indicator_q.get()) is not None:
+                symbol, df = item
+                enriched = await asyncio.to_thread(
+                    self.indicator_engine.compute, {symbol: df}
+                )
+                await evaluate_q.put((symbol, enriched[symbol]))
+
+        async def evaluate_worker():
+            while (item := await evaluate_q.get()) is not None:
+                symbol, df = item
+                outcome = await asyncio.to_thread(
+                    self.symbol_pipeline.evaluate, symbol, df, run_context
+                )
+                outcomes.append(outcome)
+
+                record = SymbolPipeline.log_record(outcome)
+                if record is not None:
+                    await log_q.put(record)
+
+                if on_outcome:
+                    on_outcome(outcome)
+
+        async def log_worker():
+            while (evidence := await log_q.get()) is not None:
+                await asyncio.to_thread(self.logger.log, evidence)
+
+        stages = [
+            (fetch_worker, None, "fetch"),
+            (indicator_worker, indicator_q, "indicators"),
+            (evaluate_worker, evaluate_q, "evaluate"),
+            (log_worker, log_q, "log")
+        ]
+
+        tasks = [
+            [asyncio.create_task(worker())
+             for _ in range(self.concurrency[name])]
+            for worker, _, name in stages
+        ]
+
+        async def drain():
+            # Each finished stage sends one stop marker per
+            # worker of the next stage
+            for i, stage_tasks in enumerate(tasks):
+                await asyncio.gather(*stage_tasks)
+
+                if i + 1 < len(stages):
+                    next_queue = stages[i + 1][1]
+                    for _ in tasks[i + 1]:
+                        await next_queue.put(None)
+
+        everything = [asyncio.create_task(drain())]
+        everything += [t for stage_tasks in tasks for t in stage_tasks]
+
+        # A failing stage must not leave its neighbours blocked on
+        # a full or empty queue: stop everything on first error
+        done, pending = await asyncio.wait(
+            everything, return_when=asyncio.FIRST_EXCEPTION
+        )
+
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        for task in done:
+            if task.exception() is not None:
+                raise task.exception()
+
+        outcomes.sort(key=lambda o: order[o["symbol"]])
+        return outcomes
@@ -0,0 +1,270 @@
+from typing import Dict, List, Optional
+import pandas as pd
+
+from src.data_layer.bar_snapshot import BarSnapshot
+from src.intelligence.liquidity_volatility_filter import LiquidityVolatilityFilter
+from src.intelligence.relative_strength_engine import RelativeStrengthEngine
+from src.setups.trend_analyzer import TrendAnalyzer
+from src.setups.setup_engine import SetupDetectionEngine
+from src.decision.eligibility_engine import EligibilityEngine
+from src.decision.scoring_engine import ScoringEngine
+from src.decision.buy_plan_generator import BuyPlanGenerator
+from src.decision.evidence_builder import EvidenceBuilder
+
+from .run_profiler import Stopwatch, NULL_STOPWATCH
+
+
+class SymbolPipeline:
+    """
+    Per-symbol evaluation stage:
+    liquidity -> trend -> setups -> eligibility -> scoring
+    -> buy plan -> evidence.
+
+    With staged evaluation (eligibility rules) the cheap gates run
+    first, in the configured order, and a failing gate skips the
+    remaining stages.
+
+    Holds no per-run state, so the same instance can be used
+    sequentially or rebuilt inside worker processes.
+    """
+
+    def __init__(
+        self,
+        liquidity_filter: LiquidityVolatilityFilter,
+        trend_analyzer: TrendAnalyzer,
+        setup_engine: SetupDetectionEngine,
+        eligibility_engine: EligibilityEngine,
+        scoring_engine: ScoringEngine,
+        buy_plan_generator: BuyPlanGenerator,
+        evidence_builder: EvidenceBuilder,
+        relative_strength_engine: Optional[RelativeStrengthEngine] = None,
+        timed: bool = False
+    ):
+        self.liquidity_filter = liquidity_filter
+        self.trend_analyzer = trend_analyzer
+        self.setup_engine = setup_engine
+        self.eligibility_engine = eligibility_engine
+        self.scoring_engine = scoring_engine
+        self.buy_plan_generator = buy_plan_generator
+        self.evidence_builder = evidence_builder
+        self.relative_strength_engine = relative_strength_engine
+        self.timed = timed
+
+    @classmethod
+    def from_config(cls, timed: bool = False) -> "SymbolPipeline":
+        return cls(
+            liquidity_filter=LiquidityVolatilityFilter("config/liquidity_rules.json"),
+            trend_analyzer=TrendAnalyzer("config/trend_rules.json"),
+            setup_engine=SetupDetectionEngine("config/setup_rules.json"),
+            eligibility_engine=EligibilityEngine("config/eligibility_rules.json"),
+            scoring_engine=ScoringEngine("config/scoring_weights.json"),
+            buy_plan_generator=BuyPlanGenerator(),
+            evidence_builder=EvidenceBuilder(),
+            relative_strength_engine=RelativeStrengthEngine(
+                "config/relative_strength_rules.json"
+            ),
+            timed=timed
+        )
+
+    def evaluate(
+        self,
+        symbol: str,
+        df: pd.DataFrame,
+        run_context: Dict,
+        snapshot: Optional[BarSnapshot] = None
+    ) -> Dict:
+        """
+        Returns an outcome record:
+        {
+          "symbol", "eligible", "blocking_reasons", "timings",
+          and for eligible symbols "score", "buy_plan", "evidence"
+        }
+        Early rejections also carry "rejected_at" (the gate name)
+        and, when rejections are recorded, a compact "evidence".
+
+        With run_context["defer_plans"] (top-K runs) eligible symbols
+        stop after scoring: the outcome is marked "deferred" and keeps
+        its "context" for `finalize`.
+        "timings" holds per-stage seconds when the pipeline is timed.
+        `snapshot` (e.g. IndicatorPanel.snapshot) is built from `df`
+        when not given.
+        """
+
+        watch = Stopwatch() if self.timed else NULL_STOPWATCH
+
+        # Latest bars extracted once, shared by every stage below
+        if snapshot is None:
+            snapshot = BarSnapshot.from_frame(df)
+
+        fundamental_status = run_context.get("fundamental", {}).get(
+            symbol, {"approved": True}
+        )
+        # Precomputed universe-wide in batch mode
+        liquidity_status = run_context.get("liquidity", {}).get(symbol)
+        if liquidity_status is None:
+            liquidity_status = self.liquidity_filter.evaluate(
+                {symbol: snapshot}, quotes=run_context.get("quotes")
+            )[symbol]
+        sector_status = run_context.get("sector_strength", {}).get(
+            symbol, {"strength": "NEUTRAL"}
+        )
+        watch.lap("filters")
+
+        context = {
+            "symbol": symbol,
+            "fundamental": fundamental_status,
+            "liquidity": liquidity_status,
+            "market_regime": run_context["market_regime"],
+            "sector_strength": sector_status,
+            "position_state": "NO_POSITION"
+        }
+
+        # Cheap, decisive gates before trend/setup work
+        if self.eligibility_engine.staged:
+            for gate in self.eligibility_engine.gate_order:
+                if gate in self.eligibility_engine.TREND_GATES and "trend" not in context:
+                    context["trend"] = self.trend_analyzer.analyze(snapshot)
+                    watch.lap("trend")
+
+                reason = self.eligibility_engine.check(gate, context)
+                if reason:
+                    watch.lap("gates")
+                    return self._rejected(symbol, [reason], gate, watch)
+
+            watch.lap("gates")
+
+        if "trend" not in context:
+            context["trend"] = self.trend_analyzer.analyze(snapshot)
+            watch.lap("trend")
+        trend_info = context["trend"]
+
+        setups = self.setup_engine.detect_setups(snapshot, trend_info)
+        context["setups"] = setups
+        watch.lap("setups")
+
+        eligibility = self.eligibility_engine.evaluate(context)
+        watch.lap("eligibility")
+
+        if not eligibility["eligible"]:
+            return self._rejected(
+                symbol, eligibility["blocking_reasons"], "eligibility", watch
+            )
+
+        # Only needed for scoring/evidence of eligible symbols
+        rs_status = self._relative_strength(symbol, df, run_context)
+        context["relative_strength"] = (
+            rs_status["relative_strength"] if rs_status else 0
+        )
+        context["relative_strength_detail"] = rs_status
+
+        score_result = self.scoring_engine.score(context)
+        watch.lap("scoring")
+
+        context["score"] = score_result
+        context["snapshot"] = snapshot
+
+        outcome = {
+            "symbol": symbol,
+            "eligible": True,
+            "blocking_reasons": [],
+            "score": score_result["score"],
+            "context": context,
+            "timings": watch.timings
+        }
+
+        if run_context.get("defer_plans"):
+            outcome["deferred"] = True
+            return outcome
+
+        return self.finalize(outcome, watch)
+
+    def finalize(self, outcome: Dict, watch=NULL_STOPWATCH) -> Dict:
+        """
+        Buy plan + evidence for a scored, eligible outcome.
+        """
+        context = outcome.pop("context")
+
+        buy_plan = self.buy_plan_generator.generate({
+            "snapshot": context.pop("snapshot"),
+            "setups": context["setups"],
+            "trend": context["trend"]
+        })
+
+        watch.lap("buy_plan")
+
+        context["buy_plan"] = buy_plan
+
+        evidence = self.evidence_builder.build(context)
+        watch.lap("evidence")
+
+        outcome.pop("deferred", None)
+        outcome["buy_plan"] = buy_plan
+        outcome["evidence"] = evidence
+
+        return outcome
+
+    def score_only(self, outcome: Dict) -> Dict:
+        """
+        Drops a deferred outcome's context and attaches the
+        compact score-only record logged for it instead.
+        """
+        context = outcome.pop("context")
+        outcome["evidence"] = self.evidence_builder.build_score_only(
+            outcome["symbol"], context["score"]
+        )
+        return outcome
+
+    @staticmethod
+    def log_record(outcome: Dict) -> Optional[Dict]:
+        """
+        What to write to the evidence log for an outcome: full
+        evidence when eligible, the compact record for recorded
+        early rejections, otherwise nothing.
+        """
+        if outcome.get("deferred"):
+            return None
+        if outcome["eligible"] or outcome.get("rejected_at"):
+            return outcome.get("evidence")
+        return None
+
+    def _rejected(
+        self,
+        symbol: str,
+        blocking_reasons: List[str],
+        rejected_at: str,
+        watch
+    ) -> Dict:
+        outcome = {
+            "symbol": symbol,
+            "eligible": False,
+            "blocking_reasons": blocking_reasons,
+            "rejected_at": rejected_at,
+            "timings": watch.timings
+        }
+
+        if self.eligibility_engine.record_rejections:
+            outcome["evidence"] = self.evidence_builder.build_rejection(
+                symbol, blocking_reasons, rejected_at
+            )
+
+        return outcome
+
+    def _relative_strength(
+        self,
+        symbol: str,
+        df: pd.DataFrame,
+        run_context: Dict
+    ) -> Optional[Dict]:
+        """
+        Ranked universe-wide in batch mode; otherwise excess
+        returns against the market index frame, if there is one.
+        """
+        status = run_context.get("relative_strength", {}).get(symbol)
+        if status is not None:
+            return status
+
+        index_df = run_context.get("market_index")
+        if self.relative_strength_engine is None or index_df is None:
+            return None
+
+        return self.relative_strength_engine.for_symbol(df, index_df)
@@ -0,0 +1,49 @@
+import heapq
+from typing import Dict, List, Optional
+
+
+class TopKSelector:
+    """
+    Bounded min-heap of the K best eligible outcomes seen so far.
+
+    Ties keep the earlier symbol (universe order), matching the
+    stable sort used for full rankings.
+    """
+
+    def __init__(self, k: int):
+        if k < 1:
+            raise ValueError("top_k must be at least 1")
+
+        self.k = k
+        self._heap = []
+        self._seen = 0
+
+    def push(self, outcome: Dict) -> Optional[Dict]:
+        """
+        Offers an outcome; returns the eligible outcome that fell
+        out of the top K (possibly this one), or None.
+        """
+        if not outcome["eligible"]:
+            return None
+
+        # Later arrivals rank lower on equal scores
+        entry = (outcome["score"], -self._seen, outcome)
+        self._seen += 1
+
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+            return None
+
+        return heapq.heappushpop(self._heap, entry)[2]
+
+    def ranked(self) -> List[Dict]:
+        """
+        Kept outcomes, best first.
+        """
+        return [
+            entry[2]
+            for entry in sorted(self._heap, key=lambda e: (e[0], e[1]), reverse=True)
+        ]
+
+    def __len__(self):
+        return len(self._heap)
@@ -0,0 +1,119 @@
+from typing import Any, NamedTuple, Optional, Union
+import numpy as np
+import pandas as pd
+
+
+class Bar(NamedTuple):
+    """
+    One OHLCV + indicator row. Columns missing from the
+    source frame are None, so `get` behaves like Series.get.
+    """
+
+    date: Any = None
+    open: Any = None
+    high: Any = None
+    low: Any = None
+    close: Any = None
+    volume: Any = None
+    ema_20: Any = None
+    ema_50: Any = None
+    ema_200: Any = None
+    rsi_14: Any = None
+    atr_14: Any = None
+    bb_middle: Any = None
+    bb_upper: Any = None
+    bb_lower: Any = None
+    vol_avg_20: Any = None
+
+    def get(self, name: str, default=None):
+        value = getattr(self, name, None)
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+
+class BarSnapshot(NamedTuple):
+    """
+    What the per-symbol stages need from an indicator frame,
+    extracted once: the last two bars, the highest high of the
+    20 bars before the latest one and the lowest low of the
+    last 5 bars.
+    """
+
+    latest: Bar
+    prev: Optional[Bar]
+    range_high_20: Any
+    low_5: Any
+    length: int
+
+    @classmethod
+    def of(cls, data: Union["BarSnapshot", pd.DataFrame]) -> "BarSnapshot":
+        """
+        Pass-through for snapshots, so components accept either.
+        """
+        if isinstance(data, BarSnapshot):
+            return data
+        return cls.from_frame(data)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "BarSnapshot":
+        fields = [name for name in Bar._fields[1:] if name in df.columns]
+        positions = [df.columns.get_loc(name) for name in fields]
+
+        block = df.iloc[-21:, positions].to_numpy(dtype=np.float64)
+
+        dates = []
+        if "date" in df.columns:
+            # Timestamps (not datetime64) so str(date) matches iloc access
+            col = df.columns.get_loc("date")
+            dates = [df.iat[i, col] for i in range(-min(len(df), 2), 0)]
+
+        return cls.from_arrays(dates, block, fields, len(df))
+
+    @classmethod
+    def from_arrays(
+        cls,
+        dates,
+        block: np.ndarray,
+        fields,
+        length: int
+    ) -> "BarSnapshot":
+        """
+        `block` holds the last (up to 21) rows x `fields`;
+        `dates` the dates of the last one or two of those rows.
+        """
+        columns = {
+            name: block[:, k]
+            for k, name in enumerate(fields)
+            if name in Bar._fields
+        }
+
+        def bar(i):
+            values = {name: col[i] for name, col in columns.items()}
+            if dates:
+                values["date"] = dates[i]
+            return Bar(**values)
+
+        high = columns.get("high", np.empty(0))
+        low = columns.get("low", np.empty(0))
+
+        return cls(
+            latest=bar(-1),
+            prev=bar(-2) if length > 1 else None,
+            range_high_20=cls._nan_max(high[-21:-1]),
+            low_5=cls._nan_min(low[-5:]),
+            length=length
+        )
+
+    @staticmethod
+    def _nan_max(values: np.ndarray):
+        values = values[~np.isnan(values)]
+        return values.max() if len(values) else np.nan
+
+    @staticmethod
+    def _nan_min(values: np.ndarray):
+        values = values[~np.isnan(values)]
+        return values.min() if len(values) else np.nan
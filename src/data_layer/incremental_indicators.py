@@ -0,0 +1,243 @@
+import json
+import math
+from collections import deque
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class SymbolIndicatorState:
+    """
+    Running indicator state for one symbol.
+    """
+    last_date: Optional[str] = None
+    bars: int = 0
+    prev_close: Optional[float] = None
+    ema: Dict[str, float] = field(default_factory=dict)
+    gain_ema: Optional[float] = None
+    loss_ema: Optional[float] = None
+    atr: Optional[float] = None
+    closes: List[float] = field(default_factory=list)
+    volumes: List[float] = field(default_factory=list)
+
+
+class IncrementalIndicatorEngine:
+    """
+    Streaming counterpart of IndicatorEngine.
+
+    Keeps per-symbol running state so each new bar updates
+    EMA, RSI, ATR, Bollinger bands and volume average in
+    constant time. Uses the same recursions as the batch
+    path, so results match IndicatorEngine.compute.
+    """
+
+    def __init__(
+        self,
+        ema_periods=(20, 50, 200),
+        rsi_period=14,
+        atr_period=14,
+        bb_period=20,
+        bb_std=2,
+        vol_avg_period=20
+    ):
+        self.ema_periods = tuple(ema_periods)
+        self.rsi_period = rsi_period
+        self.atr_period = atr_period
+        self.bb_period = bb_period
+        self.bb_std = bb_std
+        self.vol_avg_period = vol_avg_period
+
+        self.states: Dict[str, SymbolIndicatorState] = {}
+        self._windows: Dict[str, Dict[str, deque]] = {}
+
+    # -------------------------------
+    # Public API
+    # -------------------------------
+
+    def seed(self, symbol: str, df: pd.DataFrame) -> Dict:
+        """
+        Replays a historical OHLCV frame to build the state.
+        Returns the indicator values of its last bar.
+        """
+        self.reset(symbol)
+
+        latest = {}
+        for bar in df.sort_values("date").to_dict("records"):
+            latest = self.update(symbol, bar)
+
+        return latest
+
+    def update(self, symbol: str, bar: Dict) -> Dict:
+        """
+        Applies one new bar (date, open, high, low, close, volume)
+        and returns the bar enriched with indicator values.
+        """
+        state = self.states.get(symbol)
+        if state is None:
+            state = self.reset(symbol)
+
+        bar_date = str(pd.Timestamp(bar["date"]))
+        if state.last_date is not None and bar_date <= state.last_date:
+            raise ValueError(
+                f"{symbol}: bar {bar_date} is not after {state.last_date}"
+            )
+
+        close = float(bar["close"])
+        high = float(bar["high"])
+        low = float(bar["low"])
+        volume = float(bar["volume"])
+
+        first = state.bars == 0
+
+        # EMA
+        for period in self.ema_periods:
+            key = str(period)
+            state.ema[key] = self._ewm_step(
+                state.ema.get(key), close, period
+            )
+
+        # RSI (same span-based smoothing as the batch path)
+        if first:
+            gain = loss = 0.0
+        else:
+            delta = close - state.prev_close
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+
+        state.gain_ema = self._ewm_step(state.gain_ema, gain, self.rsi_period)
+        state.loss_ema = self._ewm_step(state.loss_ema, loss, self.rsi_period)
+
+        # ATR
+        if first:
+            tr = high - low
+        else:
+            tr = max(
+                high - low,
+                abs(high - state.prev_close),
+                abs(low - state.prev_close)
+            )
+
+        state.atr = self._ewm_step(state.atr, tr, self.atr_period)
+
+        # Rolling windows
+        windows = self._windows[symbol]
+        windows["closes"].append(close)
+        windows["volumes"].append(volume)
+
+        state.prev_close = close
+        state.last_date = bar_date
+        state.bars += 1
+
+        return {**bar, **self._values(symbol)}
+
+    def reset(self, symbol: str) -> SymbolIndicatorState:
+        state = SymbolIndicatorState()
+        self.states[symbol] = state
+        self._windows[symbol] = {
+            "closes": deque(maxlen=self.bb_period),
+            "volumes": deque(maxlen=self.vol_avg_period)
+        }
+        return state
+
+    # -------------------------------
+    # Persistence
+    # -------------------------------
+
+    def to_dict(self) -> Dict:
+        for symbol, windows in self._windows.items():
+            self.states[symbol].closes = list(windows["closes"])
+            self.states[symbol].volumes = list(windows["volumes"])
+
+        return {
+            "params": {
+                "ema_periods": list(self.ema_periods),
+                "rsi_period": self.rsi_period,
+                "atr_period": self.atr_period,
+                "bb_period": self.bb_period,
+                "bb_std": self.bb_std,
+                "vol_avg_period": self.vol_avg_period
+            },
+            "symbols": {
+                symbol: asdict(state)
+                for symbol, state in self.states.items()
+            }
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict) -> "IncrementalIndicatorEngine":
+        engine = cls(**payload["params"])
+
+        for symbol, raw in payload["symbols"].items():
+            engine.reset(symbol)
+            state = SymbolIndicatorState(**raw)
+            engine.states[symbol] = state
+            engine._windows[symbol]["closes"].extend(state.closes)
+            engine._windows[symbol]["volumes"].extend(state.volumes)
+
+        return engine
+
+    def save(self, path: str):
+        with open(Path(path), "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> "IncrementalIndicatorEngine":
+        with open(Path(path), "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    # -------------------------------
+    # Internal helpers
+    # -------------------------------
+
+    def _values(self, symbol: str) -> Dict:
+        state = self.states[symbol]
+        windows = self._windows[symbol]
+
+        values = {
+            f"ema_{period}": state.ema[str(period)]
+            for period in self.ema_periods
+        }
+
+        values["rsi_14"] = self._rsi(state.gain_ema, state.loss_ema)
+        values["atr_14"] = state.atr
+
+        closes = windows["closes"]
+        if len(closes) == self.bb_period:
+            window = np.fromiter(closes, dtype=np.float64)
+            mid = window.mean()
+            std = window.std(ddof=1)
+        else:
+            mid = std = math.nan
+
+        values["bb_middle"] = mid
+        values["bb_upper"] = mid + self.bb_std * std
+        values["bb_lower"] = mid - self.bb_std * std
+
+        volumes = windows["volumes"]
+        values["vol_avg_20"] = (
+            np.fromiter(volumes, dtype=np.float64).mean()
+            if len(volumes) == self.vol_avg_period else math.nan
+        )
+
+        return values
+
+    @staticmethod
+    def _ewm_step(previous: Optional[float], value: float, span: int) -> float:
+        # Mirrors pandas ewm(span, adjust=False)
+        if previous is None:
+            return value
+
+        alpha = 2 / (span + 1)
+        old_wt = 1 - alpha
+        return (old_wt * previous + alpha * value) / (old_wt + alpha)
+
+    @staticmethod
+    def _rsi(gain_ema: float, loss_ema: float) -> float:
+        if loss_ema == 0:
+            return math.nan if gain_ema == 0 else 100.0
+
+        rs = gain_ema / loss_ema
+        return 100 - (100 / (1 + rs))
@@ -2,6 +2,8 @@ import pandas as pd
 import numpy as np
 from typing import Dict
 
+from .indicator_panel import IndicatorPanel
+
 
 class IndicatorEngine:
     """
@@ -45,6 +47,155 @@ class IndicatorEngine:
 
         return enriched
 
+    # -------------------------------
+    # Panel mode (whole universe)
+    # -------------------------------
+
+    OHLCV_FIELDS = ["open", "high", "low", "close", "volume"]
+
+    def compute_panel(
+        self,
+        ohlcv_data: Dict[str, pd.DataFrame]
+    ) -> IndicatorPanel:
+        """
+        Computes all indicators for the whole universe at once on
+        date-by-symbol matrices. Numerically equivalent to `compute`.
+        """
+
+        wide = self._align(ohlcv_data)
+        close = wide["close"]
+        valid = close.notna()
+
+        # Symbols with missing sessions inside their history need
+        # their rolling windows computed over their own bars only.
+        gap_cols = self._gap_columns(valid)
+
+        out = dict(wide)
+
+        for period in self.ema_periods:
+            out[f"ema_{period}"] = self._ewm(close, period)
+
+        prev_close = close.ffill().shift(1)
+        delta = close - prev_close
+
+        gain = delta.where(delta > 0, 0.0).where(valid)
+        loss = (-delta).where(delta < 0, 0.0).where(valid)
+
+        rs = self._ewm(gain, self.rsi_period) / self._ewm(loss, self.rsi_period)
+        out["rsi_14"] = 100 - (100 / (1 + rs))
+
+        tr = np.fmax(
+            wide["high"] - wide["low"],
+            np.fmax(
+                (wide["high"] - prev_close).abs(),
+                (wide["low"] - prev_close).abs()
+            )
+        )
+        out["atr_14"] = self._ewm(tr.where(valid), self.atr_period)
+
+        mid = self._rolling(close, self.bb_period, "mean", gap_cols)
+        std = self._rolling(close, self.bb_period, "std", gap_cols)
+
+        out["bb_middle"] = mid
+        out["bb_upper"] = mid + self.bb_std * std
+        out["bb_lower"] = mid - self.bb_std * std
+
+        out["vol_avg_20"] = self._rolling(
+            wide["volume"], self.vol_avg_period, "mean", gap_cols
+        )
+
+        fields = list(out)
+        values = np.stack(
+            [out[f].where(valid).to_numpy(dtype=np.float64).T for f in fields],
+            axis=-1
+        )
+
+        return IndicatorPanel(
+            dates=close.index,
+            symbols=list(close.columns),
+            fields=fields,
+            values=values
+        )
+
+    def _align(
+        self,
+        ohlcv_data: Dict[str, pd.DataFrame]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Aligns per-symbol frames into one date-by-symbol
+        frame per OHLCV field.
+        """
+
+        symbols = list(ohlcv_data)
+        stamps = [
+            pd.DatetimeIndex(df["date"]).as_unit("ns")
+            for df in ohlcv_data.values()
+        ]
+
+        if stamps:
+            keys = np.unique(np.concatenate([d.asi8 for d in stamps]))
+            dates = pd.DatetimeIndex(keys.view("datetime64[ns]"))
+            if stamps[0].tz is not None:
+                dates = dates.tz_localize("UTC").tz_convert(stamps[0].tz)
+        else:
+            keys = np.array([], dtype=np.int64)
+            dates = pd.DatetimeIndex([])
+
+        # Fill one (field, date, symbol) block directly so each wide
+        # frame below is a single contiguous block, not one per symbol.
+        # Duplicate dates within a symbol resolve to the last bar.
+        values = np.full(
+            (len(self.OHLCV_FIELDS), len(dates), len(symbols)),
+            np.nan
+        )
+
+        for j, (df, stamp) in enumerate(zip(ohlcv_data.values(), stamps)):
+            rows = np.searchsorted(keys, stamp.asi8)
+            for k, field in enumerate(self.OHLCV_FIELDS):
+                values[k, rows, j] = df[field].to_numpy(dtype=np.float64)
+
+        return {
+            field: pd.DataFrame(
+                values[k], index=dates, columns=symbols, copy=False
+            )
+            for k, field in enumerate(self.OHLCV_FIELDS)
+        }
+
+    @staticmethod
+    def _gap_columns(valid: pd.DataFrame):
+        mask = valid.to_numpy()
+        if not mask.size:
+            return []
+
+        first = mask.argmax(axis=0)
+        last = len(mask) - mask[::-1].argmax(axis=0)
+        span = np.where(mask.any(axis=0), last - first, 0)
+
+        return list(valid.columns[mask.sum(axis=0) < span])
+
+    @staticmethod
+    def _ewm(frame: pd.DataFrame, period: int) -> pd.DataFrame:
+        # ignore_na skips missing sessions exactly like the
+        # per-symbol path, where those rows simply don't exist
+        return frame.ewm(span=period, adjust=False, ignore_na=True).mean()
+
+    @staticmethod
+    def _rolling(
+        frame: pd.DataFrame,
+        window: int,
+        how: str,
+        gap_cols
+    ) -> pd.DataFrame:
+        result = getattr(frame.rolling(window), how)()
+
+        for col in gap_cols:
+            series = frame[col].dropna()
+            result[col] = getattr(series.rolling(window), how)().reindex(
+                frame.index
+            )
+
+        return result
+
     # -------------------------------
     # Indicator implementations
     # -------------------------------
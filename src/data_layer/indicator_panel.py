@@ -0,0 +1,148 @@
+from collections.abc import Mapping
+from typing import Dict, List
+import numpy as np
+import pandas as pd
+
+from .bar_snapshot import BarSnapshot
+
+
+class IndicatorPanel(Mapping):
+    """
+    Universe-wide OHLCV + indicator matrices.
+
+    Values are stored as one float64 array shaped
+    (symbol, date, field), so each symbol's block is contiguous
+    and per-symbol DataFrames are built as views over it.
+
+    Behaves like the Dict[str, DataFrame] returned by
+    IndicatorEngine.compute, so existing consumers work unchanged.
+    """
+
+    def __init__(
+        self,
+        dates: pd.DatetimeIndex,
+        symbols: List[str],
+        fields: List[str],
+        values: np.ndarray
+    ):
+        self.dates = dates
+        self.symbols = list(symbols)
+        self.fields = list(fields)
+        self.values = values
+
+        self._index = {s: i for i, s in enumerate(self.symbols)}
+        self._field_index = {f: i for i, f in enumerate(self.fields)}
+        self._frames: Dict[str, pd.DataFrame] = {}
+
+        self._init_bounds()
+
+    # -------------------------------
+    # Matrix access
+    # -------------------------------
+
+    def matrix(self, field: str) -> np.ndarray:
+        """
+        Date-by-symbol matrix (view) for one field.
+        """
+        return self.values[:, :, self._field_index[field]].T
+
+    def wide(self, field: str) -> pd.DataFrame:
+        return pd.DataFrame(
+            self.matrix(field),
+            index=self.dates,
+            columns=self.symbols,
+            copy=False
+        )
+
+    def last_valid(self, field: str) -> np.ndarray:
+        """
+        Value of `field` on each symbol's last bar.
+        """
+        k = self._field_index[field]
+        rows = self.bounds[:, 1] - 1
+        out = self.values[np.arange(len(self.symbols)), rows, k]
+        return np.where(self.bounds[:, 1] > 0, out, np.nan)
+
+    def snapshot(self, symbol: str) -> BarSnapshot:
+        """
+        Latest-bar snapshot read straight from the value array,
+        without building the symbol's frame.
+        """
+        i = self._index[symbol]
+        if self.has_gaps[i]:
+            return BarSnapshot.from_frame(self[symbol])
+
+        start, end = self.bounds[i]
+        first = max(start, end - 21)
+
+        return BarSnapshot.from_arrays(
+            [self.dates[k] for k in range(max(start, end - 2), end)],
+            self.values[i, first:end],
+            self.fields,
+            int(end - start)
+        )
+
+    # -------------------------------
+    # Mapping interface
+    # -------------------------------
+
+    def __getitem__(self, symbol: str) -> pd.DataFrame:
+        if symbol not in self:
+            raise KeyError(symbol)
+
+        if symbol not in self._frames:
+            self._frames[symbol] = self._build_frame(self._index[symbol])
+        return self._frames[symbol]
+
+    def __iter__(self):
+        return (s for s in self.symbols if self.bounds[self._index[s], 1] > 0)
+
+    def __len__(self):
+        return int((self.bounds[:, 1] > 0).sum())
+
+    def __contains__(self, symbol) -> bool:
+        i = self._index.get(symbol)
+        return i is not None and self.bounds[i, 1] > 0
+
+    # -------------------------------
+    # Internal helpers
+    # -------------------------------
+
+    def _init_bounds(self):
+        """
+        Per symbol [first, last + 1) row range of valid closes,
+        and whether there are missing sessions inside it.
+        """
+        n_dates = len(self.dates)
+
+        if not self.symbols or not n_dates:
+            self.bounds = np.zeros((len(self.symbols), 2), dtype=np.int64)
+            self.has_gaps = np.zeros(len(self.symbols), dtype=bool)
+            return
+
+        valid = ~np.isnan(self.matrix("close"))
+        any_valid = valid.any(axis=0)
+
+        first = valid.argmax(axis=0)
+        last = n_dates - valid[::-1].argmax(axis=0)
+
+        first = np.where(any_valid, first, 0)
+        last = np.where(any_valid, last, 0)
+
+        self.bounds = np.stack([first, last], axis=1)
+        self.has_gaps = valid.sum(axis=0) < (last - first)
+
+    def _build_frame(self, i: int) -> pd.DataFrame:
+        start, end = self.bounds[i]
+
+        df = pd.DataFrame(
+            self.values[i, start:end],
+            columns=self.fields,
+            copy=False
+        )
+        df.insert(0, "date", self.dates[start:end])
+
+        if self.has_gaps[i]:
+            df = df[df["close"].notna()].reset_index(drop=True)
+
+        return df
@@ -1,42 +1,174 @@
-import json
+from collections import defaultdict
+from datetime import date
+from functools import cached_property
 from pathlib import Path
 from typing import Dict
 
-from .providers.yahoo_provider import YahooFinanceProvider
-from .providers.shoonya_provider import ShoonyaProvider
+import pandas as pd
+from src.core.config_loader import load_config
+
+from .ohlcv_cache import OHLCVCache
 
 
 class MarketDataLoader:
 
+    PROVIDERS = ("yahoo", "shoonya", "synthetic")
+
     def __init__(self, config_path: str, shoonya_client=None):
         self.config = self._load_config(config_path)
         self.provider_name = self.config["provider"]
         self.shoonya_client = shoonya_client
 
-        self.provider = self._init_provider()
+        if self.provider_name not in self.PROVIDERS:
+            raise ValueError(f"Unknown market data provider: {self.provider_name}")
+        if self.provider_name == "shoonya" and not shoonya_client:
+            raise ValueError("Shoonya client required for shoonya provider")
+
+        self.cache = self._init_cache()
 
-    def fetch(self, symbols, lookback_days=None) -> Dict:
+    @cached_property
+    def provider(self):
+        """
+        Built on the first fetch that needs it, so runs served
+        from a fresh cache never import the provider module.
+        """
+        return self._init_provider()
+
+    def fetch(self, symbols, lookback_days=None, refresh=False) -> Dict:
         if lookback_days is None:
             lookback_days = self.config["defaults"]["lookback_days"]
 
-        return self.provider.fetch_ohlcv(symbols, lookback_days)
+        if self.cache is None:
+            return self.provider.fetch_ohlcv(symbols, lookback_days)
+
+        return self._fetch_cached(symbols, lookback_days, refresh)
+
+    # -------------------------------
+    # Cache-backed incremental fetch
+    # -------------------------------
+
+    def _fetch_cached(self, symbols, lookback_days, refresh) -> Dict:
+        cache_cfg = self.config["cache"]
+        max_age_hours = cache_cfg.get("max_age_hours", 12)
+        overlap_days = cache_cfg.get("overlap_days", 3)
+        # Calendar days a cached history may start after the window
+        # start and still count as complete: the first bar falls on
+        # the first session, after any weekend or holidays
+        history_slack_days = cache_cfg.get("history_slack_days", 7)
+
+        today = date.today()
+        data = {}
+
+        # Symbols grouped by how many days they still need, so each
+        # group is one provider call (keeps bulk/concurrent modes).
+        pending = defaultdict(list)
+
+        for symbol in symbols:
+            cached = None if refresh else self.cache.load(symbol)
+
+            if cached is None or cached.empty:
+                pending[lookback_days].append(symbol)
+                continue
+
+            data[symbol] = cached
+
+            first_day = self._day(cached["date"].iloc[0])
+            last_day = self._day(cached["date"].iloc[-1])
+
+            # History too short for the requested window: refetch it all
+            if (today - first_day).days < lookback_days - history_slack_days:
+                pending[lookback_days].append(symbol)
+                continue
+
+            if self.cache.age_hours(symbol) < max_age_hours:
+                continue
+
+            missing_days = (today - last_day).days + overlap_days
+            pending[min(missing_days, lookback_days)].append(symbol)
+
+        for days, group in pending.items():
+            fetched = self.provider.fetch_ohlcv(group, days)
+
+            for symbol, fresh in fetched.items():
+                merged = OHLCVCache.merge(data.get(symbol), fresh)
+                self.cache.save(symbol, merged)
+                data[symbol] = merged
+
+        return {
+            symbol: self._trim(data[symbol], lookback_days)
+            for symbol in symbols
+            if symbol in data
+        }
+
+    @staticmethod
+    def _day(value) -> date:
+        return pd.Timestamp(value).date()
+
+    @staticmethod
+    def _trim(df: pd.DataFrame, lookback_days: int) -> pd.DataFrame:
+        cutoff = df["date"].iloc[-1] - pd.Timedelta(days=lookback_days)
+        return df[df["date"] > cutoff].reset_index(drop=True)
+
+    def _init_cache(self):
+        cache_cfg = self.config.get("cache", {})
+        if not cache_cfg.get("enabled", False):
+            return None
+
+        timeframe = self.config["defaults"]["timeframe"]
+        base_path = Path(cache_cfg.get("path", "data/ohlcv_cache"))
+
+        return OHLCVCache(
+            base_path / self.provider_name / timeframe,
+            fmt=cache_cfg.get("format", "parquet")
+        )
+
+    @property
+    def failed_symbols(self) -> Dict[str, str]:
+        """
+        Symbols the provider could not fetch in the last call.
+        """
+        # Never built: nothing was fetched
+        provider = self.__dict__.get("provider")
+        return getattr(provider, "failed_symbols", {})
 
     def _init_provider(self):
+        # Provider modules (and yfinance) are imported only when selected
         if self.provider_name == "yahoo":
+            from .providers.yahoo_provider import YahooFinanceProvider
+
             yahoo_cfg = self.config.get("yahoo", {})
             return YahooFinanceProvider(
                 interval=yahoo_cfg.get("interval", "1d"),
-                exchange_suffix=yahoo_cfg.get("exchange_suffix", ".NS")
+                exchange_suffix=yahoo_cfg.get("exchange_suffix", ".NS"),
+                bulk=yahoo_cfg.get("bulk", False),
+                chunk_size=yahoo_cfg.get("chunk_size", 100)
             )
 
         if self.provider_name == "shoonya":
-            if not self.shoonya_client:
-                raise ValueError("Shoonya client required for shoonya provider")
-            return ShoonyaProvider(self.shoonya_client)
+            from .providers.shoonya_provider import ShoonyaProvider
+
+            shoonya_cfg = self.config.get("shoonya", {})
+            return ShoonyaProvider(
+                self.shoonya_client,
+                max_workers=shoonya_cfg.get("max_workers", 8),
+                requests_per_second=shoonya_cfg.get("requests_per_second", 10),
+                burst=shoonya_cfg.get("burst", 10),
+                max_retries=shoonya_cfg.get("max_retries", 3),
+                backoff_seconds=shoonya_cfg.get("backoff_seconds", 0.5),
+                index_symbols=shoonya_cfg.get("index_symbols")
+            )
+
+        if self.provider_name == "synthetic":
+            from .providers.synthetic_provider import SyntheticDataProvider
+
+            synthetic_cfg = self.config.get("synthetic", {})
+            return SyntheticDataProvider(
+                days=synthetic_cfg.get("days"),
+                seed=synthetic_cfg.get("seed", 0)
+            )
 
         raise ValueError(f"Unknown market data provider: {self.provider_name}")
 
     @staticmethod
     def _load_config(path: str) -> dict:
-        with open(Path(path), "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_config(path)
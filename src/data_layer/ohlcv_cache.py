@@ -0,0 +1,74 @@
+import os
+import time
+from pathlib import Path
+from typing import Optional
+import pandas as pd
+
+
+class OHLCVCache:
+    """
+    On-disk columnar OHLCV store.
+    One Parquet (or Feather) file per symbol.
+    """
+
+    FORMATS = {"parquet": ".parquet", "feather": ".feather"}
+
+    def __init__(self, base_path: str, fmt: str = "parquet"):
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown cache format: {fmt}")
+
+        self.base_path = Path(base_path)
+        self.fmt = fmt
+        self.base_path.mkdir(parents=True, exist_ok=True)
+
+    def path(self, symbol: str) -> Path:
+        return self.base_path / f"{symbol}{self.FORMATS[self.fmt]}"
+
+    def load(self, symbol: str) -> Optional[pd.DataFrame]:
+        path = self.path(symbol)
+        if not path.exists():
+            return None
+
+        if self.fmt == "parquet":
+            return pd.read_parquet(path)
+        return pd.read_feather(path)
+
+    def save(self, symbol: str, df: pd.DataFrame):
+        path = self.path(symbol)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+
+        df = df.reset_index(drop=True)
+        if self.fmt == "parquet":
+            df.to_parquet(tmp, index=False)
+        else:
+            df.to_feather(tmp)
+
+        # Atomic swap so readers never see a half-written partition
+        os.replace(tmp, path)
+
+    def age_hours(self, symbol: str) -> Optional[float]:
+        path = self.path(symbol)
+        if not path.exists():
+            return None
+
+        return (time.time() - path.stat().st_mtime) / 3600
+
+    @staticmethod
+    def merge(
+        cached: Optional[pd.DataFrame],
+        fresh: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Appends freshly fetched bars, keeping the fresh copy
+        of any date present in both.
+        """
+        if cached is None or cached.empty:
+            merged = fresh
+        else:
+            merged = pd.concat([cached, fresh], ignore_index=True)
+
+        return (
+            merged.drop_duplicates(subset="date", keep="last")
+                  .sort_values("date")
+                  .reset_index(drop=True)
+        )
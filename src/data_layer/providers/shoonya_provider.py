@@ -1,12 +1,45 @@
+import time
 import pandas as pd
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
 from .base_provider import MarketDataProvider
+from .rate_limiter import TokenBucket
 
 
 class ShoonyaProvider(MarketDataProvider):
 
-    def __init__(self, client):
+    # Yahoo-style index symbols -> Shoonya NSE index names
+    INDEX_SYMBOLS = {
+        "^NSEI": "Nifty 50",
+        "^NSEBANK": "Nifty Bank",
+        "^CNXIT": "Nifty IT",
+        "^CNXENERGY": "Nifty Energy",
+        "^CNXPHARMA": "Nifty Pharma",
+        "^CNXFMCG": "Nifty FMCG"
+    }
+
+    def __init__(
+        self,
+        client,
+        max_workers=8,
+        requests_per_second=10,
+        burst=10,
+        max_retries=3,
+        backoff_seconds=0.5,
+        index_symbols: Optional[Dict[str, str]] = None
+    ):
         self.client = client
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.index_symbols = {**self.INDEX_SYMBOLS, **(index_symbols or {})}
+
+        self.rate_limiter = TokenBucket(requests_per_second, burst)
+
+        # Symbols that could not be fetched in the last call
+        # mapped to the reason ("NO_DATA", "UNKNOWN_INDEX" or
+        # the last error).
+        self.failed_symbols: Dict[str, str] = {}
 
     def fetch_ohlcv(
         self,
@@ -14,32 +47,90 @@ class ShoonyaProvider(MarketDataProvider):
         lookback_days: int
     ) -> Dict[str, pd.DataFrame]:
 
-        data = {}
+        self.failed_symbols = {}
 
-        for symbol in symbols:
-            candles = self.client.get_time_price_series(
-                exchange="NSE",
-                symbol=symbol,
-                interval="1d",
-                days=lookback_days
+        # Shares the single NorenApi session across worker threads
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            frames = list(
+                pool.map(
+                    lambda s: self._fetch_symbol(s, lookback_days),
+                    symbols
+                )
             )
 
-            if not candles:
+        return {
+            symbol: df
+            for symbol, df in zip(symbols, frames)
+            if df is not None
+        }
+
+    # -------------------------------
+    # Per-symbol fetch with retries
+    # -------------------------------
+
+    def _fetch_symbol(
+        self,
+        symbol: str,
+        lookback_days: int
+    ) -> Optional[pd.DataFrame]:
+
+        name = self._instrument(symbol)
+        if name is None:
+            self.failed_symbols[symbol] = "UNKNOWN_INDEX"
+            return None
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(self.backoff_seconds * 2 ** (attempt - 1))
+
+            self.rate_limiter.acquire()
+
+            try:
+                candles = self.client.get_time_price_series(
+                    exchange="NSE",
+                    symbol=name,
+                    interval="1d",
+                    days=lookback_days
+                )
+            except Exception as e:
+                reason = f"{type(e).__name__}: {e}"
+                continue
+
+            # API errors come back as a {"stat": "Not_Ok"} payload
+            if isinstance(candles, dict):
+                reason = f"API_ERROR: {candles.get('emsg', candles.get('stat'))}"
                 continue
 
-            df = pd.DataFrame(candles)
-            df = df.rename(columns={
-                "time": "date",
-                "into": "open",
-                "inth": "high",
-                "intl": "low",
-                "intc": "close",
-                "intv": "volume"
-            })
+            # An empty series is a definitive answer, not worth retrying
+            if not candles:
+                reason = "NO_DATA"
+                break
+
+            return self._to_frame(candles)
+
+        self.failed_symbols[symbol] = reason
+        return None
+
+    def _instrument(self, symbol: str) -> Optional[str]:
+        # Index symbols (^NSEI, ^CNXIT, ...) map to Shoonya index
+        # names; None when the index is not known
+        if symbol.startswith("^"):
+            return self.index_symbols.get(symbol)
+        return symbol
 
-            df["date"] = pd.to_datetime(df["date"])
-            df = df[["date", "open", "high", "low", "close", "volume"]]
+    @staticmethod
+    def _to_frame(candles) -> pd.DataFrame:
+        df = pd.DataFrame(candles)
+        df = df.rename(columns={
+            "time": "date",
+            "into": "open",
+            "inth": "high",
+            "intl": "low",
+            "intc": "close",
+            "intv": "volume"
+        })
 
-            data[symbol] = df
+        df["date"] = pd.to_datetime(df["date"])
+        df = df[["date", "open", "high", "low", "close", "volume"]]
 
-        return data
+        return df
@@ -0,0 +1,152 @@
+from functools import lru_cache
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+from .base_provider import MarketDataProvider
+
+
+SCENARIOS = ("none", "breakout", "pullback", "reversal")
+
+
+def generate_synthetic_ohlcv(
+    symbols: List[str],
+    days: int,
+    seed: int = 0,
+    end: str = "2024-12-31",
+    scenario_mix=(0.7, 0.15, 0.075, 0.075)
+) -> Dict[str, pd.DataFrame]:
+    """
+    Deterministic synthetic daily OHLCV for a universe.
+
+    Each symbol gets an up, flat or down drift, random breakout
+    days with volume spikes, and one of SCENARIOS shaped into
+    its final bars so breakout, pullback and RSI-reversal
+    setups actually fire on the last bar.
+    """
+
+    rng = np.random.default_rng(seed)
+    n = len(symbols)
+
+    drift = rng.choice([0.0015, 0.0, -0.0012], size=n, p=[0.6, 0.25, 0.15])
+    sigma = rng.uniform(0.01, 0.022, size=n)
+    base_price = rng.uniform(50, 3000, size=n)
+    base_volume = rng.uniform(3e5, 5e6, size=n)
+    scenario = rng.choice(len(SCENARIOS), size=n, p=scenario_mix)
+
+    # Scenarios need an uptrend to be meaningful
+    drift = np.where(scenario > 0, 0.002, drift)
+
+    returns = drift + sigma * rng.standard_normal((days, n))
+    volume = base_volume * rng.lognormal(0, 0.25, (days, n))
+
+    # Random breakout days: gap up on heavy volume
+    jumps = rng.random((days, n)) < 0.02
+    returns = np.where(jumps, returns + 3 * sigma, returns)
+    volume = np.where(jumps, volume * 2.5, volume)
+
+    _shape_pullbacks(returns, volume, scenario == 2, sigma)
+    _shape_reversals(returns, volume, scenario == 3, sigma)
+
+    close = base_price * np.exp(np.cumsum(returns, axis=0))
+    open_, high, low = _bars_from_close(close, sigma, rng)
+
+    _shape_breakouts(close, open_, high, low, volume, scenario == 1)
+
+    dates = _business_days(end, days)
+
+    return {
+        symbol: pd.DataFrame({
+            "date": dates,
+            "open": open_[:, j],
+            "high": high[:, j],
+            "low": low[:, j],
+            "close": close[:, j],
+            "volume": np.round(volume[:, j])
+        })
+        for j, symbol in enumerate(symbols)
+    }
+
+
+@lru_cache(maxsize=8)
+def _business_days(end: str, days: int) -> pd.DatetimeIndex:
+    return pd.bdate_range(end=end, periods=days)
+
+
+def _bars_from_close(close, sigma, rng):
+    prev = np.vstack([close[:1], close[:-1]])
+    open_ = prev * (1 + 0.3 * sigma * rng.standard_normal(close.shape))
+
+    wick = np.abs(rng.standard_normal((2,) + close.shape)) * 0.4 * sigma
+    high = np.maximum(open_, close) * (1 + wick[0])
+    low = np.minimum(open_, close) * (1 - wick[1])
+
+    return open_, high, low
+
+
+def _shape_breakouts(close, open_, high, low, volume, mask):
+    cols = np.flatnonzero(mask)
+    if not len(cols):
+        return
+
+    range_high = high[-21:-1, cols].max(axis=0)
+    close[-1, cols] = range_high * 1.02
+    open_[-1, cols] = close[-2, cols]
+    high[-1, cols] = close[-1, cols] * 1.003
+    low[-1, cols] = np.minimum(open_[-1, cols], close[-1, cols]) * 0.997
+    volume[-1, cols] = volume[-21:-1, cols].mean(axis=0) * 2.5
+
+
+def _shape_pullbacks(returns, volume, mask, sigma):
+    # Drift back toward the 20 EMA on drying volume,
+    # then a small up-tick so RSI turns up
+    cols = np.flatnonzero(mask)
+    returns[-6:-1, cols] = -0.6 * sigma[cols]
+    returns[-1, cols] = 0.2 * sigma[cols]
+    volume[-6:, cols] *= 0.5
+
+
+def _shape_reversals(returns, volume, mask, sigma):
+    # Sharp dip pushes RSI under 40, then a strong
+    # bounce on a volume spike
+    cols = np.flatnonzero(mask)
+    returns[-8:-1, cols] = -1.6 * sigma[cols]
+    returns[-1, cols] = 2.5 * sigma[cols]
+    volume[-1, cols] *= 2.0
+
+
+class SyntheticDataProvider(MarketDataProvider):
+    """
+    Offline provider serving generate_synthetic_ohlcv data.
+    Used for benchmarks and tests; no network access.
+    """
+
+    def __init__(self, days: Optional[int] = None, seed: int = 0,
+                 end: str = "2024-12-31"):
+        self.days = days
+        self.seed = seed
+        self.end = end
+
+    def fetch_ohlcv(
+        self,
+        symbols: List[str],
+        lookback_days: int
+    ) -> Dict[str, pd.DataFrame]:
+
+        # lookback_days is calendar days, like the live providers
+        days = self.days or max(1, int(lookback_days * 5 / 7))
+
+        data = {}
+        for symbol in symbols:
+            # Seed per symbol so a symbol's series does not depend
+            # on which other symbols were requested with it
+            frames = generate_synthetic_ohlcv(
+                [symbol], days, seed=self._symbol_seed(symbol), end=self.end
+            )
+            data[symbol] = frames[symbol]
+
+        return data
+
+    def _symbol_seed(self, symbol: str) -> int:
+        return self.seed * 1_000_003 + sum(
+            (i + 1) * ord(c) for i, c in enumerate(symbol)
+        )
@@ -6,9 +6,27 @@ from .base_provider import MarketDataProvider
 
 class YahooFinanceProvider(MarketDataProvider):
 
-    def __init__(self, interval="1d", exchange_suffix=".NS"):
+    COLUMN_MAP = {
+        "Date": "date",
+        "Datetime": "date",
+        "Open": "open",
+        "High": "high",
+        "Low": "low",
+        "Close": "close",
+        "Volume": "volume"
+    }
+
+    def __init__(
+        self,
+        interval="1d",
+        exchange_suffix=".NS",
+        bulk=False,
+        chunk_size=100
+    ):
         self.interval = interval
         self.exchange_suffix = exchange_suffix
+        self.bulk = bulk
+        self.chunk_size = chunk_size
 
     def fetch_ohlcv(
         self,
@@ -16,29 +34,108 @@ class YahooFinanceProvider(MarketDataProvider):
         lookback_days: int
     ) -> Dict[str, pd.DataFrame]:
 
+        if self.bulk:
+            return self._fetch_bulk(symbols, lookback_days)
+
         data = {}
         period = f"{lookback_days}d"
 
         for symbol in symbols:
-            ticker = yf.Ticker(f"{symbol}{self.exchange_suffix}")
+            ticker = yf.Ticker(self._ticker(symbol))
             df = ticker.history(period=period, interval=self.interval)
 
             if df.empty:
                 continue
 
-            df = (
-                df.reset_index()
-                  .rename(columns={
-                      "Date": "date",
-                      "Open": "open",
-                      "High": "high",
-                      "Low": "low",
-                      "Close": "close",
-                      "Volume": "volume"
-                  })
+            data[symbol] = self._normalize(df)
+
+        return data
+
+    # -------------------------------
+    # Bulk (multi-ticker) download
+    # -------------------------------
+
+    def _fetch_bulk(
+        self,
+        symbols: List[str],
+        lookback_days: int
+    ) -> Dict[str, pd.DataFrame]:
+
+        data = {}
+        period = f"{lookback_days}d"
+
+        for start in range(0, len(symbols), self.chunk_size):
+            chunk = symbols[start:start + self.chunk_size]
+
+            raw = yf.download(
+                [self._ticker(s) for s in chunk],
+                period=period,
+                interval=self.interval,
+                group_by="ticker",
+                auto_adjust=True,
+                ignore_tz=False,
+                threads=True,
+                progress=False
             )
 
-            df = df[["date", "open", "high", "low", "close", "volume"]]
-            data[symbol] = df
+            data.update(self._split_bulk_frame(raw, chunk))
+
+        return data
+
+    def _split_bulk_frame(
+        self,
+        raw: pd.DataFrame,
+        symbols: List[str]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Splits a multi-ticker download (columns: ticker x field)
+        back into the per-symbol contract.
+        """
+
+        data = {}
+
+        if raw is None or raw.empty:
+            return data
+
+        multi = isinstance(raw.columns, pd.MultiIndex)
+        tickers = set(raw.columns.get_level_values(0)) if multi else set()
+
+        for symbol in symbols:
+            ticker = self._ticker(symbol)
+
+            if multi:
+                if ticker not in tickers:
+                    continue
+                df = raw[ticker]
+            elif len(symbols) == 1:
+                df = raw
+            else:
+                continue
+
+            df = df.dropna(subset=["Close"])
+
+            if df.empty:
+                continue
+
+            data[symbol] = self._normalize(df)
 
         return data
+
+    # -------------------------------
+    # Helpers
+    # -------------------------------
+
+    def _ticker(self, symbol: str) -> str:
+        # Index symbols (^NSEI, ^CNXIT, ...) carry no exchange suffix
+        if symbol.startswith("^"):
+            return symbol
+        return f"{symbol}{self.exchange_suffix}"
+
+    def _normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = (
+            df.reset_index()
+              .rename(columns=self.COLUMN_MAP)
+        )
+        df.columns.name = None
+
+        return df[["date", "open", "high", "low", "close", "volume"]]
@@ -0,0 +1,67 @@
+from multiprocessing import shared_memory
+from typing import Dict, Tuple
+import numpy as np
+
+from .indicator_panel import IndicatorPanel
+
+
+class SharedPanel:
+    """
+    An IndicatorPanel copied once into shared memory.
+
+    `spec` is small and picklable; worker processes pass it to
+    `attach` to map the panel back without copying.
+    """
+
+    def __init__(self, panel: IndicatorPanel):
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=max(panel.values.nbytes, 1)
+        )
+
+        shared = np.ndarray(
+            panel.values.shape,
+            dtype=panel.values.dtype,
+            buffer=self._shm.buf
+        )
+        shared[:] = panel.values
+        del shared
+
+        self.spec = {
+            "name": self._shm.name,
+            "shape": panel.values.shape,
+            "dtype": panel.values.dtype.str,
+            "dates": panel.dates,
+            "symbols": panel.symbols,
+            "fields": panel.fields
+        }
+
+    def __enter__(self) -> "SharedPanel":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._shm.close()
+        self._shm.unlink()
+
+    @staticmethod
+    def attach(spec: Dict) -> Tuple[shared_memory.SharedMemory, IndicatorPanel]:
+        """
+        Worker side: the segment (keep it referenced while the
+        panel is in use) and the zero-copy panel over it.
+        """
+        shm = shared_memory.SharedMemory(name=spec["name"])
+
+        values = np.ndarray(
+            spec["shape"],
+            dtype=np.dtype(spec["dtype"]),
+            buffer=shm.buf
+        )
+
+        return shm, IndicatorPanel(
+            dates=spec["dates"],
+            symbols=spec["symbols"],
+            fields=spec["fields"],
+            values=values
+        )
@@ -1,9 +1,10 @@
 import json
 import os
-import pyotp
 from pathlib import Path
-from dotenv import load_dotenv
-from NorenRestApiPy.NorenApi import NorenApi
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from NorenRestApiPy.NorenApi import NorenApi
 
 
 class ShoonyaAuthError(Exception):
@@ -16,11 +17,15 @@ class ShoonyaAuth:
     """
 
     def __init__(self, config_path: str):
+        # Imported here so loading the module stays cheap
+        from dotenv import load_dotenv
+        from NorenRestApiPy.NorenApi import NorenApi
+
         load_dotenv()
         self.config = self._load_config(config_path)
         self.api = NorenApi()
 
-    def login(self) -> NorenApi:
+    def login(self) -> "NorenApi":
         try:
             totp = self._generate_totp()
 
@@ -48,6 +53,8 @@ class ShoonyaAuth:
         if not secret:
             raise ShoonyaAuthError("TOTP secret missing")
 
+        import pyotp
+
         return pyotp.TOTP(secret).now()
 
     @staticmethod
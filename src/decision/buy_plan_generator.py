@@ -1,6 +1,9 @@
-from typing import Dict
+from typing import Dict, List
+import numpy as np
 import pandas as pd
 
+from src.data_layer.bar_snapshot import BarSnapshot
+
 
 class BuyPlanGenerator:
     """
@@ -9,10 +12,11 @@ class BuyPlanGenerator:
 
     def generate(self, context: Dict) -> Dict:
 
-        df: pd.DataFrame = context["indicator_df"]
+        # A prebuilt snapshot saves re-reading the frame
+        snapshot = context.get("snapshot") or BarSnapshot.of(context["indicator_df"])
         setups = context["setups"]
 
-        latest = df.iloc[-1]
+        latest = snapshot.latest
 
         price = latest["close"]
         atr = latest.get("atr_14", 0)
@@ -20,8 +24,8 @@ class BuyPlanGenerator:
         primary_setup = setups[0]  # take strongest setup
         setup_type = primary_setup["setup_type"]
 
-        entry_range = self._calculate_entry(df, setup_type)
-        stop_loss = self._calculate_stop_loss(df, entry_range, atr)
+        entry_range = self._calculate_entry(snapshot, setup_type)
+        stop_loss = self._calculate_stop_loss(snapshot, entry_range, atr)
         target_primary, target_extended = self._calculate_targets(
             entry_range, atr
         )
@@ -39,13 +43,116 @@ class BuyPlanGenerator:
             "validity_days": validity_days
         }
 
+    # -----------------------------------
+    # Batch generation
+    # -----------------------------------
+
+    # Setup-type codes for generate_batch (-1 = any other type)
+    SETUP_TYPES = ("BREAKOUT", "PULLBACK", "RSI_REVERSAL")
+    VALIDITY_DAYS = (3, 5, 2)
+    DEFAULT_VALIDITY_DAYS = 3
+
+    @classmethod
+    def setup_codes(cls, setup_types) -> np.ndarray:
+        index = {name: i for i, name in enumerate(cls.SETUP_TYPES)}
+        return np.array([index.get(t, -1) for t in setup_types], dtype=np.int8)
+
+    def generate_batch(
+        self,
+        setup_code: np.ndarray,
+        high: np.ndarray,
+        close: np.ndarray,
+        ema_20: np.ndarray,
+        atr: np.ndarray,
+        low_5: np.ndarray
+    ) -> pd.DataFrame:
+        """
+        `generate` for many candidates at once, from last-bar arrays,
+        the 5-bar lows and the primary setup's code (`setup_codes`).
+        Every column matches the scalar plan exactly; the entry
+        range is split into entry_low / entry_high.
+        """
+        code = np.asarray(setup_code)
+        high, close, ema_20, atr, low_5 = (
+            np.asarray(a, dtype=np.float64)
+            for a in (high, close, ema_20, atr, low_5)
+        )
+
+        breakout, pullback, reversal = (code == i for i in range(3))
+
+        entry_low = np.select(
+            [breakout, pullback, reversal],
+            [
+                np.round(high * 1.001, 2),
+                np.round(ema_20 * 0.995, 2),
+                np.round(close * 1.001, 2)
+            ],
+            close
+        )
+        entry_high = np.select(
+            [breakout, pullback, reversal],
+            [
+                np.round(high * 1.005, 2),
+                np.round(ema_20 * 1.005, 2),
+                np.round(close * 1.004, 2)
+            ],
+            close
+        )
+
+        # min()/max() keep the first argument unless the second
+        # is strictly smaller/larger; mirrored for NaN parity
+        atr_buffer = entry_low - atr
+        stop_loss = np.where(atr_buffer < low_5, atr_buffer, low_5)
+
+        target_2pct = entry_low * 1.02
+        target_atr = entry_low + (1.2 * atr)
+        target_primary = np.where(target_atr > target_2pct, target_atr, target_2pct)
+        target_extended = entry_low + (2 * atr)
+
+        risk = entry_low - stop_loss
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rr = np.where(risk <= 0, 0.0, (target_primary - entry_low) / risk)
+
+        validity = np.select(
+            [breakout, pullback, reversal],
+            self.VALIDITY_DAYS,
+            self.DEFAULT_VALIDITY_DAYS
+        )
+
+        return pd.DataFrame({
+            "entry_low": entry_low,
+            "entry_high": entry_high,
+            "stop_loss": np.round(stop_loss, 2),
+            "target_primary": np.round(target_primary, 2),
+            "target_extended": np.round(target_extended, 2),
+            "risk_reward_ratio": np.round(rr, 2),
+            "validity_days": validity
+        })
+
+    @staticmethod
+    def plans(table: pd.DataFrame) -> List[Dict]:
+        """
+        `generate_batch` rows in the per-symbol plan format.
+        """
+        return [
+            {
+                "entry_range": (row.entry_low, row.entry_high),
+                "stop_loss": row.stop_loss,
+                "target_primary": row.target_primary,
+                "target_extended": row.target_extended,
+                "risk_reward_ratio": row.risk_reward_ratio,
+                "validity_days": int(row.validity_days)
+            }
+            for row in table.itertuples(index=False)
+        ]
+
     # -----------------------------------
     # Entry logic
     # -----------------------------------
 
-    def _calculate_entry(self, df, setup_type):
+    def _calculate_entry(self, snapshot: BarSnapshot, setup_type):
 
-        latest = df.iloc[-1]
+        latest = snapshot.latest
 
         if setup_type == "BREAKOUT":
             high = latest["high"]
@@ -65,9 +172,9 @@ class BuyPlanGenerator:
     # Stop-loss logic
     # -----------------------------------
 
-    def _calculate_stop_loss(self, df, entry_range, atr):
+    def _calculate_stop_loss(self, snapshot: BarSnapshot, entry_range, atr):
 
-        recent_low = df["low"].tail(5).min()
+        recent_low = snapshot.low_5
         entry_price = entry_range[0]
 
         atr_buffer = entry_price - atr
@@ -1,6 +1,6 @@
-from typing import Dict
-import json
-from pathlib import Path
+from typing import Dict, Optional
+import pandas as pd
+from src.core.config_loader import load_config
 
 
 class EligibilityEngine:
@@ -9,62 +9,152 @@ class EligibilityEngine:
     whether a stock is eligible for recommendation.
     """
 
+    # Gates usable for staged (early-rejection) evaluation.
+    # "trend" needs the trend analysis; the others only need
+    # run-level context, so they can run before any per-symbol work.
+    GATES = (
+        "position_state",
+        "liquidity",
+        "market_regime",
+        "fundamental",
+        "sector",
+        "trend"
+    )
+    TREND_GATES = ("trend",)
+
     def __init__(self, rules_path: str):
         self.rules = self._load_rules(rules_path)
 
+        self.staged = self.rules.get("staged_evaluation", False)
+        self.gate_order = list(self.rules.get("gate_order", self.GATES))
+        self.record_rejections = self.rules.get("record_rejections", True)
+
+        unknown = set(self.gate_order) - set(self.GATES)
+        if unknown:
+            raise ValueError(f"Unknown eligibility gates: {sorted(unknown)}")
+
     def evaluate(self, context: Dict) -> Dict:
 
         blocking_reasons = []
         warnings = []
 
-        # 1️⃣ Fundamental check
+        # 1️⃣ Fundamental, 2️⃣ liquidity, 3️⃣ setup existence,
+        # 4️⃣ position state, 5️⃣ market regime, 6️⃣ trend requirement
+        for gate in (
+            "fundamental",
+            "liquidity",
+            "setups",
+            "position_state",
+            "market_regime",
+            "trend"
+        ):
+            reason = self.check(gate, context)
+            if reason:
+                blocking_reasons.append(reason)
+
+        # 7️⃣ Sector warning or block
+        reason = self.check("sector", context)
+        if reason:
+            blocking_reasons.append(reason)
+        elif context["sector_strength"]["strength"] == "WEAK":
+            warnings.append("SECTOR_WEAK")
+
+        return {
+            "eligible": len(blocking_reasons) == 0,
+            "blocking_reasons": blocking_reasons,
+            "warnings": warnings
+        }
+
+    def check(self, gate: str, context: Dict) -> Optional[str]:
+        """
+        Runs one gate; returns its blocking reason or None.
+        """
+        return getattr(self, f"_gate_{gate}")(context)
+
+    # -----------------------------
+    # Batch evaluation
+    # -----------------------------
+
+    # Columns of a candidate table, one row per (symbol, date)
+    TABLE_COLUMNS = (
+        "fundamental_approved",
+        "tradable",
+        "has_setup",
+        "position_open",
+        "regime",
+        "trend",
+        "sector_strength"
+    )
+
+    def evaluate_table(self, table: pd.DataFrame) -> pd.Series:
+        """
+        Vectorized `evaluate` over a candidate table (TABLE_COLUMNS);
+        True where no gate blocks.
+        """
+        blocked = (
+            ~table["fundamental_approved"].to_numpy(dtype=bool)
+            | ~table["tradable"].to_numpy(dtype=bool)
+            | ~table["has_setup"].to_numpy(dtype=bool)
+            | table["position_open"].to_numpy(dtype=bool)
+        )
+
+        if self.rules["block_in_bearish_market"]:
+            blocked |= table["regime"].to_numpy(dtype=object) == "BEARISH"
+        if self.rules["require_uptrend_for_long"]:
+            blocked |= table["trend"].to_numpy(dtype=object) != "UP"
+        if self.rules["block_if_sector_weak"]:
+            blocked |= table["sector_strength"].to_numpy(dtype=object) == "WEAK"
+
+        return pd.Series(~blocked, index=table.index, name="eligible")
+
+    # -----------------------------
+    # Gates
+    # -----------------------------
+
+    def _gate_fundamental(self, context: Dict) -> Optional[str]:
         if not context["fundamental"]["approved"]:
-            blocking_reasons.append("FUNDAMENTAL_REJECTED")
+            return "FUNDAMENTAL_REJECTED"
+        return None
 
-        # 2️⃣ Liquidity check
+    def _gate_liquidity(self, context: Dict) -> Optional[str]:
         if not context["liquidity"]["tradable"]:
-            blocking_reasons.append("NOT_TRADABLE")
+            return "NOT_TRADABLE"
+        return None
 
-        # 3️⃣ Setup existence
+    def _gate_setups(self, context: Dict) -> Optional[str]:
         if not context["setups"]:
-            blocking_reasons.append("NO_VALID_SETUP")
+            return "NO_VALID_SETUP"
+        return None
 
-        # 4️⃣ Position state
+    def _gate_position_state(self, context: Dict) -> Optional[str]:
         if context.get("position_state") == "OPEN":
-            blocking_reasons.append("OPEN_POSITION_EXISTS")
-
-        # 5️⃣ Market regime constraint
-        market_regime = context["market_regime"]["regime"]
+            return "OPEN_POSITION_EXISTS"
+        return None
 
+    def _gate_market_regime(self, context: Dict) -> Optional[str]:
         if (
-            market_regime == "BEARISH"
+            context["market_regime"]["regime"] == "BEARISH"
             and self.rules["block_in_bearish_market"]
         ):
-            blocking_reasons.append("MARKET_BEARISH")
+            return "MARKET_BEARISH"
+        return None
 
-        # 6️⃣ Trend requirement
+    def _gate_trend(self, context: Dict) -> Optional[str]:
         if (
             self.rules["require_uptrend_for_long"]
             and context["trend"]["trend"] != "UP"
         ):
-            blocking_reasons.append("NOT_IN_UPTREND")
-
-        # 7️⃣ Sector warning or block
-        sector_strength = context["sector_strength"]["strength"]
-
-        if sector_strength == "WEAK":
-            if self.rules["block_if_sector_weak"]:
-                blocking_reasons.append("WEAK_SECTOR")
-            else:
-                warnings.append("SECTOR_WEAK")
+            return "NOT_IN_UPTREND"
+        return None
 
-        return {
-            "eligible": len(blocking_reasons) == 0,
-            "blocking_reasons": blocking_reasons,
-            "warnings": warnings
-        }
+    def _gate_sector(self, context: Dict) -> Optional[str]:
+        if (
+            context["sector_strength"]["strength"] == "WEAK"
+            and self.rules["block_if_sector_weak"]
+        ):
+            return "WEAK_SECTOR"
+        return None
 
     @staticmethod
     def _load_rules(path: str) -> Dict:
-        with open(Path(path), "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_config(path)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List
 
 
 class EvidenceBuilder:
@@ -15,6 +15,7 @@ class EvidenceBuilder:
 
             "market_context": context["market_regime"],
             "sector_context": context["sector_strength"],
+            "relative_strength": context.get("relative_strength_detail"),
 
             "fundamental_status": context["fundamental"],
             "liquidity_status": context["liquidity"],
@@ -25,3 +26,31 @@ class EvidenceBuilder:
             "score": context["score"],
             "buy_plan": context["buy_plan"]
         }
+
+    def build_score_only(self, symbol: str, score: Dict) -> Dict:
+        """
+        Compact record for an eligible symbol outside the top K.
+        """
+        return {
+            "record_type": "score_only",
+            "symbol": symbol,
+            "run_timestamp": datetime.utcnow().isoformat(),
+            "score": score
+        }
+
+    def build_rejection(
+        self,
+        symbol: str,
+        blocking_reasons: List[str],
+        rejected_at: str
+    ) -> Dict:
+        """
+        Compact record for a symbol dropped by an early gate.
+        """
+        return {
+            "record_type": "rejection",
+            "symbol": symbol,
+            "run_timestamp": datetime.utcnow().isoformat(),
+            "rejected_at": rejected_at,
+            "blocking_reasons": blocking_reasons
+        }
@@ -1,6 +1,7 @@
-from typing import Dict
-import json
-from pathlib import Path
+from typing import Dict, List
+import numpy as np
+import pandas as pd
+from src.core.config_loader import load_config
 
 
 class ScoringEngine:
@@ -113,7 +114,122 @@ class ScoringEngine:
             return weight * 0.4
         return weight * 0.1
 
+    # -----------------------------
+    # Batch scoring
+    # -----------------------------
+
+    # Columns of a candidate table, one row per candidate
+    TABLE_COLUMNS = (
+        "setup_strength",
+        "volume_multiple",
+        "trend",
+        "trend_strength",
+        "sector_strength",
+        "regime",
+        "relative_strength"
+    )
+
+    SETUP_STRENGTH = {"HIGH": 1.0, "MEDIUM": 0.7, "LOW": 0.4}
+
+    @staticmethod
+    def candidate_row(context: Dict) -> Dict:
+        """
+        Flattens a per-symbol scoring context into one
+        candidate-table row, resolved the way `score` reads it.
+        """
+        setups = context["setups"]
+
+        # First setup volume multiple that reaches a scoring tier
+        volume_multiple = np.nan
+        for s in setups:
+            if "volume_multiple" in s["evidence"]:
+                if s["evidence"]["volume_multiple"] >= 1.3:
+                    volume_multiple = s["evidence"]["volume_multiple"]
+                    break
+
+        return {
+            "setup_strength": max(
+                (s["strength"] for s in setups), default=""
+            ),
+            "volume_multiple": volume_multiple,
+            "trend": context["trend"]["trend"],
+            "trend_strength": context["trend"]["strength"],
+            "sector_strength": context["sector_strength"]["strength"],
+            "regime": context["market_regime"]["regime"],
+            "relative_strength": context.get("relative_strength", 0)
+        }
+
+    @classmethod
+    def candidate_table(cls, contexts: List[Dict]) -> pd.DataFrame:
+        return pd.DataFrame(
+            [cls.candidate_row(c) for c in contexts],
+            columns=list(cls.TABLE_COLUMNS)
+        )
+
+    def score_table(self, table: pd.DataFrame) -> pd.DataFrame:
+        """
+        Vectorized `score` over a candidate table (TABLE_COLUMNS).
+        An empty setup_strength means no setup.
+        Returns one breakdown column per component plus "score".
+        """
+        w = self.weights
+
+        setup_strength = table["setup_strength"].to_numpy(dtype=object)
+        has_setup = setup_strength != ""
+        volume_multiple = table["volume_multiple"].to_numpy(dtype=np.float64)
+        trend = table["trend"].to_numpy(dtype=object)
+        trend_strength = table["trend_strength"].to_numpy(dtype=object)
+        sector = table["sector_strength"].to_numpy(dtype=object)
+        regime = table["regime"].to_numpy(dtype=object)
+        rs = table["relative_strength"].to_numpy(dtype=np.float64)
+
+        multiplier = (
+            pd.Series(setup_strength).map(self.SETUP_STRENGTH)
+              .fillna(0).to_numpy(dtype=np.float64)
+        )
+
+        breakdown = {
+            "setup": np.where(has_setup, w["setup"] * multiplier, 0.0),
+            "trend": np.select(
+                [(trend == "UP") & (trend_strength == "STRONG"), trend == "UP"],
+                [w["trend"], w["trend"] * 0.7],
+                w["trend"] * 0.2
+            ),
+            "volume": np.select(
+                [~has_setup, volume_multiple >= 1.7, volume_multiple >= 1.3],
+                [0.0, w["volume"], w["volume"] * 0.7],
+                w["volume"] * 0.4
+            ),
+            "sector": np.select(
+                [sector == "STRONG", sector == "NEUTRAL"],
+                [w["sector"], w["sector"] * 0.6],
+                w["sector"] * 0.2
+            ),
+            "market": np.select(
+                [regime == "BULLISH", regime == "NEUTRAL"],
+                [w["market"], w["market"] * 0.6],
+                w["market"] * 0.2
+            ),
+            "relative_strength": np.select(
+                [rs >= 5, rs >= 2, rs >= 0],
+                [
+                    w["relative_strength"],
+                    w["relative_strength"] * 0.7,
+                    w["relative_strength"] * 0.4
+                ],
+                w["relative_strength"] * 0.1
+            )
+        }
+
+        # Summed in the same order as `score`, so totals are identical
+        total = np.zeros(len(table))
+        for column in breakdown.values():
+            total = total + column
+
+        result = pd.DataFrame(breakdown, index=table.index)
+        result["score"] = np.round(total).astype(np.int64)
+        return result
+
     @staticmethod
     def _load_weights(path: str):
-        with open(Path(path), "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_config(path)
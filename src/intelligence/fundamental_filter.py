@@ -1,6 +1,7 @@
 from typing import Dict, List
-import json
-from pathlib import Path
+import numpy as np
+import pandas as pd
+from src.core.config_loader import load_config
 
 
 class FundamentalFilter:
@@ -9,8 +10,29 @@ class FundamentalFilter:
     Acts as a SAFETY GATE.
     """
 
+    # Bit position of each check in the packed failed_mask
+    CHECKS = (
+        "ROE_TOO_LOW",
+        "ROCE_TOO_LOW",
+        "HIGH_DEBT",
+        "LOW_SALES_GROWTH",
+        "LOW_PROFIT_GROWTH",
+        "NEGATIVE_CASH_FLOW"
+    )
+
+    # Value assumed when a metric is missing (same as _run_checks)
+    DEFAULTS = {
+        "roe": 0,
+        "roce": 0,
+        "debt_to_equity": 999,
+        "sales_growth_3y": 0,
+        "profit_growth_3y": 0,
+        "operating_cash_flow": 0
+    }
+
     def __init__(self, rules_path: str):
         self.rules = self._load_rules(rules_path)
+        self._decoded: Dict[int, List[str]] = {}
 
     def evaluate(
         self,
@@ -29,6 +51,90 @@ class FundamentalFilter:
 
         return results
 
+    def evaluate_table(self, metrics: pd.DataFrame) -> pd.DataFrame:
+        """
+        Columnar version of `evaluate`.
+
+        `metrics` is indexed by symbol with one column per metric.
+        Returns, per symbol, `approved` and `failed_mask`, a bitfield
+        with bit i set when CHECKS[i] failed.
+        """
+
+        m = {
+            col: (
+                metrics[col].astype(np.float64).fillna(default).to_numpy()
+                if col in metrics.columns
+                else np.full(len(metrics), default, dtype=np.float64)
+            )
+            for col, default in self.DEFAULTS.items()
+        }
+
+        failed = [
+            m["roe"] < self.rules["roe_min"],
+            m["roce"] < self.rules["roce_min"],
+            m["debt_to_equity"] > self.rules["debt_to_equity_max"],
+            m["sales_growth_3y"] < self.rules["sales_growth_3y_min"],
+            m["profit_growth_3y"] < self.rules["profit_growth_3y_min"],
+            (m["operating_cash_flow"] <= 0)
+            & bool(self.rules["operating_cash_flow_positive"])
+        ]
+
+        mask = np.zeros(len(metrics), dtype=np.uint8)
+        for bit, check in enumerate(failed):
+            mask |= check.astype(np.uint8) << bit
+
+        return pd.DataFrame(
+            {"approved": mask == 0, "failed_mask": mask},
+            index=metrics.index
+        )
+
+    def decode(self, failed_mask: int) -> List[str]:
+        """
+        Check names packed in a failed_mask value.
+        """
+        failed_mask = int(failed_mask)
+        if failed_mask not in self._decoded:
+            self._decoded[failed_mask] = [
+                name for bit, name in enumerate(self.CHECKS)
+                if failed_mask & (1 << bit)
+            ]
+        return list(self._decoded[failed_mask])
+
+    def statuses(
+        self,
+        metrics: pd.DataFrame,
+        symbols: List[str]
+    ) -> Dict[str, Dict]:
+        """
+        Per-symbol status dicts (same shape as `evaluate`) for the
+        whole universe from one `evaluate_table` pass. Symbols with
+        no metrics follow the `allow_missing_data` rule.
+        """
+
+        table = self.evaluate_table(metrics)
+        approved = table["approved"].to_dict()
+        masks = table["failed_mask"].to_dict()
+
+        allow_missing = self.rules.get("allow_missing_data", True)
+
+        results = {}
+        for symbol in symbols:
+            if symbol not in masks:
+                results[symbol] = {
+                    "approved": allow_missing,
+                    "failed_checks": [] if allow_missing else ["NO_FUNDAMENTAL_DATA"],
+                    "data_available": False
+                }
+                continue
+
+            results[symbol] = {
+                "approved": bool(approved[symbol]),
+                "failed_checks": self.decode(masks[symbol]),
+                "data_available": True
+            }
+
+        return results
+
     # -----------------------------
     # Internal logic
     # -----------------------------
@@ -59,5 +165,4 @@ class FundamentalFilter:
 
     @staticmethod
     def _load_rules(path: str) -> Dict:
-        with open(Path(path), "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_config(path)
@@ -1,8 +1,10 @@
-from typing import Dict, List
-import json
-from pathlib import Path
+from typing import Dict, List, Optional
+import numpy as np
 import pandas as pd
 
+from src.data_layer.bar_snapshot import BarSnapshot
+from src.core.config_loader import load_config
+
 
 class LiquidityVolatilityFilter:
     """
@@ -10,18 +12,27 @@ class LiquidityVolatilityFilter:
     liquidity and volatility criteria.
     """
 
+    # Bit position of each check in the packed failed_mask
+    CHECKS = (
+        "LOW_LIQUIDITY",
+        "LOW_VOLATILITY",
+        "SPREAD_TOO_WIDE"
+    )
+
     def __init__(self, rules_path: str):
         self.rules = self._load_rules(rules_path)
 
     def evaluate(
         self,
-        indicator_data: Dict[str, pd.DataFrame]
+        indicator_data: Dict[str, pd.DataFrame],
+        quotes: Optional[Dict[str, Dict]] = None
     ) -> Dict[str, Dict]:
 
         results = {}
+        quotes = quotes or {}
 
         for symbol, df in indicator_data.items():
-            failed = self._run_checks(df)
+            failed = self._run_checks(df, quotes.get(symbol))
 
             results[symbol] = {
                 "tradable": len(failed) == 0,
@@ -30,14 +41,109 @@ class LiquidityVolatilityFilter:
 
         return results
 
+    def evaluate_batch(
+        self,
+        symbols: List[str],
+        vol_avg: np.ndarray,
+        atr: np.ndarray,
+        close: np.ndarray,
+        spread_percent: Optional[np.ndarray] = None
+    ) -> pd.DataFrame:
+        """
+        Vectorized version of `evaluate` over last-bar values of
+        the whole universe. `spread_percent` (NaN = no quote) comes
+        from `spread_percent()` on an L1 quote snapshot.
+
+        Returns, per symbol, `tradable` and `failed_mask`, a bitfield
+        with bit i set when CHECKS[i] failed.
+        """
+
+        vol_avg = np.asarray(vol_avg, dtype=np.float64)
+        atr = np.asarray(atr, dtype=np.float64)
+        close = np.asarray(close, dtype=np.float64)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            atr_percent = np.where(close != 0, atr / close * 100, 0.0)
+
+        failed = [
+            vol_avg < self.rules["min_avg_volume"],
+            atr_percent < self.rules["min_atr_percent"]
+        ]
+
+        if spread_percent is None:
+            failed.append(np.zeros(len(symbols), dtype=bool))
+        else:
+            failed.append(
+                np.asarray(spread_percent, dtype=np.float64)
+                > self.rules["max_spread_percent"]
+            )
+
+        mask = np.zeros(len(symbols), dtype=np.uint8)
+        for bit, check in enumerate(failed):
+            mask |= check.astype(np.uint8) << bit
+
+        return pd.DataFrame(
+            {"tradable": mask == 0, "failed_mask": mask},
+            index=pd.Index(symbols, name="symbol")
+        )
+
+    def statuses(self, table: pd.DataFrame) -> Dict[str, Dict]:
+        """
+        Per-symbol status dicts (same shape as `evaluate`)
+        from an `evaluate_batch` result.
+        """
+        decoded = {}
+        results = {}
+
+        for symbol, mask in table["failed_mask"].items():
+            mask = int(mask)
+            if mask not in decoded:
+                decoded[mask] = self.decode(mask)
+
+            results[symbol] = {
+                "tradable": mask == 0,
+                "failed_checks": list(decoded[mask])
+            }
+
+        return results
+
+    def decode(self, failed_mask: int) -> List[str]:
+        return [
+            name for bit, name in enumerate(self.CHECKS)
+            if int(failed_mask) & (1 << bit)
+        ]
+
+    @staticmethod
+    def spread_percent(
+        symbols: List[str],
+        quotes: Optional[Dict[str, Dict]]
+    ) -> np.ndarray:
+        """
+        Bid/ask spread as % of mid from an L1 snapshot
+        {symbol: {"bid": ..., "ask": ...}}; NaN without a quote.
+        """
+        quotes = quotes or {}
+        spreads = np.full(len(symbols), np.nan)
+
+        for i, symbol in enumerate(symbols):
+            quote = quotes.get(symbol)
+            if quote:
+                spreads[i] = LiquidityVolatilityFilter._spread(quote)
+
+        return spreads
+
     # -----------------------------
     # Internal checks
     # -----------------------------
 
-    def _run_checks(self, df: pd.DataFrame) -> List[str]:
+    def _run_checks(
+        self,
+        df: pd.DataFrame,
+        quote: Optional[Dict] = None
+    ) -> List[str]:
         failed = []
 
-        latest = df.iloc[-1]
+        latest = BarSnapshot.of(df).latest
 
         # 1️⃣ Liquidity check
         avg_vol = latest.get("vol_avg_20", 0)
@@ -52,12 +158,23 @@ class LiquidityVolatilityFilter:
         if atr_percent < self.rules["min_atr_percent"]:
             failed.append("LOW_VOLATILITY")
 
-        # 3️⃣ Spread check (optional / placeholder)
-        # This can be implemented later using L1 data
+        # 3️⃣ Spread check (needs an L1 quote)
+        if quote:
+            if self._spread(quote) > self.rules["max_spread_percent"]:
+                failed.append("SPREAD_TOO_WIDE")
 
         return failed
 
+    @staticmethod
+    def _spread(quote: Dict) -> float:
+        bid = float(quote["bid"])
+        ask = float(quote["ask"])
+        mid = (bid + ask) / 2
+
+        if mid <= 0:
+            return float("nan")
+        return (ask - bid) / mid * 100
+
     @staticmethod
     def _load_rules(path: str) -> Dict:
-        with open(Path(path), "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_config(path)
@@ -1,7 +1,71 @@
-from typing import Dict
-import json
-from pathlib import Path
+from typing import Dict, Optional, Tuple
+import numpy as np
 import pandas as pd
+from src.core.config_loader import load_config
+
+
+REGIMES = ("NEUTRAL", "BULLISH", "BEARISH")
+VOL_STATES = ("NORMAL", "HIGH", "LOW")
+TRENDS = ("SIDEWAYS", "UP", "DOWN")
+
+
+class RegimeSeries:
+    """
+    Market regime for every date of an index history.
+
+    `regime` and `vol_state` are int8 codes into REGIMES and
+    VOL_STATES; `confidence` is float64. `lookup(date)` is a
+    dict hit, so backtests can query any day in O(1).
+    """
+
+    def __init__(
+        self,
+        dates: pd.DatetimeIndex,
+        regime: np.ndarray,
+        confidence: np.ndarray,
+        vol_state: np.ndarray
+    ):
+        self.dates = dates
+        self.regime = regime
+        self.confidence = confidence
+        self.vol_state = vol_state
+
+        self._positions = {d: i for i, d in enumerate(dates)}
+
+    def __len__(self):
+        return len(self.dates)
+
+    def at(self, i: int) -> Dict:
+        """
+        Same record as MarketRegimeAnalyzer.analyze for row i.
+        """
+        code = int(self.regime[i])
+
+        return {
+            "regime": REGIMES[code],
+            "confidence": float(self.confidence[i]),
+            "signals": {
+                "trend": TRENDS[code],
+                "volatility": VOL_STATES[int(self.vol_state[i])]
+            }
+        }
+
+    def lookup(self, date) -> Optional[Dict]:
+        i = self._positions.get(pd.Timestamp(date))
+        return None if i is None else self.at(i)
+
+    def latest(self) -> Dict:
+        return self.at(len(self.dates) - 1)
+
+    def codes_asof(self, dates) -> np.ndarray:
+        """
+        Regime code in force on each of `dates`: the last row on or
+        before it, NEUTRAL before the series starts.
+        """
+        rows = np.searchsorted(
+            self.dates.values, pd.DatetimeIndex(dates).values, side="right"
+        ) - 1
+        return np.where(rows >= 0, self.regime[np.maximum(rows, 0)], 0).astype(np.int8)
 
 
 class MarketRegimeAnalyzer:
@@ -10,8 +74,12 @@ class MarketRegimeAnalyzer:
     BULLISH / NEUTRAL / BEARISH
     """
 
+    # Memoized series kept per analyzer
+    SERIES_CACHE_SIZE = 8
+
     def __init__(self, rules_path: str):
         self.rules = self._load_rules(rules_path)
+        self._series_cache: Dict[Tuple, RegimeSeries] = {}
 
     def analyze(self, index_df: pd.DataFrame) -> Dict:
         latest = index_df.iloc[-1]
@@ -68,7 +136,67 @@ class MarketRegimeAnalyzer:
             }
         }
 
+    def analyze_series(
+        self,
+        index_df: pd.DataFrame,
+        key: str = "index"
+    ) -> RegimeSeries:
+        """
+        Vectorized `analyze` over every row of `index_df`.
+        Memoized per (key, last date, length), so repeated calls
+        within a run (or across backtest steps) are free.
+        """
+        cache_key = (key, index_df["date"].iloc[-1], len(index_df))
+
+        series = self._series_cache.get(cache_key)
+        if series is None:
+            series = self._compute_series(index_df)
+
+            if len(self._series_cache) >= self.SERIES_CACHE_SIZE:
+                self._series_cache.pop(next(iter(self._series_cache)))
+            self._series_cache[cache_key] = series
+
+        return series
+
+    def _compute_series(self, index_df: pd.DataFrame) -> RegimeSeries:
+        n = len(index_df)
+
+        def column(name):
+            if name not in index_df:
+                return np.full(n, np.nan)
+            return index_df[name].to_numpy(dtype=np.float64)
+
+        price = column("close")
+        ema_20 = column("ema_20")
+        ema_50 = column("ema_50")
+        ema_200 = column("ema_200")
+        atr = column("atr_14")
+
+        # -------- Trend logic --------
+        bullish = (price > ema_50) & (ema_20 > ema_50) & (ema_50 > ema_200)
+        bearish = (price < ema_50) & (ema_50 < ema_200)
+
+        regime = np.select([bullish, bearish], [1, 2], 0).astype(np.int8)
+        confidence = np.where(bullish | bearish, 0.8, 0.5)
+
+        # -------- Volatility context --------
+        with np.errstate(divide="ignore", invalid="ignore"):
+            atr_percent = np.where(price != 0, atr / price * 100, 0.0)
+
+        high = atr_percent > self.rules["volatility"]["atr_percent_high"]
+        low = ~high & (atr_percent < self.rules["volatility"]["atr_percent_low"])
+
+        vol_state = np.select([high, low], [1, 2], 0).astype(np.int8)
+        confidence = np.where(high | low, confidence - 0.1, confidence)
+        confidence = np.round(np.clip(confidence, 0.0, 1.0), 2)
+
+        return RegimeSeries(
+            pd.DatetimeIndex(index_df["date"]),
+            regime,
+            confidence,
+            vol_state
+        )
+
     @staticmethod
     def _load_rules(path: str) -> Dict:
-        with open(Path(path), "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_config(path)
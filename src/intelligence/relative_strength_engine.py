@@ -0,0 +1,190 @@
+from typing import Dict, List
+import numpy as np
+import pandas as pd
+from src.core.config_loader import load_config
+
+
+class RelativeStrengthEngine:
+    """
+    Multi-horizon returns of each stock in excess of the
+    primary index, blended into one RS value (%) and ranked
+    cross-sectionally as a 0-100 percentile.
+
+    All horizons are measured in index sessions ending at each
+    stock's last bar, so batch and per-symbol results agree.
+    """
+
+    def __init__(self, rules_path: str):
+        self.rules = self._load_rules(rules_path)
+        self.horizons = list(self.rules["horizons"])
+        self.weights = np.asarray(self.rules["horizon_weights"], dtype=np.float64)
+
+        if len(self.weights) != len(self.horizons):
+            raise ValueError("horizons and horizon_weights differ in length")
+
+    def rank(
+        self,
+        close: np.ndarray,
+        index_close: np.ndarray,
+        symbols: List[str]
+    ) -> pd.DataFrame:
+        """
+        `close` is a date x symbol matrix on the same date axis
+        as `index_close`. Returns one row per symbol with the
+        excess return per horizon, `rs` and `percentile`.
+        """
+        on_index = ~np.isnan(index_close)
+        close = close[on_index]
+        index_close = index_close[on_index]
+
+        excess = self._excess_returns(close, index_close)
+        rs = self._blend(excess)
+
+        table = pd.DataFrame(
+            np.round(excess, 2),
+            index=pd.Index(symbols, name="symbol"),
+            columns=[f"excess_{h}" for h in self.horizons]
+        )
+        table["rs"] = np.round(rs, 2)
+        table["percentile"] = np.round(
+            pd.Series(rs).rank(pct=True).to_numpy() * 100, 1
+        )
+
+        return table
+
+    def rs_series(
+        self,
+        close: np.ndarray,
+        index_close: np.ndarray
+    ) -> np.ndarray:
+        """
+        Date x symbol `rs` as `rank` would report it on the history
+        truncated at each date (NaN where there is none yet).
+        """
+        on_index = ~np.isnan(index_close)
+        stock = close[on_index]
+        market = index_close[on_index]
+
+        n_dates, n_symbols = stock.shape
+
+        # Each symbol's last bar on or before every index date
+        rows = np.arange(n_dates)[:, None]
+        last = np.maximum.accumulate(
+            np.where(~np.isnan(stock), rows, -1), axis=0
+        )
+        cols = np.arange(n_symbols)[None, :]
+
+        excess = np.full((n_dates, n_symbols, len(self.horizons)), np.nan)
+
+        for k, h in enumerate(self.horizons):
+            start = last - h
+            ok = (last >= 0) & (start >= 0)
+            end, start = np.where(ok, last, 0), np.where(ok, start, 0)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                stock_ret = stock[end, cols] / stock[start, cols] - 1
+                market_ret = market[end] / market[start] - 1
+
+            excess[:, :, k] = np.where(ok, (stock_ret - market_ret) * 100, np.nan)
+
+        rs = np.round(
+            self._blend(excess.reshape(-1, len(self.horizons))), 2
+        ).reshape(n_dates, n_symbols)
+
+        # Dates off the index calendar see the last index session
+        positions = np.cumsum(on_index) - 1
+        out = rs[np.maximum(positions, 0)]
+        out[positions < 0] = np.nan
+        return out
+
+    def for_symbol(self, df: pd.DataFrame, index_df: pd.DataFrame) -> Dict:
+        """
+        Excess returns of one stock (no cross-sectional percentile),
+        for stages that see one symbol at a time.
+        """
+        close = (
+            df.set_index("date")["close"]
+              .reindex(pd.DatetimeIndex(index_df["date"]))
+              .to_numpy(dtype=np.float64)
+        )
+        table = self.rank(
+            close[:, None],
+            index_df["close"].to_numpy(dtype=np.float64),
+            [None]
+        )
+        return self.context(table.iloc[0], percentile=False)
+
+    def statuses(self, table: pd.DataFrame) -> Dict[str, Dict]:
+        return {
+            symbol: self.context(row)
+            for symbol, row in table.iterrows()
+        }
+
+    def context(self, row: pd.Series, percentile: bool = True) -> Dict:
+        rs = row["rs"]
+
+        return {
+            "relative_strength": 0.0 if np.isnan(rs) else float(rs),
+            "excess_returns": {
+                str(h): self._value(row[f"excess_{h}"])
+                for h in self.horizons
+            },
+            "percentile": self._value(row["percentile"]) if percentile else None
+        }
+
+    # -----------------------------
+    # Internal helpers
+    # -----------------------------
+
+    def _excess_returns(
+        self,
+        close: np.ndarray,
+        index_close: np.ndarray
+    ) -> np.ndarray:
+        """
+        symbol x horizon excess returns in percent.
+        """
+        n_dates, n_symbols = close.shape
+        valid = ~np.isnan(close)
+
+        last = n_dates - 1 - valid[::-1].argmax(axis=0)
+        has_data = valid.any(axis=0)
+        cols = np.arange(n_symbols)
+
+        excess = np.full((n_symbols, len(self.horizons)), np.nan)
+
+        for k, h in enumerate(self.horizons):
+            start = last - h
+            ok = has_data & (start >= 0)
+            start = np.where(ok, start, 0)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                stock = close[last, cols] / close[start, cols] - 1
+                market = index_close[last] / index_close[start] - 1
+
+            excess[:, k] = np.where(ok, (stock - market) * 100, np.nan)
+
+        return excess
+
+    def _blend(self, excess: np.ndarray) -> np.ndarray:
+        """
+        Weighted mean over the horizons available per symbol.
+        """
+        available = ~np.isnan(excess)
+        weights = np.where(available, self.weights, 0.0)
+        total = weights.sum(axis=1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(
+                total > 0,
+                np.nansum(excess * weights, axis=1) / total,
+                np.nan
+            )
+
+    @staticmethod
+    def _value(x):
+        return None if pd.isna(x) else float(x)
+
+    @staticmethod
+    def _load_rules(path: str) -> Dict:
+        return load_config(path)
@@ -1,7 +1,6 @@
 from typing import Dict
-import json
-from pathlib import Path
 import pandas as pd
+from src.core.config_loader import load_config
 
 
 class SectorStrengthAnalyzer:
@@ -37,7 +36,7 @@ class SectorStrengthAnalyzer:
 
             results[sector] = {
                 "strength": strength,
-                "relative_return": round(relative_return, 2),
+                "relative_return": round(float(relative_return), 2),
                 "trend": trend
             }
 
@@ -81,5 +80,4 @@ class SectorStrengthAnalyzer:
 
     @staticmethod
     def _load_rules(path: str) -> Dict:
-        with open(Path(path), "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_config(path)
@@ -0,0 +1,38 @@
+import json
+import os
+from datetime import date
+from pathlib import Path
+from typing import Any, Optional
+
+
+class DailyCache:
+    """
+    Small run-level results (JSON) that stay valid for one
+    trading day, so intraday reruns can skip recomputing them.
+    Stored as <base>/<YYYY-MM-DD>/<name>.json
+    """
+
+    def __init__(self, base_path: str = "data/daily_cache"):
+        self.base_path = Path(base_path)
+
+    def path(self, name: str, day: Optional[date] = None) -> Path:
+        day = day or date.today()
+        return self.base_path / day.isoformat() / f"{name}.json"
+
+    def get(self, name: str, day: Optional[date] = None) -> Optional[Any]:
+        path = self.path(name, day)
+        if not path.exists():
+            return None
+
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def put(self, name: str, value: Any, day: Optional[date] = None):
+        path = self.path(name, day)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp = path.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(value, f)
+
+        os.replace(tmp, path)
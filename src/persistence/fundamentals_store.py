@@ -0,0 +1,197 @@
+import csv
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import List, Optional
+import pandas as pd
+
+
+class FundamentalsStore:
+    """
+    Local SQLite repository of fundamental metrics,
+    keyed by (symbol, period_end).
+
+    - import_csv bulk-loads a CSV dump and is a no-op when the
+      file has not changed since the last import
+    - latest returns every symbol's most recent period in one
+      query, cached in memory for `cache_ttl_seconds`
+    """
+
+    METRICS = (
+        "roe",
+        "roce",
+        "debt_to_equity",
+        "sales_growth_3y",
+        "profit_growth_3y",
+        "operating_cash_flow"
+    )
+
+    def __init__(self, db_path: str, cache_ttl_seconds: int = 86400):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_ttl_seconds = cache_ttl_seconds
+
+        self._cache: Optional[pd.DataFrame] = None
+        self._cache_version: Optional[str] = None
+        self._cache_expires = 0.0
+
+        self._init_schema()
+
+    # -----------------------------
+    # Import
+    # -----------------------------
+
+    def import_csv(self, csv_path: str, force: bool = False) -> int:
+        """
+        Upserts all rows of a CSV dump (symbol, period_end, metrics).
+        Returns the number of rows imported, 0 if skipped.
+        """
+        path = Path(csv_path)
+        if not path.exists():
+            return 0
+
+        stat = path.stat()
+        signature = f"{path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+
+        if not force and self._meta("source_signature") == signature:
+            return 0
+
+        today = date.today().isoformat()
+
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = [
+                (
+                    row["symbol"].strip().upper(),
+                    (row.get("period_end") or today).strip(),
+                    *(self._number(row.get(m)) for m in self.METRICS)
+                )
+                for row in csv.DictReader(f)
+            ]
+
+        columns = ", ".join(self.METRICS)
+        placeholders = ", ".join("?" * (len(self.METRICS) + 2))
+
+        with self._connect() as conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO fundamentals "
+                f"(symbol, period_end, {columns}) VALUES ({placeholders})",
+                rows
+            )
+            self._set_meta(conn, "source_signature", signature)
+            self._set_meta(conn, "imported_at", datetime.now().isoformat())
+            self._set_meta(conn, "data_version", str(time.time_ns()))
+
+        self._cache = None
+        return len(rows)
+
+    # -----------------------------
+    # Lookups
+    # -----------------------------
+
+    def latest(self, symbols: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Latest reporting period per symbol, indexed by symbol.
+        """
+        table = self._latest_table()
+
+        if symbols is None:
+            return table
+        return table[table.index.isin(symbols)]
+
+    def is_stale(self, refresh_interval_days: int = 90) -> bool:
+        """
+        True when the newest reporting period is older than
+        `refresh_interval_days`, i.e. a new quarter is due.
+        """
+        with self._connect() as conn:
+            newest = conn.execute(
+                "SELECT MAX(period_end) FROM fundamentals"
+            ).fetchone()[0]
+
+        if newest is None:
+            return True
+
+        age = date.today() - date.fromisoformat(newest[:10])
+        return age > timedelta(days=refresh_interval_days)
+
+    # -----------------------------
+    # Internal helpers
+    # -----------------------------
+
+    def _latest_table(self) -> pd.DataFrame:
+        now = time.monotonic()
+
+        if self._cache is not None and now < self._cache_expires:
+            return self._cache
+
+        version = self._meta("data_version")
+
+        # TTL expired but nothing was imported since: keep the frame
+        if self._cache is None or version != self._cache_version:
+            with self._connect() as conn:
+                self._cache = pd.read_sql_query(
+                    """
+                    SELECT f.*
+                    FROM fundamentals f
+                    JOIN (
+                        SELECT symbol, MAX(period_end) AS period_end
+                        FROM fundamentals
+                        GROUP BY symbol
+                    ) latest USING (symbol, period_end)
+                    """,
+                    conn,
+                    index_col="symbol"
+                )
+            self._cache_version = version
+
+        self._cache_expires = now + self.cache_ttl_seconds
+        return self._cache
+
+    def _init_schema(self):
+        metric_columns = ", ".join(f"{m} REAL" for m in self.METRICS)
+
+        with self._connect() as conn:
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS fundamentals (
+                    symbol TEXT NOT NULL,
+                    period_end TEXT NOT NULL,
+                    {metric_columns},
+                    PRIMARY KEY (symbol, period_end)
+                )
+                """
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _meta(self, key: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, key: str, value: str):
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            (key, value)
+        )
+
+    @staticmethod
+    def _number(value) -> Optional[float]:
+        if value is None or str(value).strip() == "":
+            return None
+        return float(value)
@@ -1,24 +1,126 @@
 import json
+import os
+import threading
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 
 
 class RecommendationLogger:
     """
     Persists recommendation evidence to storage.
+
+    Evidence is buffered and appended as compact JSON Lines,
+    one file per run inside one directory per day:
+
+        <base_path>/<YYYY-MM-DD>/run_<run_id>.jsonl
     """
 
-    def __init__(self, base_path: str = "recommendation_logs"):
+    def __init__(
+        self,
+        base_path: str = "recommendation_logs",
+        batch_size: int = 500
+    ):
         self.base_path = Path(base_path)
         self.base_path.mkdir(exist_ok=True)
+        self.batch_size = batch_size
+
+        self.run_id: Optional[str] = None
+        self._buffer: List[Dict] = []
+        self._lock = threading.Lock()
+
+    def start_run(self, run_id: Optional[str] = None):
+        """
+        Flushes any pending records and starts a new run file.
+        """
+        self.flush()
+        self.run_id = run_id or self._new_run_id()
 
     def log(self, evidence: Dict):
+        with self._lock:
+            self._buffer.append(evidence)
+            full = len(self._buffer) >= self.batch_size
+
+        if full:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            records, self._buffer = self._buffer, []
+
+            if not records:
+                return
+
+            if self.run_id is None:
+                self.run_id = self._new_run_id()
+
+            # Roll by the evidence date, so a run crossing midnight
+            # continues in the next day's directory
+            by_day: Dict[str, List[str]] = {}
+            for record in records:
+                day = str(record.get("run_timestamp", ""))[:10] or self._today()
+                by_day.setdefault(day, []).append(
+                    json.dumps(record, separators=(",", ":"),
+                               default=_json_default)
+                )
+
+            for day, lines in by_day.items():
+                path = self._run_path(day)
+                path.parent.mkdir(exist_ok=True)
+
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write("\n".join(lines) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    # -----------------------------
+    # Reader
+    # -----------------------------
+
+    def load_day(self, day: str) -> List[Dict]:
+        """
+        All evidence records written on `day` (YYYY-MM-DD),
+        across runs, in write order.
+        """
+        day_dir = self.base_path / day
+        if not day_dir.exists():
+            return []
+
+        records = []
+        for path in sorted(day_dir.glob("run_*.jsonl")):
+            with open(path, "r", encoding="utf-8") as f:
+                records.extend(json.loads(line) for line in f if line.strip())
+
+        return records
+
+    # -----------------------------
+    # Internal helpers
+    # -----------------------------
+
+    def _run_path(self, day: str) -> Path:
+        return self.base_path / day / f"run_{self.run_id}.jsonl"
+
+    @staticmethod
+    def _new_run_id() -> str:
+        return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
 
-        symbol = evidence["symbol"]
-        timestamp = evidence["run_timestamp"]
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
-        filename = f"{symbol}_{timestamp}.json"
-        file_path = self.base_path / filename
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(evidence, f, indent=4)
+def _json_default(value):
+    # Indicator values reach the evidence as NumPy scalars
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
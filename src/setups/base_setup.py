@@ -1,10 +1,17 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Optional
+import numpy as np
 import pandas as pd
 
 
 class SetupDetector(ABC):
 
+    def __init__(self, rules: Dict):
+        """
+        `rules` is the detector's section of the setup rules.
+        """
+        self.rules = rules
+
     @abstractmethod
     def detect(
         self,
@@ -15,3 +22,17 @@ class SetupDetector(ABC):
         Returns setup dict if detected, else None
         """
         pass
+
+    @abstractmethod
+    def detect_series(
+        self,
+        df: pd.DataFrame,
+        trend: np.ndarray
+    ) -> pd.DataFrame:
+        """
+        `detect` evaluated on every bar in one vectorized pass.
+        `trend` holds the per-bar trend labels (TrendAnalyzer.analyze_series).
+        Returns a frame aligned with `df`: "date", boolean "signal"
+        and the setup's evidence columns.
+        """
+        pass
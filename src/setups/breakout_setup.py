@@ -1,11 +1,16 @@
 from typing import Dict, Optional
+import numpy as np
 import pandas as pd
+from src.data_layer.bar_snapshot import BarSnapshot
 from .base_setup import SetupDetector
 from .volume_analyzer import VolumeAnalyzer
 
 
 class BreakoutSetup(SetupDetector):
 
+    setup_type = "BREAKOUT"
+    strength = "HIGH"
+
     def detect(
         self,
         df: pd.DataFrame,
@@ -15,34 +20,71 @@ class BreakoutSetup(SetupDetector):
         if trend_info["trend"] != "UP":
             return None
 
-        if len(df) < 25:
+        snapshot = BarSnapshot.of(df)
+
+        if snapshot.length < self.rules["min_bars"]:
             return None
 
-        latest = df.iloc[-1]
-        prev = df.iloc[:-1]
+        latest = snapshot.latest
 
-        range_high = prev["high"].tail(20).max()
+        range_high = snapshot.range_high_20
         breakout_margin = (latest["close"] - range_high) / range_high
 
-        volume_ok = VolumeAnalyzer.is_volume_spike(df, threshold=1.7)
+        volume_ok = VolumeAnalyzer.is_volume_spike(
+            snapshot, threshold=self.rules["volume_spike"]
+        )
 
         if (
-            breakout_margin > 0.003
+            breakout_margin > self.rules["min_margin"]
             and volume_ok
-            and latest["rsi_14"] >= 60
+            and latest["rsi_14"] >= self.rules["min_rsi"]
         ):
             return {
-                "setup_type": "BREAKOUT",
+                "setup_type": self.setup_type,
                 "triggered_on": str(latest["date"]),
-                "strength": "HIGH",
+                "strength": self.strength,
                 "evidence": {
                     "range_high": round(range_high, 2),
                     "breakout_margin_pct": round(breakout_margin * 100, 2),
                     "volume_multiple": round(
-                        VolumeAnalyzer.volume_multiple(df), 2
+                        VolumeAnalyzer.volume_multiple(snapshot), 2
                     ),
                     "rsi": round(latest["rsi_14"], 1)
                 }
             }
 
         return None
+
+    def detect_series(
+        self,
+        df: pd.DataFrame,
+        trend: np.ndarray
+    ) -> pd.DataFrame:
+
+        close = df["close"].to_numpy(dtype=np.float64)
+        rsi = df["rsi_14"].to_numpy(dtype=np.float64)
+
+        # Max high of the 20 bars before each bar
+        range_high = (
+            df["high"].shift(1).rolling(20, min_periods=1).max()
+              .to_numpy(dtype=np.float64)
+        )
+        breakout_margin = (close - range_high) / range_high
+        volume_multiple = VolumeAnalyzer.volume_multiple_series(df)
+
+        signal = (
+            (np.asarray(trend) == "UP")
+            & (np.arange(len(df)) >= self.rules["min_bars"] - 1)
+            & (breakout_margin > self.rules["min_margin"])
+            & (volume_multiple >= self.rules["volume_spike"])
+            & (rsi >= self.rules["min_rsi"])
+        )
+
+        return pd.DataFrame({
+            "date": df["date"],
+            "signal": signal,
+            "range_high": np.round(range_high, 2),
+            "breakout_margin_pct": np.round(breakout_margin * 100, 2),
+            "volume_multiple": np.round(volume_multiple, 2),
+            "rsi": np.round(rsi, 1)
+        }, index=df.index)
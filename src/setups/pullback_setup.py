@@ -1,41 +1,90 @@
 from typing import Dict, Optional
+import numpy as np
+import pandas as pd
+from src.data_layer.bar_snapshot import BarSnapshot
 from .base_setup import SetupDetector
 from .volume_analyzer import VolumeAnalyzer
 
 
 class PullbackSetup(SetupDetector):
 
+    setup_type = "PULLBACK"
+    strength = "MEDIUM"
+
     def detect(self, df, trend_info: Dict) -> Optional[Dict]:
 
         if trend_info["trend"] != "UP":
             return None
 
-        if len(df) < 3:
+        snapshot = BarSnapshot.of(df)
+
+        if snapshot.length < 3:
             return None
 
-        latest = df.iloc[-1]
-        prev = df.iloc[-2]
+        latest = snapshot.latest
+        prev = snapshot.prev
 
         near_ema = (
-            abs(latest["close"] - latest["ema_20"]) / latest["ema_20"] < 0.01
-            or abs(latest["close"] - latest["ema_50"]) / latest["ema_50"] < 0.015
+            abs(latest["close"] - latest["ema_20"]) / latest["ema_20"]
+            < self.rules["ema_20_band"]
+            or abs(latest["close"] - latest["ema_50"]) / latest["ema_50"]
+            < self.rules["ema_50_band"]
         )
 
-        volume_dry = VolumeAnalyzer.is_volume_contraction(df)
+        volume_dry = VolumeAnalyzer.is_volume_contraction(snapshot)
         rsi_recovering = latest["rsi_14"] > prev["rsi_14"]
 
         if near_ema and volume_dry and rsi_recovering:
             return {
-                "setup_type": "PULLBACK",
+                "setup_type": self.setup_type,
                 "triggered_on": str(latest["date"]),
-                "strength": "MEDIUM",
+                "strength": self.strength,
                 "evidence": {
                     "price": round(latest["close"], 2),
                     "rsi": round(latest["rsi_14"], 1),
                     "volume_multiple": round(
-                        VolumeAnalyzer.volume_multiple(df), 2
+                        VolumeAnalyzer.volume_multiple(snapshot), 2
                     )
                 }
             }
 
         return None
+
+    def detect_series(
+        self,
+        df: pd.DataFrame,
+        trend: np.ndarray
+    ) -> pd.DataFrame:
+
+        close = df["close"].to_numpy(dtype=np.float64)
+        ema_20 = df["ema_20"].to_numpy(dtype=np.float64)
+        ema_50 = df["ema_50"].to_numpy(dtype=np.float64)
+        rsi = df["rsi_14"].to_numpy(dtype=np.float64)
+        volume = df["volume"].to_numpy(dtype=np.float64)
+        avg_vol = df["vol_avg_20"].to_numpy(dtype=np.float64)
+
+        near_ema = (
+            (np.abs(close - ema_20) / ema_20 < self.rules["ema_20_band"])
+            | (np.abs(close - ema_50) / ema_50 < self.rules["ema_50_band"])
+        )
+        volume_dry = volume < avg_vol
+        rsi_recovering = np.zeros(len(df), dtype=bool)
+        rsi_recovering[1:] = rsi[1:] > rsi[:-1]
+
+        signal = (
+            (np.asarray(trend) == "UP")
+            & (np.arange(len(df)) >= 2)
+            & near_ema
+            & volume_dry
+            & rsi_recovering
+        )
+
+        return pd.DataFrame({
+            "date": df["date"],
+            "signal": signal,
+            "price": np.round(close, 2),
+            "rsi": np.round(rsi, 1),
+            "volume_multiple": np.round(
+                VolumeAnalyzer.volume_multiple_series(df), 2
+            )
+        }, index=df.index)
@@ -1,34 +1,73 @@
 from typing import Dict, Optional
+import numpy as np
+import pandas as pd
+from src.data_layer.bar_snapshot import BarSnapshot
 from .base_setup import SetupDetector
 from .volume_analyzer import VolumeAnalyzer
 
 
 class RSIReversalSetup(SetupDetector):
 
+    setup_type = "RSI_REVERSAL"
+    strength = "MEDIUM"
+
     def detect(self, df, trend_info: Dict) -> Optional[Dict]:
 
-        if len(df) < 2:
+        snapshot = BarSnapshot.of(df)
+
+        if snapshot.length < 2:
             return None
 
-        latest = df.iloc[-1]
-        prev = df.iloc[-2]
+        latest = snapshot.latest
+        prev = snapshot.prev
 
-        rsi_cross = prev["rsi_14"] < 40 and latest["rsi_14"] > 40
+        level = self.rules["rsi_level"]
+
+        rsi_cross = prev["rsi_14"] < level and latest["rsi_14"] > level
         price_ok = latest["close"] > latest["ema_50"]
-        volume_confirm = VolumeAnalyzer.is_volume_spike(df, threshold=1.3)
+        volume_confirm = VolumeAnalyzer.is_volume_spike(
+            snapshot, threshold=self.rules["volume_spike"]
+        )
 
         if rsi_cross and price_ok and volume_confirm:
             return {
-                "setup_type": "RSI_REVERSAL",
+                "setup_type": self.setup_type,
                 "triggered_on": str(latest["date"]),
-                "strength": "MEDIUM",
+                "strength": self.strength,
                 "evidence": {
                     "prev_rsi": round(prev["rsi_14"], 1),
                     "current_rsi": round(latest["rsi_14"], 1),
                     "volume_multiple": round(
-                        VolumeAnalyzer.volume_multiple(df), 2
+                        VolumeAnalyzer.volume_multiple(snapshot), 2
                     )
                 }
             }
 
         return None
+
+    def detect_series(
+        self,
+        df: pd.DataFrame,
+        trend: np.ndarray
+    ) -> pd.DataFrame:
+
+        rsi = df["rsi_14"].to_numpy(dtype=np.float64)
+        prev_rsi = np.concatenate([[np.nan], rsi[:-1]])
+        volume_multiple = VolumeAnalyzer.volume_multiple_series(df)
+
+        level = self.rules["rsi_level"]
+
+        signal = (
+            (prev_rsi < level)
+            & (rsi > level)
+            & (df["close"].to_numpy() > df["ema_50"].to_numpy())
+            & (volume_multiple >= self.rules["volume_spike"])
+        )
+
+        return pd.DataFrame({
+            "date": df["date"],
+            "signal": signal,
+            "prev_rsi": np.round(prev_rsi, 1),
+            "current_rsi": np.round(rsi, 1),
+            "volume_multiple": np.round(volume_multiple, 2)
+        }, index=df.index)
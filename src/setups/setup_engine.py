@@ -1,9 +1,13 @@
-from typing import List, Dict
+from typing import List, Dict, Mapping, Optional
+import numpy as np
 import pandas as pd
+from src.core.config_loader import load_config
 
 from .breakout_setup import BreakoutSetup
 from .pullback_setup import PullbackSetup
 from .rsi_reversal_setup import RSIReversalSetup
+from .signal_cube import SignalCube
+from .trend_analyzer import TrendAnalyzer
 
 
 class SetupDetectionEngine:
@@ -11,11 +15,13 @@ class SetupDetectionEngine:
     Runs multiple setup detectors on a stock.
     """
 
-    def __init__(self):
+    def __init__(self, rules_path: str = "config/setup_rules.json"):
+        self.rules = self._load_rules(rules_path)
+
         self.detectors = [
-            BreakoutSetup(),
-            PullbackSetup(),
-            RSIReversalSetup()
+            BreakoutSetup(self.rules["breakout"]),
+            PullbackSetup(self.rules["pullback"]),
+            RSIReversalSetup(self.rules["rsi_reversal"])
         ]
 
     def detect_setups(
@@ -32,3 +38,65 @@ class SetupDetectionEngine:
                 setups.append(result)
 
         return setups
+
+    # -----------------------------
+    # Full-history signals
+    # -----------------------------
+
+    def detect_series(
+        self,
+        df: pd.DataFrame,
+        trend_series: pd.DataFrame
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Per setup type, the detector's signal + evidence frame
+        for every bar of `df`.
+        """
+        trend = trend_series["trend"].to_numpy()
+
+        return {
+            detector.setup_type: detector.detect_series(df, trend)
+            for detector in self.detectors
+        }
+
+    def signal_cube(
+        self,
+        indicator_data: Mapping[str, pd.DataFrame],
+        trend_analyzer: TrendAnalyzer,
+        symbols: Optional[List[str]] = None
+    ) -> SignalCube:
+        """
+        Date x symbol x setup signal cube over the full history.
+        The date axis is the panel's (or the union of all dates).
+        """
+        symbols = [
+            s for s in (symbols or list(indicator_data))
+            if s in indicator_data
+        ]
+        setups = [d.setup_type for d in self.detectors]
+
+        dates = getattr(indicator_data, "dates", None)
+        if dates is None:
+            dates = pd.DatetimeIndex(sorted({
+                d for s in symbols for d in indicator_data[s]["date"]
+            }))
+
+        signals = np.zeros((len(dates), len(symbols), len(setups)), dtype=bool)
+        evidence = {}
+
+        for j, symbol in enumerate(symbols):
+            df = indicator_data[symbol]
+            rows = dates.get_indexer(pd.DatetimeIndex(df["date"]))
+
+            series = self.detect_series(df, trend_analyzer.analyze_series(df))
+
+            for k, setup_type in enumerate(setups):
+                frame = series[setup_type]
+                signals[rows, j, k] = frame["signal"].to_numpy()
+                evidence[(symbol, setup_type)] = frame
+
+        return SignalCube(dates, symbols, setups, signals, evidence)
+
+    @staticmethod
+    def _load_rules(path: str) -> Dict:
+        return load_config(path)
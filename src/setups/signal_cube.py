@@ -0,0 +1,66 @@
+from typing import Dict, List, Tuple
+import numpy as np
+import pandas as pd
+
+
+class SignalCube:
+    """
+    Setup signals for a universe over its full history.
+
+    `signals` is a boolean array shaped (date, symbol, setup);
+    the per-bar evidence behind each signal stays in the
+    detector frames, keyed by (symbol, setup_type).
+    """
+
+    def __init__(
+        self,
+        dates: pd.DatetimeIndex,
+        symbols: List[str],
+        setups: List[str],
+        signals: np.ndarray,
+        evidence: Dict[Tuple[str, str], pd.DataFrame]
+    ):
+        self.dates = dates
+        self.symbols = list(symbols)
+        self.setups = list(setups)
+        self.signals = signals
+        self.evidence = evidence
+
+        self._setup_index = {s: i for i, s in enumerate(self.setups)}
+
+    def matrix(self, setup_type: str) -> np.ndarray:
+        """
+        Date-by-symbol boolean matrix (view) for one setup.
+        """
+        return self.signals[:, :, self._setup_index[setup_type]]
+
+    def wide(self, setup_type: str) -> pd.DataFrame:
+        return pd.DataFrame(
+            self.matrix(setup_type),
+            index=self.dates,
+            columns=self.symbols,
+            copy=False
+        )
+
+    def evidence_matrix(self, setup_type: str, column: str) -> np.ndarray:
+        """
+        Date-by-symbol float matrix of one evidence column
+        (NaN on dates a symbol has no bar).
+        """
+        out = np.full((len(self.dates), len(self.symbols)), np.nan)
+
+        for j, symbol in enumerate(self.symbols):
+            frame = self.evidence[(symbol, setup_type)]
+            rows = self.dates.get_indexer(pd.DatetimeIndex(frame["date"]))
+            out[rows, j] = frame[column].to_numpy(dtype=np.float64)
+
+        return out
+
+    def counts(self) -> pd.Series:
+        """
+        Number of signals per setup over the whole cube.
+        """
+        return pd.Series(
+            self.signals.sum(axis=(0, 1)),
+            index=self.setups
+        )
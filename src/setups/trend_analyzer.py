@@ -1,8 +1,10 @@
-from typing import Dict
-import json
-from pathlib import Path
+from typing import Dict, Tuple
+import numpy as np
 import pandas as pd
 
+from src.data_layer.bar_snapshot import BarSnapshot
+from src.core.config_loader import load_config
+
 
 class TrendAnalyzer:
     """
@@ -13,7 +15,10 @@ class TrendAnalyzer:
         self.rules = self._load_rules(rules_path)
 
     def analyze(self, df: pd.DataFrame) -> Dict:
-        latest = df.iloc[-1]
+        """
+        `df` may also be a prebuilt BarSnapshot.
+        """
+        latest = BarSnapshot.of(df).latest
 
         price = latest["close"]
         ema_20 = latest.get("ema_20")
@@ -55,7 +60,54 @@ class TrendAnalyzer:
             }
         }
 
+    def analyze_series(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Trend and strength labels for every bar of `df`,
+        matching `analyze` on each truncated frame.
+        """
+        trend, strength = self.analyze_arrays(
+            *(
+                df[f].to_numpy(dtype=np.float64)
+                for f in ("close", "ema_20", "ema_50", "ema_200", "rsi_14")
+            )
+        )
+
+        return pd.DataFrame(
+            {"date": df["date"], "trend": trend, "strength": strength},
+            index=df.index
+        )
+
+    def analyze_arrays(
+        self,
+        price: np.ndarray,
+        ema_20: np.ndarray,
+        ema_50: np.ndarray,
+        ema_200: np.ndarray,
+        rsi: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Elementwise trend / strength labels for same-shaped arrays,
+        e.g. the date x symbol matrices of an IndicatorPanel.
+        """
+        ema_up = (ema_20 > ema_50) & (ema_50 > ema_200)
+        ema_down = (ema_20 < ema_50) & (ema_50 < ema_200)
+
+        up = ema_up & (price > ema_50)
+        down = ~up & ema_down & (price < ema_50)
+
+        trend = np.select([up, down], ["UP", "DOWN"], "RANGE")
+        strength = np.select(
+            [
+                up & (rsi >= self.rules["rsi_trend_confirm_max"]),
+                down & (rsi <= self.rules["rsi_trend_confirm_min"]),
+                ~up & ~down
+            ],
+            ["STRONG", "STRONG", "WEAK"],
+            "NEUTRAL"
+        )
+
+        return trend, strength
+
     @staticmethod
     def _load_rules(path: str) -> Dict:
-        with open(Path(path), "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_config(path)
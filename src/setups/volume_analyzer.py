@@ -1,14 +1,18 @@
+import numpy as np
 import pandas as pd
 
+from src.data_layer.bar_snapshot import BarSnapshot
+
 
 class VolumeAnalyzer:
     """
     Provides volume-based utilities for setup detection.
+    Latest-bar helpers take a DataFrame or a BarSnapshot.
     """
 
     @staticmethod
     def volume_multiple(df: pd.DataFrame) -> float:
-        latest = df.iloc[-1]
+        latest = BarSnapshot.of(df).latest
         avg_vol = latest.get("vol_avg_20", 0)
         if avg_vol == 0:
             return 0
@@ -20,10 +24,23 @@ class VolumeAnalyzer:
 
     @staticmethod
     def is_volume_contraction(df: pd.DataFrame) -> bool:
-        latest = df.iloc[-1]
+        latest = BarSnapshot.of(df).latest
         return latest["volume"] < latest.get("vol_avg_20", 0)
 
     @staticmethod
     def volume_trend_increasing(df: pd.DataFrame, lookback: int = 3) -> bool:
         recent = df["volume"].tail(lookback)
         return all(x < y for x, y in zip(recent, recent[1:]))
+
+    @staticmethod
+    def volume_multiple_series(df: pd.DataFrame) -> np.ndarray:
+        """
+        `volume_multiple` for every bar.
+        """
+        volume = df["volume"].to_numpy(dtype=np.float64)
+        if "vol_avg_20" not in df:
+            return np.zeros(len(df))
+
+        avg_vol = df["vol_avg_20"].to_numpy(dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(avg_vol == 0, 0.0, volume / avg_vol)
@@ -0,0 +1,143 @@
+import numpy as np
+import pandas as pd
+from src.backtest.backtest_engine import BacktestEngine
+from src.backtest.trade_simulator import TradeSimulator
+from src.core.symbol_pipeline import SymbolPipeline
+from src.data_layer.indicator_engine import IndicatorEngine
+from src.data_layer.providers.synthetic_provider import generate_synthetic_ohlcv
+from src.intelligence.market_regime_analyzer import MarketRegimeAnalyzer
+
+
+def _panel(n=10, days=300):
+    symbols = [f"S{i}" for i in range(n)]
+    return IndicatorEngine().compute_panel(
+        generate_synthetic_ohlcv(symbols, days, seed=8)
+    )
+
+
+def test_candidates_match_the_live_pipeline_on_each_day():
+    panel = _panel()
+    index_df = panel["S0"]
+
+    candidates = BacktestEngine().candidates(panel, index_df)
+    by_cell = candidates.set_index(["date", "symbol"])
+
+    pipeline = SymbolPipeline.from_config()
+    regime = MarketRegimeAnalyzer("config/market_regime_rules.json")
+
+    eligible = set()
+    for date in panel.dates[-60:]:
+        index_now = index_df[index_df["date"] <= date]
+        run_context = {
+            "market_regime": regime.analyze(index_now),
+            "market_index": index_now
+        }
+
+        for symbol in panel:
+            df = panel[symbol]
+            outcome = pipeline.evaluate(symbol, df[df["date"] <= date], run_context)
+            if not outcome["eligible"]:
+                continue
+
+            eligible.add((date, symbol))
+            row = by_cell.loc[(date, symbol)]
+            plan = outcome["buy_plan"]
+
+            assert row["score"] == outcome["score"]
+            assert (row["entry_low"], row["entry_high"]) == plan["entry_range"]
+            assert row["stop_loss"] == plan["stop_loss"]
+            assert row["target_primary"] == plan["target_primary"]
+            assert row["validity_days"] == plan["validity_days"]
+
+    recent = candidates[candidates["date"] >= panel.dates[-60]]
+    assert eligible
+    assert set(zip(recent["date"], recent["symbol"])) == eligible
+
+
+def _plan(entry_low, entry_high, stop, target, validity=3):
+    return pd.DataFrame({
+        "entry_low": [entry_low],
+        "entry_high": [entry_high],
+        "stop_loss": [stop],
+        "target_primary": [target],
+        "validity_days": [validity]
+    })
+
+
+def _prices(bars):
+    """bars: list of (open, high, low, close) for one symbol."""
+    values = np.array(bars, dtype=np.float64)
+    return {
+        f: values[:, [k]] for k, f in enumerate(("open", "high", "low", "close"))
+    }
+
+
+def test_simulator_fills_in_band_and_exits_on_levels():
+    simulator = TradeSimulator(max_holding_days=5)
+    rows, cols = np.array([0]), np.array([0])
+
+    # Fills on bar 2 at the band top after gapping above it, then hits target
+    prices = _prices([
+        (100, 101, 99, 100),
+        (103, 104, 102.5, 103),
+        (103, 103.5, 101.5, 102),
+        (104, 106.5, 103, 106)
+    ])
+    result = simulator.simulate(prices, rows, cols, _plan(101, 102, 98, 106))
+    row = result.iloc[0]
+
+    assert row["outcome"] == "TARGET"
+    assert (row["fill_row"], row["fill_price"]) == (2, 102)
+    assert (row["exit_row"], row["exit_price"]) == (3, 106)
+
+    # A bar touching both levels counts as stopped
+    prices = _prices([
+        (100, 101, 99, 100),
+        (101, 101.5, 100.5, 101),
+        (101, 107, 97, 101)
+    ])
+    result = simulator.simulate(prices, rows, cols, _plan(101, 102, 98, 106))
+    assert result.iloc[0]["outcome"] == "STOP"
+    assert result.iloc[0]["r_multiple"] == -1
+
+    # Never trades into the band within its validity
+    prices = _prices([(100, 101, 99, 100)] + [(95, 96, 94, 95)] * 4)
+    result = simulator.simulate(prices, rows, cols, _plan(101, 102, 98, 106))
+    assert result.iloc[0]["outcome"] == "EXPIRED"
+    assert result.iloc[0]["end_row"] == 3
+
+
+def test_timeout_holds_exactly_max_holding_days():
+    simulator = TradeSimulator(max_holding_days=3)
+    rows, cols = np.array([0]), np.array([0])
+
+    # Fills on bar 1, drifts between the levels
+    prices = _prices([(100, 101, 99, 100)] + [(101.5, 102, 100, 101)] * 5)
+    row = simulator.simulate(prices, rows, cols, _plan(101, 102, 98, 106)).iloc[0]
+
+    assert row["outcome"] == "TIMEOUT"
+    assert (row["fill_row"], row["exit_row"]) == (1, 3)
+    assert row["holding_days"] == 3
+    assert row["end_row"] == 3
+
+    # One bar short of the holding period: still open
+    row = simulator.simulate(
+        {k: v[:3] for k, v in prices.items()}, rows, cols, _plan(101, 102, 98, 106)
+    ).iloc[0]
+    assert row["outcome"] == "OPEN"
+    assert row["holding_days"] == 2
+
+
+def test_run_keeps_one_live_plan_per_symbol():
+    panel = _panel(n=20)
+    result = BacktestEngine().run(panel, panel["S0"])
+    trades = result.trades
+
+    assert not trades.empty
+    for _, group in trades.groupby("symbol"):
+        dates = panel.dates.get_indexer(group["date"])
+        ends = group["end_row"].to_numpy()
+        assert (dates[1:] > ends[:-1]).all()
+
+    assert "ALL" in result.report.index
+    assert result.report.loc["ALL", "plans"] == len(trades)
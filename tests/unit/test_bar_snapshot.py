@@ -0,0 +1,30 @@
+from src.data_layer.bar_snapshot import BarSnapshot
+from src.data_layer.indicator_engine import IndicatorEngine
+from src.data_layer.providers.synthetic_provider import generate_synthetic_ohlcv
+
+
+def test_panel_snapshot_matches_frame_and_iloc():
+    data = generate_synthetic_ohlcv(["AAA", "BBB"], 120, seed=2)
+    data["BBB"] = data["BBB"].drop(index=[100, 101])  # gaps inside history
+    panel = IndicatorEngine().compute_panel(data)
+
+    for symbol in ("AAA", "BBB"):
+        df = panel[symbol]
+        snap = panel.snapshot(symbol)
+
+        assert str(snap) == str(BarSnapshot.from_frame(df))
+        assert snap.length == len(df)
+        assert snap.latest["close"] == df.iloc[-1]["close"]
+        assert snap.prev.get("rsi_14") == df.iloc[-2]["rsi_14"]
+        assert str(snap.latest.date) == str(df.iloc[-1]["date"])
+        assert snap.range_high_20 == df.iloc[:-1]["high"].tail(20).max()
+        assert snap.low_5 == df["low"].tail(5).min()
+
+
+def test_missing_columns_fall_back_like_series_get():
+    data = generate_synthetic_ohlcv(["AAA"], 5, seed=2)["AAA"]
+    snap = BarSnapshot.from_frame(data)
+
+    assert snap.latest.get("vol_avg_20", 0) == 0
+    assert snap.range_high_20 == data["high"].iloc[:-1].max()
+    assert snap.latest.ema_20 is None
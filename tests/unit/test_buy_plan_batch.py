@@ -0,0 +1,41 @@
+import numpy as np
+from src.data_layer.bar_snapshot import Bar, BarSnapshot
+from src.decision.buy_plan_generator import BuyPlanGenerator
+
+
+def test_batch_plans_match_scalar_plans():
+    rng = np.random.default_rng(12)
+    n = 500
+
+    high = rng.uniform(50, 500, n)
+    close = high * rng.uniform(0.95, 1.0, n)
+    ema_20 = close * rng.uniform(0.97, 1.03, n)
+    atr = np.where(rng.random(n) < 0.05, 0.0, close * rng.uniform(0.005, 0.05, n))
+    low_5 = close * rng.uniform(0.9, 1.02, n)
+    setup_types = rng.choice(
+        ["BREAKOUT", "PULLBACK", "RSI_REVERSAL", "OTHER"], n
+    )
+
+    generator = BuyPlanGenerator()
+
+    table = generator.generate_batch(
+        generator.setup_codes(setup_types), high, close, ema_20, atr, low_5
+    )
+    batch = generator.plans(table)
+
+    for i in range(n):
+        snapshot = BarSnapshot(
+            latest=Bar(high=high[i], close=close[i], ema_20=ema_20[i], atr_14=atr[i]),
+            prev=None,
+            range_high_20=np.nan,
+            low_5=low_5[i],
+            length=30
+        )
+        expected = generator.generate({
+            "snapshot": snapshot,
+            "setups": [{"setup_type": setup_types[i]}]
+        })
+
+        assert batch[i] == expected
+
+    assert (table["risk_reward_ratio"] == 0).any()
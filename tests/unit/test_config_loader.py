@@ -0,0 +1,25 @@
+import json
+import os
+from src.core.config_loader import load_config
+
+
+def test_callers_get_independent_copies(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps({"breakout": {"min_margin": 0.003}}))
+
+    first = load_config(str(path))
+    first["breakout"]["min_margin"] = 1.0
+
+    assert load_config(str(path)) == {"breakout": {"min_margin": 0.003}}
+
+
+def test_changed_file_is_read_again(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps({"value": 1}))
+    assert load_config(str(path))["value"] == 1
+
+    path.write_text(json.dumps({"value": 2}))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_config(str(path))["value"] == 2
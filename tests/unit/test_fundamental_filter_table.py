@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+from src.intelligence.fundamental_filter import FundamentalFilter
+
+
+def test_table_evaluation_matches_per_symbol_checks():
+    rng = np.random.default_rng(5)
+    n = 200
+
+    metrics = pd.DataFrame({
+        "roe": rng.uniform(0, 30, n),
+        "roce": rng.uniform(0, 30, n),
+        "debt_to_equity": rng.uniform(0, 1.2, n),
+        "sales_growth_3y": rng.uniform(-5, 25, n),
+        "profit_growth_3y": rng.uniform(-5, 25, n),
+        "operating_cash_flow": rng.uniform(-50, 100, n)
+    }, index=[f"S{i}" for i in range(n)])
+
+    ff = FundamentalFilter("config/fundamental_rules.json")
+
+    expected = ff.evaluate(metrics.to_dict("index"))
+    table = ff.evaluate_table(metrics)
+
+    for symbol, row in table.iterrows():
+        assert row["approved"] == expected[symbol]["approved"]
+        assert ff.decode(row["failed_mask"]) == expected[symbol]["failed_checks"]
+
+
+def test_statuses_cover_missing_symbols_and_columns():
+    ff = FundamentalFilter("config/fundamental_rules.json")
+    metrics = pd.DataFrame({"roe": [20.0]}, index=["AAA"])
+
+    statuses = ff.statuses(metrics, ["AAA", "ZZZ"])
+
+    assert statuses["AAA"]["failed_checks"] == [
+        "ROCE_TOO_LOW", "HIGH_DEBT", "LOW_SALES_GROWTH",
+        "LOW_PROFIT_GROWTH", "NEGATIVE_CASH_FLOW"
+    ]
+    assert statuses["ZZZ"] == {
+        "approved": True, "failed_checks": [], "data_available": False
+    }
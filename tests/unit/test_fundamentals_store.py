@@ -0,0 +1,38 @@
+from src.persistence.fundamentals_store import FundamentalsStore
+
+
+HEADER = "symbol,period_end,roe,roce,debt_to_equity,sales_growth_3y,profit_growth_3y,operating_cash_flow\n"
+
+
+def test_store_imports_once_and_returns_latest_period(tmp_path):
+    source = tmp_path / "fundamentals.csv"
+    source.write_text(
+        HEADER
+        + "aaa,2024-03-31,18,17,0.3,12,11,100\n"
+        + "AAA,2024-06-30,20,19,0.2,14,13,120\n"
+        + "BBB,2024-06-30,9,,0.9,5,4,-10\n"
+    )
+
+    store = FundamentalsStore(str(tmp_path / "f.db"), cache_ttl_seconds=60)
+
+    assert store.import_csv(str(source)) == 3
+    assert store.import_csv(str(source)) == 0  # unchanged dump is skipped
+
+    latest = store.latest()
+    assert sorted(latest.index) == ["AAA", "BBB"]
+    assert latest.loc["AAA", "period_end"] == "2024-06-30"
+    assert latest.loc["AAA", "roe"] == 20
+    assert latest["roce"].isna().sum() == 1
+
+    assert store.latest() is latest  # served from the TTL cache
+    assert list(store.latest(["BBB", "ZZZ"]).index) == ["BBB"]
+
+    source.write_text(HEADER + "CCC,2024-09-30,25,25,0.1,20,20,50\n")
+    assert store.import_csv(str(source)) == 1
+    assert "CCC" in store.latest().index  # import invalidates the cache
+
+    # A new process sees the same data without re-importing
+    reopened = FundamentalsStore(str(tmp_path / "f.db"))
+    assert reopened.import_csv(str(source)) == 0
+    assert len(reopened.latest()) == 3
+    assert reopened.is_stale(refresh_interval_days=10_000) is False
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+from src.data_layer.indicator_engine import IndicatorEngine
+from src.data_layer.incremental_indicators import IncrementalIndicatorEngine
+
+
+def _ohlcv(periods=80, seed=7):
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 1, periods).cumsum()
+
+    return pd.DataFrame({
+        "date": pd.date_range("2024-01-01", periods=periods),
+        "open": close,
+        "high": close + rng.uniform(0.5, 2, periods),
+        "low": close - rng.uniform(0.5, 2, periods),
+        "close": close,
+        "volume": rng.integers(1_000, 5_000, periods)
+    })
+
+
+def test_incremental_updates_match_batch(tmp_path):
+    df = _ohlcv()
+    expected = IndicatorEngine().compute({"TEST": df})["TEST"]
+
+    engine = IncrementalIndicatorEngine()
+    engine.seed("TEST", df.iloc[:60])
+
+    # State survives a save/load round trip mid-stream
+    path = tmp_path / "state.json"
+    engine.save(str(path))
+    engine = IncrementalIndicatorEngine.load(str(path))
+
+    for i, bar in enumerate(df.iloc[60:].to_dict("records"), start=60):
+        latest = engine.update("TEST", bar)
+
+        for col in ["ema_20", "ema_50", "ema_200", "rsi_14", "atr_14",
+                    "bb_middle", "bb_upper", "bb_lower", "vol_avg_20"]:
+            assert np.isclose(latest[col], expected[col].iloc[i], rtol=1e-9)
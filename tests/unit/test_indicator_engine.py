@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from src.data_layer.indicator_engine import IndicatorEngine
 
@@ -20,3 +21,46 @@ def test_indicators_added():
     assert "rsi_14" in out.columns
     assert "atr_14" in out.columns
     assert "bb_upper" in out.columns
+
+
+def _ohlcv(periods, seed, start="2024-01-01"):
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 1, periods).cumsum()
+
+    return pd.DataFrame({
+        "date": pd.date_range(start, periods=periods),
+        "open": close + rng.normal(0, 0.5, periods),
+        "high": close + 1,
+        "low": close - 1,
+        "close": close,
+        "volume": rng.integers(1_000, 5_000, periods)
+    })
+
+
+def test_panel_matches_per_symbol_compute():
+    gappy = _ohlcv(80, seed=3).drop(index=[40, 41]).reset_index(drop=True)
+
+    data = {
+        "FULL": _ohlcv(80, seed=1),
+        "SHORT": _ohlcv(50, seed=2, start="2024-01-31"),
+        "GAPPY": gappy
+    }
+
+    engine = IndicatorEngine()
+    expected = engine.compute(data)
+    panel = engine.compute_panel(data)
+
+    assert set(panel) == set(data)
+
+    for symbol, exp in expected.items():
+        got = panel[symbol]
+
+        assert len(got) == len(exp)
+        assert (got["date"].values == exp["date"].values).all()
+
+        for col in panel.fields:
+            np.testing.assert_allclose(
+                got[col].to_numpy(dtype=float),
+                exp[col].to_numpy(dtype=float),
+                rtol=1e-9
+            )
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+from src.intelligence.liquidity_volatility_filter import LiquidityVolatilityFilter
+
+
+def test_batch_matches_per_symbol_checks_with_quotes():
+    rng = np.random.default_rng(9)
+    n = 200
+    symbols = [f"S{i}" for i in range(n)]
+
+    vol_avg = rng.uniform(1e5, 1e6, n)
+    atr = rng.uniform(0.5, 5, n)
+    close = rng.uniform(50, 300, n)
+    close[0] = 0.0
+
+    quotes = {
+        s: {"bid": 100.0, "ask": 100.0 + rng.uniform(0, 0.6)}
+        for s in symbols[::3]
+    }
+
+    lf = LiquidityVolatilityFilter("config/liquidity_rules.json")
+
+    frames = {
+        s: pd.DataFrame({
+            "vol_avg_20": [vol_avg[i]],
+            "atr_14": [atr[i]],
+            "close": [close[i]]
+        })
+        for i, s in enumerate(symbols)
+    }
+    expected = lf.evaluate(frames, quotes=quotes)
+
+    table = lf.evaluate_batch(
+        symbols, vol_avg, atr, close,
+        spread_percent=lf.spread_percent(symbols, quotes)
+    )
+
+    assert lf.statuses(table) == expected
+    assert "SPREAD_TOO_WIDE" in {
+        c for status in expected.values() for c in status["failed_checks"]
+    }
@@ -0,0 +1,83 @@
+import json
+import os
+import time
+import pandas as pd
+from src.data_layer.market_data_loader import MarketDataLoader
+
+
+class FakeProvider:
+
+    def __init__(self):
+        self.calls = []
+
+    def fetch_ohlcv(self, symbols, lookback_days):
+        self.calls.append((list(symbols), lookback_days))
+
+        end = pd.Timestamp.today().normalize()
+        dates = pd.date_range(end=end, periods=lookback_days)
+
+        return {
+            s: pd.DataFrame({
+                "date": dates,
+                "open": 1.0, "high": 2.0, "low": 0.5,
+                "close": 1.5, "volume": 1000.0
+            })
+            for s in symbols
+        }
+
+
+def _loader(tmp_path):
+    config = {
+        "provider": "yahoo",
+        "defaults": {"timeframe": "1d", "lookback_days": 30},
+        "cache": {
+            "enabled": True,
+            "path": str(tmp_path / "cache"),
+            "max_age_hours": 12,
+            "overlap_days": 3
+        }
+    }
+    path = tmp_path / "market_data.json"
+    path.write_text(json.dumps(config))
+
+    loader = MarketDataLoader(str(path))
+    loader.provider = FakeProvider()
+    return loader
+
+
+def test_cache_serves_fresh_data_and_fetches_only_stale_tail(tmp_path):
+    loader = _loader(tmp_path)
+
+    first = loader.fetch(["AAA"])
+    assert loader.provider.calls == [(["AAA"], 30)]
+    assert len(first["AAA"]) == 30
+
+    # Fresh cache: no provider call at all
+    loader.fetch(["AAA"])
+    assert len(loader.provider.calls) == 1
+
+    # Stale cache: only the overlap tail is refetched
+    old = time.time() - 24 * 3600
+    os.utime(loader.cache.path("AAA"), (old, old))
+
+    again = loader.fetch(["AAA"])
+    assert loader.provider.calls[-1] == (["AAA"], 3)
+    assert again["AAA"]["date"].is_unique
+    assert len(again["AAA"]) == 30
+
+    # Forced refresh refetches the full window
+    loader.fetch(["AAA"], refresh=True)
+    assert loader.provider.calls[-1] == (["AAA"], 30)
+
+
+def test_short_cached_history_is_refetched_beyond_the_slack(tmp_path):
+    loader = _loader(tmp_path)
+    loader.fetch(["AAA"], lookback_days=20)  # starts 19 days ago
+
+    # Within the 7-day slack of a 26-day window: served from the cache
+    loader.fetch(["AAA"], lookback_days=26)
+    assert len(loader.provider.calls) == 1
+
+    # Beyond it: the full window is refetched
+    loader.fetch(["AAA"], lookback_days=30)
+    assert loader.provider.calls[-1] == (["AAA"], 30)
@@ -0,0 +1,21 @@
+from src.data_layer.indicator_engine import IndicatorEngine
+from src.data_layer.providers.synthetic_provider import generate_synthetic_ohlcv
+from src.intelligence.market_regime_analyzer import MarketRegimeAnalyzer
+
+
+def test_series_matches_analyze_on_every_prefix():
+    ohlcv = generate_synthetic_ohlcv(["^NSEI"], 300, seed=11)
+    index_df = IndicatorEngine().compute(ohlcv)["^NSEI"]
+
+    analyzer = MarketRegimeAnalyzer("config/market_regime_rules.json")
+    series = analyzer.analyze_series(index_df, key="^NSEI")
+
+    assert len(series) == len(index_df)
+    assert series.latest() == analyzer.analyze(index_df)
+
+    for i in range(0, len(index_df), 7):
+        date = index_df["date"].iloc[i]
+        assert series.lookup(date) == analyzer.analyze(index_df.iloc[:i + 1])
+
+    # Memoized per index and last date
+    assert analyzer.analyze_series(index_df, key="^NSEI") is series
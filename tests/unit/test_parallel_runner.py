@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+from src.data_layer.indicator_engine import IndicatorEngine
+from src.core.symbol_pipeline import SymbolPipeline
+from src.core.parallel_runner import ParallelSymbolRunner
+
+
+def _universe(n=6, periods=60):
+    rng = np.random.default_rng(11)
+    data = {}
+
+    for i in range(n):
+        close = 100 + np.linspace(0, 20, periods) + rng.normal(0, 1, periods)
+        data[f"S{i}"] = pd.DataFrame({
+            "date": pd.date_range("2024-01-01", periods=periods),
+            "open": close,
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": rng.integers(400_000, 2_000_000, periods)
+        })
+
+    return data
+
+
+def _strip(outcome):
+    outcome = dict(outcome)
+    outcome.pop("evidence", None)
+    return outcome
+
+
+def test_parallel_outcomes_match_sequential_in_universe_order():
+    panel = IndicatorEngine().compute_panel(_universe())
+    symbols = list(panel) + ["MISSING"]
+    run_context = {"market_regime": {"regime": "BULLISH"}}
+
+    pipeline = SymbolPipeline.from_config()
+    expected = [
+        pipeline.evaluate(s, panel[s], run_context)
+        for s in symbols if s in panel
+    ]
+
+    runner = ParallelSymbolRunner(workers=2, chunk_size=2)
+    outcomes = runner.run(panel, symbols, run_context)
+
+    assert [o["symbol"] for o in outcomes] == [o["symbol"] for o in expected]
+    assert [_strip(o) for o in outcomes] == [_strip(o) for o in expected]
@@ -0,0 +1,119 @@
+import json
+import pandas as pd
+import pytest
+from src.backtest.backtest_engine import BacktestEngine
+from src.backtest.parameter_sweep import ParameterSweep
+from src.data_layer.indicator_engine import IndicatorEngine
+from src.data_layer.providers.synthetic_provider import generate_synthetic_ohlcv
+
+
+def _panel(n=12, days=260):
+    symbols = [f"S{i}" for i in range(n)]
+    return IndicatorEngine().compute_panel(
+        generate_synthetic_ohlcv(symbols, days, seed=5)
+    )
+
+
+def test_overrides_reach_detector_constants():
+    panel = _panel()
+    engine = BacktestEngine()
+
+    assert engine.signal_cube(panel).counts()["BREAKOUT"] > 0
+
+    engine.apply_overrides({
+        "setups.breakout.volume_spike": 100.0,
+        "scoring.setup": 25
+    })
+
+    assert engine.setup_engine.detectors[0].rules["volume_spike"] == 100.0
+    assert engine.scoring_engine.weights["setup"] == 25
+    assert engine.signal_cube(panel).counts()["BREAKOUT"] == 0
+
+    with pytest.raises(KeyError):
+        engine.apply_overrides({"setups.breakout.no_such_rule": 1})
+
+
+def test_sweep_ranks_every_set_and_matches_across_workers(tmp_path):
+    config = {
+        "method": "grid",
+        "workers": 1,
+        "rank_by": "expectancy_r",
+        "min_closed_trades": 0,
+        "output_path": str(tmp_path / "sweep.csv"),
+        "parameters": {
+            "setups.pullback.ema_20_band": [0.005, 0.01],
+            "backtest.min_score": [0, 70],
+            "liquidity.min_avg_volume": [0, 500000]
+        }
+    }
+    path = tmp_path / "sweep.json"
+    path.write_text(json.dumps(config))
+
+    panel = _panel()
+    sweep = ParameterSweep(str(path))
+
+    sets = sweep.parameter_sets()
+    assert len(sets) == 8
+    # One signal cube per distinct pullback band
+    assert [len(g) for g in sweep._group(sets)] == [4, 4]
+
+    table = sweep.run(panel, panel["S0"])
+
+    assert sorted(table["set"]) == list(range(8))
+    assert table["rank"].tolist() == list(range(1, 9))
+    assert table["expectancy_r"].is_monotonic_decreasing
+    # Ranked at full precision, rounded only in the CSV
+    written = pd.read_csv(tmp_path / "sweep.csv")
+    assert written["set"].tolist() == table["set"].tolist()
+    assert (table["expectancy_r"] != table["expectancy_r"].round(2)).any()
+    assert written["expectancy_r"].tolist() == table["expectancy_r"].round(2).tolist()
+
+    sweep.workers = 2
+    parallel = sweep.run(panel, panel["S0"])
+
+    columns = ["set", "plans", "closed", "expectancy_r", "max_drawdown_r"]
+    pd.testing.assert_frame_equal(parallel[columns], table[columns])
+
+
+def test_rank_orders_sets_apart_in_the_third_decimal(tmp_path):
+    path = tmp_path / "sweep.json"
+    path.write_text(json.dumps({"parameters": {"backtest.min_score": [0, 60]}}))
+
+    results = pd.DataFrame({
+        "set": [0, 1],
+        "backtest.min_score": [0, 60],
+        "plans": [80, 80],
+        "closed": [60, 60],
+        "hit_rate": [50.0, 50.0],
+        "expectancy_pct": [0.904, 1.252],
+        "expectancy_r": [0.184, 0.186],
+        "max_drawdown_r": [3.0, 3.0],
+        "seconds": [0.1, 0.1]
+    })
+
+    ranked = ParameterSweep(str(path)).rank(results, ["backtest.min_score"])
+
+    assert ranked["set"].tolist() == [1, 0]
+
+
+def test_random_sweep_draws_within_ranges(tmp_path):
+    path = tmp_path / "sweep.json"
+    path.write_text(json.dumps({
+        "method": "random",
+        "samples": 20,
+        "seed": 3,
+        "parameters": {
+            "scoring.setup": {"min": 20, "max": 40},
+            "setups.breakout.min_margin": {"min": 0.001, "max": 0.01},
+            "setups.rsi_reversal.rsi_level": [35, 40, 45]
+        }
+    }))
+
+    sets = ParameterSweep(str(path)).parameter_sets()
+
+    assert len(sets) == 20
+    for params in sets:
+        assert isinstance(params["scoring.setup"], int)
+        assert 20 <= params["scoring.setup"] <= 40
+        assert 0.001 <= params["setups.breakout.min_margin"] <= 0.01
+        assert params["setups.rsi_reversal.rsi_level"] in (35, 40, 45)
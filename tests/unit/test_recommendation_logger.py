@@ -0,0 +1,82 @@
+import json
+import numpy as np
+import pytest
+from src.core.config_loader import load_config
+from src.core.recommendation_orchestrator import RecommendationOrchestrator
+from src.data_layer.market_data_loader import MarketDataLoader
+from src.data_layer.providers.synthetic_provider import SyntheticDataProvider
+from src.data_layer.universe_loader import StockUniverseLoader
+from src.persistence.fundamentals_store import FundamentalsStore
+from src.persistence.recommendation_logger import RecommendationLogger
+
+
+def _evidence(symbol, timestamp="2024-05-02T10:00:00"):
+    return {
+        "symbol": symbol,
+        "run_timestamp": timestamp,
+        "trend_analysis": {"details": {"ema_alignment": np.bool_(True)}},
+        "score": {"score": np.int64(80)}
+    }
+
+
+def test_logger_batches_into_one_jsonl_file_per_run(tmp_path):
+    logger = RecommendationLogger(str(tmp_path), batch_size=2)
+    logger.start_run("run1")
+
+    for symbol in ["AAA", "BBB", "CCC"]:
+        logger.log(_evidence(symbol))
+
+    # Two records flushed on reaching the batch size, one still buffered
+    day_dir = tmp_path / "2024-05-02"
+    assert len((day_dir / "run_run1.jsonl").read_text().splitlines()) == 2
+
+    logger.start_run("run2")
+    logger.log(_evidence("DDD"))
+    logger.log(_evidence("EEE", "2024-05-03T00:00:01"))
+    logger.close()
+
+    assert sorted(p.name for p in day_dir.iterdir()) == [
+        "run_run1.jsonl", "run_run2.jsonl"
+    ]
+
+    records = logger.load_day("2024-05-02")
+    assert [r["symbol"] for r in records] == ["AAA", "BBB", "CCC", "DDD"]
+    assert records[0]["trend_analysis"]["details"]["ema_alignment"] is True
+    assert records[0]["score"]["score"] == 80
+
+    assert [r["symbol"] for r in logger.load_day("2024-05-03")] == ["EEE"]
+    assert logger.load_day("2024-05-04") == []
+
+
+def test_failed_run_still_writes_buffered_evidence(tmp_path):
+    universe = tmp_path / "universe.csv"
+    universe.write_text(
+        "symbol,exchange,sector,enabled\n"
+        + "".join(f"S{i:03d},NSE,IT,1\n" for i in range(20))
+    )
+    market_data = load_config("config/market_data.json")
+    market_data["cache"]["enabled"] = False
+    (tmp_path / "market_data.json").write_text(json.dumps(market_data))
+
+    orchestrator = RecommendationOrchestrator(mode="batch")
+    orchestrator.universe_loader = StockUniverseLoader(str(universe))
+    orchestrator.market_loader = MarketDataLoader(str(tmp_path / "market_data.json"))
+    orchestrator.market_loader.provider = SyntheticDataProvider(days=260, seed=1)
+    orchestrator.daily_cache = None
+    orchestrator.fundamentals_config = {}
+    orchestrator.fundamentals_store = FundamentalsStore(str(tmp_path / "f.db"))
+    orchestrator.logger = RecommendationLogger(str(tmp_path / "logs"))
+
+    seen = []
+
+    def on_outcome(outcome):
+        seen.append(outcome["symbol"])
+        if len(seen) == 15:
+            raise RuntimeError("consumer failed")
+
+    with pytest.raises(RuntimeError):
+        orchestrator.run(on_outcome=on_outcome)
+
+    day = next((tmp_path / "logs").iterdir()).name
+    written = [r["symbol"] for r in orchestrator.logger.load_day(day)]
+    assert written == seen
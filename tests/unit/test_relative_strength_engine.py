@@ -0,0 +1,58 @@
+import json
+import numpy as np
+from src.core.recommendation_orchestrator import RecommendationOrchestrator
+from src.core.config_loader import load_config
+from src.data_layer.indicator_engine import IndicatorEngine
+from src.data_layer.market_data_loader import MarketDataLoader
+from src.data_layer.providers.synthetic_provider import (
+    SyntheticDataProvider,
+    generate_synthetic_ohlcv
+)
+from src.intelligence.relative_strength_engine import RelativeStrengthEngine
+
+
+def test_rank_matches_per_symbol_and_orders_percentiles():
+    symbols = [f"S{i}" for i in range(30)]
+    data = generate_synthetic_ohlcv(symbols + ["^NSEI"], 200, seed=3)
+    data["S0"] = data["S0"].iloc[-50:]  # short history: only 20d horizon
+
+    panel = IndicatorEngine().compute_panel(data)
+    engine = RelativeStrengthEngine("config/relative_strength_rules.json")
+
+    close = panel.matrix("close")
+    table = engine.rank(close[:, :30], close[:, 30], panel.symbols[:30])
+
+    assert np.isnan(table.loc["S0", "excess_60"])
+    assert not np.isnan(table.loc["S0", "rs"])
+
+    best = table["rs"].idxmax()
+    assert table.loc[best, "percentile"] == 100.0
+
+    statuses = engine.statuses(table)
+    for symbol in ("S0", "S7", best):
+        single = engine.for_symbol(panel[symbol], panel["^NSEI"])
+        assert single["relative_strength"] == statuses[symbol]["relative_strength"]
+        assert single["excess_returns"] == statuses[symbol]["excess_returns"]
+
+
+def test_default_lookback_populates_every_horizon(tmp_path):
+    # Shipped market data config, minus the on-disk cache
+    config = load_config("config/market_data.json")
+    config["cache"]["enabled"] = False
+    path = tmp_path / "market_data.json"
+    path.write_text(json.dumps(config))
+
+    orchestrator = RecommendationOrchestrator()
+    orchestrator.market_loader = MarketDataLoader(str(path))
+    orchestrator.market_loader.provider = SyntheticDataProvider(seed=5)
+
+    symbols = [f"S{i}" for i in range(10)]
+    data = orchestrator.market_loader.fetch(symbols + [orchestrator.primary_index])
+    panel = orchestrator.indicator_engine.compute_panel(data)
+
+    statuses = orchestrator._relative_strength(panel, symbols)
+    horizons = [str(h) for h in orchestrator.relative_strength.horizons]
+
+    for symbol in symbols:
+        excess = statuses[symbol]["excess_returns"]
+        assert all(excess[h] is not None for h in horizons)
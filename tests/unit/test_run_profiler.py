@@ -0,0 +1,69 @@
+import json
+import sys
+import pytest
+from src.core.run_profiler import RunProfiler
+
+
+def test_profiler_records_spans_symbols_and_counters(tmp_path):
+    profiler = RunProfiler(enabled=True, track_memory=True)
+
+    with profiler.span("indicators"):
+        with profiler.span("inner"):
+            [0] * 10_000
+
+    profiler.record_outcomes([
+        {"symbol": "AAA", "eligible": True, "blocking_reasons": [],
+         "timings": {"trend": 0.1, "setups": 0.2}},
+        {"symbol": "BBB", "eligible": False,
+         "blocking_reasons": ["NOT_IN_UPTREND", "NO_VALID_SETUP"],
+         "timings": {"trend": 0.3}}
+    ])
+
+    report = json.loads(
+        profiler.write_json(str(tmp_path)).read_text()
+    )
+
+    assert [s["name"] for s in report["stages"]] == ["inner", "indicators"]
+    assert report["stages"][1]["peak_memory_bytes"] >= 80_000
+    assert report["symbol_stages"]["trend"]["count"] == 2
+    assert report["symbols"]["BBB"] == {"trend": 0.3}
+
+    text = profiler.prometheus_text()
+    assert 'pfm_stage_seconds{stage="indicators"}' in text
+    assert 'pfm_eligibility_rejections_total{reason="NOT_IN_UPTREND"} 1' in text
+    assert "pfm_symbols_eligible_total 1" in text
+
+
+def test_disabled_profiler_is_a_no_op():
+    profiler = RunProfiler()
+
+    with profiler.span("fetch"):
+        pass
+    profiler.incr("symbols_evaluated")
+    profiler.record_outcomes([
+        {"symbol": "AAA", "eligible": True, "blocking_reasons": []}
+    ])
+
+    assert profiler.spans == []
+    assert profiler.symbols == {}
+    assert not profiler.counters
+
+
+def test_peak_rss_units(monkeypatch):
+    resource = pytest.importorskip("resource")
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    monkeypatch.setattr(sys, "platform", "darwin")
+    assert max_rss <= RunProfiler().report()["max_rss_bytes"] < max_rss * 1024
+
+    monkeypatch.setattr(sys, "platform", "linux")
+    assert RunProfiler().report()["max_rss_bytes"] >= max_rss * 1024
+
+
+def test_missing_resource_module_omits_peak_rss(monkeypatch):
+    # As on Windows: no resource module, no RSS gauge
+    monkeypatch.setitem(sys.modules, "resource", None)
+
+    profiler = RunProfiler(enabled=True)
+    assert profiler.report()["max_rss_bytes"] is None
+    assert "max_rss_bytes" not in profiler.prometheus_text()
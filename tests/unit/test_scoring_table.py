@@ -0,0 +1,42 @@
+import random
+from src.decision.scoring_engine import ScoringEngine
+
+
+def _random_context(rng):
+    setups = [
+        {
+            "setup_type": rng.choice(["BREAKOUT", "PULLBACK", "RSI_REVERSAL"]),
+            "strength": rng.choice(["HIGH", "MEDIUM", "LOW"]),
+            "evidence": (
+                {"volume_multiple": round(rng.uniform(0.5, 2.5), 2)}
+                if rng.random() < 0.8 else {}
+            )
+        }
+        for _ in range(rng.randint(0, 3))
+    ]
+    return {
+        "setups": setups,
+        "trend": {
+            "trend": rng.choice(["UP", "DOWN", "RANGE"]),
+            "strength": rng.choice(["STRONG", "NEUTRAL", "WEAK"])
+        },
+        "sector_strength": {"strength": rng.choice(["STRONG", "NEUTRAL", "WEAK"])},
+        "market_regime": {"regime": rng.choice(["BULLISH", "NEUTRAL", "BEARISH"])},
+        "relative_strength": round(rng.uniform(-10, 10), 2)
+    }
+
+
+def test_score_table_matches_per_symbol_scores():
+    rng = random.Random(4)
+    contexts = [_random_context(rng) for _ in range(2000)]
+
+    engine = ScoringEngine("config/scoring_weights.json")
+    table = engine.score_table(engine.candidate_table(contexts))
+
+    for i, context in enumerate(contexts):
+        expected = engine.score(context)
+        row = table.iloc[i]
+
+        assert row["score"] == expected["score"]
+        for component, value in expected["breakdown"].items():
+            assert row[component] == value
@@ -0,0 +1,91 @@
+import pandas as pd
+from src.core.sector_strength_stage import SectorStrengthStage
+from src.data_layer.indicator_engine import IndicatorEngine
+from src.data_layer.providers.synthetic_provider import generate_synthetic_ohlcv
+from src.data_layer.universe_loader import StockUniverse, StockUniverseItem
+from src.intelligence.sector_strength_analyzer import SectorStrengthAnalyzer
+from src.persistence.daily_cache import DailyCache
+
+
+def _universe():
+    return StockUniverse([
+        StockUniverseItem("AAA", "NSE", "IT"),
+        StockUniverseItem("BBB", "NSE", "IT"),
+        StockUniverseItem("CCC", "NSE", "AUTO"),
+        StockUniverseItem("DDD", "NSE", "AUTO"),
+    ])
+
+
+def _stage(tmp_path, weighting="equal"):
+    analyzer = SectorStrengthAnalyzer("config/sector_strength_rules.json")
+    analyzer.rules["composite_weighting"] = weighting
+    return SectorStrengthStage(
+        analyzer=analyzer,
+        indicator_engine=IndicatorEngine(),
+        sector_indices={"IT": "^CNXIT"},
+        primary_index="^NSEI",
+        cache=DailyCache(str(tmp_path))
+    )
+
+
+def test_indices_and_composites_are_mapped_per_symbol(tmp_path):
+    universe = _universe()
+    stage = _stage(tmp_path)
+
+    assert stage.index_symbols(universe) == ["^NSEI", "^CNXIT"]
+
+    engine = IndicatorEngine()
+    panel = engine.compute_panel(generate_synthetic_ohlcv(
+        universe.symbols + stage.index_symbols(universe), 260, seed=4
+    ))
+
+    sectors = stage.compute(universe, panel)
+    assert sectors["IT"]["source"] == "index"
+    assert sectors["AUTO"]["source"] == "composite"
+
+    by_symbol = stage.by_symbol(universe, sectors)
+    assert by_symbol["CCC"]["sector"] == "AUTO"
+    assert by_symbol["CCC"]["strength"] == sectors["AUTO"]["strength"]
+
+    # Same trading day: served from the cache
+    assert stage.load_cached(universe) == sectors
+
+
+def test_missing_primary_index_falls_back_to_universe_composite(tmp_path):
+    universe = _universe()
+    stage = _stage(tmp_path, weighting="volume")
+
+    panel = IndicatorEngine().compute_panel(
+        generate_synthetic_ohlcv(universe.symbols, 260, seed=4)
+    )
+
+    assert stage.missing_sectors(universe, panel) == ["AUTO", "IT"]
+
+    sectors = stage.compute(universe, panel)
+    assert {s["source"] for s in sectors.values()} == {"composite"}
+    assert all(pd.notna(s["relative_return"]) for s in sectors.values())
+
+
+def test_composite_fallbacks_and_other_universes_miss_the_cache(tmp_path):
+    universe = _universe()
+    stage = _stage(tmp_path)
+
+    # ^CNXIT failed to fetch: IT falls back to a composite, not cached
+    panel = IndicatorEngine().compute_panel(
+        generate_synthetic_ohlcv(universe.symbols + ["^NSEI"], 260, seed=4)
+    )
+    sectors = stage.compute(universe, panel)
+    assert sectors["IT"]["source"] == "composite"
+    assert stage.load_cached(universe) is None
+
+    panel = IndicatorEngine().compute_panel(generate_synthetic_ohlcv(
+        universe.symbols + stage.index_symbols(universe), 260, seed=4
+    ))
+    sectors = stage.compute(universe, panel)
+    assert stage.load_cached(universe) == sectors
+
+    # Different AUTO members build a different composite
+    changed = StockUniverse(
+        universe.stocks[:3] + [StockUniverseItem("EEE", "NSE", "AUTO")]
+    )
+    assert stage.load_cached(changed) is None
@@ -0,0 +1,58 @@
+import numpy as np
+from src.data_layer.indicator_engine import IndicatorEngine
+from src.data_layer.providers.synthetic_provider import generate_synthetic_ohlcv
+from src.setups.setup_engine import SetupDetectionEngine
+from src.setups.trend_analyzer import TrendAnalyzer
+
+
+def _panel(n=6, days=260):
+    symbols = [f"S{i}" for i in range(n)]
+    return IndicatorEngine().compute_panel(
+        generate_synthetic_ohlcv(symbols, days, seed=21)
+    )
+
+
+def test_detect_series_matches_detect_on_every_prefix():
+    panel = _panel()
+    trend_analyzer = TrendAnalyzer("config/trend_rules.json")
+    engine = SetupDetectionEngine()
+
+    fired = 0
+    for symbol in panel:
+        df = panel[symbol]
+        trends = trend_analyzer.analyze_series(df)
+        series = engine.detect_series(df, trends)
+
+        for i in range(1, len(df)):
+            prefix = df.iloc[:i + 1]
+            trend_info = trend_analyzer.analyze(prefix)
+
+            assert trends["trend"].iloc[i] == trend_info["trend"]
+            assert trends["strength"].iloc[i] == trend_info["strength"]
+
+            for detector in engine.detectors:
+                frame = series[detector.setup_type]
+                expected = detector.detect(prefix, trend_info)
+
+                assert bool(frame["signal"].iloc[i]) == (expected is not None)
+                if expected:
+                    fired += 1
+                    row = frame.iloc[i]
+                    for key, value in expected["evidence"].items():
+                        assert row[key] == value
+
+    assert fired > 0
+
+
+def test_signal_cube_is_aligned_to_panel_dates():
+    panel = _panel()
+    engine = SetupDetectionEngine()
+
+    cube = engine.signal_cube(panel, TrendAnalyzer("config/trend_rules.json"))
+
+    assert cube.signals.shape == (len(panel.dates), 6, 3)
+    assert cube.setups == ["BREAKOUT", "PULLBACK", "RSI_REVERSAL"]
+
+    frame = cube.evidence[("S2", "PULLBACK")]
+    assert cube.matrix("PULLBACK")[:, 2].sum() == frame["signal"].sum()
+    assert int(cube.counts().sum()) == int(np.count_nonzero(cube.signals))
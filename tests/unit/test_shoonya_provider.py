@@ -0,0 +1,67 @@
+from src.data_layer.providers.shoonya_provider import ShoonyaProvider
+
+
+class FakeClient:
+
+    def __init__(self, flaky=(), empty=(), rejected=()):
+        self.flaky = set(flaky)
+        self.empty = set(empty)
+        self.rejected = set(rejected)
+        self.calls = []
+
+    def get_time_price_series(self, exchange, symbol, interval, days):
+        self.calls.append(symbol)
+
+        if symbol in self.empty:
+            return None
+
+        if symbol in self.rejected:
+            return {"stat": "Not_Ok", "emsg": "Session Expired"}
+
+        if symbol in self.flaky:
+            self.flaky.discard(symbol)
+            raise ConnectionError("throttled")
+
+        return [
+            {"time": "2024-01-01", "into": 1, "inth": 2,
+             "intl": 0.5, "intc": 1.5, "intv": 1000}
+        ]
+
+
+def _provider(client):
+    return ShoonyaProvider(
+        client,
+        max_workers=4,
+        requests_per_second=1000,
+        burst=100,
+        max_retries=2,
+        backoff_seconds=0
+    )
+
+
+def test_concurrent_fetch_retries_and_reports_failures():
+    client = FakeClient(flaky={"BBB"}, empty={"CCC"}, rejected={"DDD"})
+    provider = _provider(client)
+
+    data = provider.fetch_ohlcv(["AAA", "BBB", "CCC", "DDD"], 30)
+
+    assert list(data) == ["AAA", "BBB"]
+    assert client.calls.count("BBB") == 2
+    # Empty series is final; API errors are retried
+    assert client.calls.count("CCC") == 1
+    assert client.calls.count("DDD") == 3
+    assert provider.failed_symbols == {
+        "CCC": "NO_DATA",
+        "DDD": "API_ERROR: Session Expired"
+    }
+
+
+def test_index_symbols_map_to_shoonya_names():
+    client = FakeClient()
+    provider = _provider(client)
+
+    data = provider.fetch_ohlcv(["^NSEI", "^UNKNOWN"], 30)
+
+    assert list(data) == ["^NSEI"]
+    assert client.calls == ["Nifty 50"]
+    assert provider.failed_symbols == {"^UNKNOWN": "UNKNOWN_INDEX"}
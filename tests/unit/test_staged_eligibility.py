@@ -0,0 +1,117 @@
+import json
+from src.core.config_loader import load_config
+from src.core.recommendation_orchestrator import RecommendationOrchestrator
+from src.core.symbol_pipeline import SymbolPipeline
+from src.data_layer.indicator_engine import IndicatorEngine
+from src.data_layer.market_data_loader import MarketDataLoader
+from src.data_layer.providers.synthetic_provider import (
+    SyntheticDataProvider,
+    generate_synthetic_ohlcv
+)
+from src.data_layer.universe_loader import StockUniverseLoader
+from src.persistence.fundamentals_store import FundamentalsStore
+
+
+RUN_CONTEXT = {"market_regime": {"regime": "BULLISH"}}
+
+
+def _pipeline(staged, record=False):
+    pipeline = SymbolPipeline.from_config()
+    pipeline.eligibility_engine.staged = staged
+    pipeline.eligibility_engine.record_rejections = record
+    return pipeline
+
+
+def test_staged_evaluation_keeps_the_same_eligible_outcomes():
+    symbols = [f"S{i}" for i in range(60)]
+    panel = IndicatorEngine().compute_panel(
+        generate_synthetic_ohlcv(symbols, 260, seed=8)
+    )
+
+    full = _pipeline(staged=False)
+    staged = _pipeline(staged=True)
+
+    rejected_at = set()
+    for symbol in panel:
+        a = full.evaluate(symbol, panel[symbol], RUN_CONTEXT)
+        b = staged.evaluate(symbol, panel[symbol], RUN_CONTEXT)
+
+        assert a["eligible"] == b["eligible"]
+        if a["eligible"]:
+            assert a["score"] == b["score"]
+            assert a["buy_plan"] == b["buy_plan"]
+        else:
+            assert set(b["blocking_reasons"]) <= set(a["blocking_reasons"])
+            rejected_at.add(b["rejected_at"])
+
+    assert "trend" in rejected_at
+
+
+def test_first_failing_gate_short_circuits_and_is_recorded():
+    df = IndicatorEngine().compute(
+        generate_synthetic_ohlcv(["AAA"], 260, seed=8)
+    )["AAA"]
+
+    pipeline = _pipeline(staged=True, record=True)
+    pipeline.trend_analyzer = None  # must not be reached
+
+    outcome = pipeline.evaluate("AAA", df, {
+        "market_regime": {"regime": "BEARISH"},
+        "liquidity": {"AAA": {"tradable": True, "failed_checks": []}}
+    })
+
+    assert outcome["blocking_reasons"] == ["MARKET_BEARISH"]
+    assert outcome["rejected_at"] == "market_regime"
+
+    record = SymbolPipeline.log_record(outcome)
+    assert record["record_type"] == "rejection"
+    assert record["blocking_reasons"] == ["MARKET_BEARISH"]
+
+
+class CollectingLogger:
+
+    def __init__(self):
+        self.records = []
+
+    def start_run(self, run_id=None):
+        pass
+
+    def log(self, evidence):
+        self.records.append(evidence)
+
+    def flush(self):
+        pass
+
+
+def test_shipped_config_logs_early_rejections(tmp_path):
+    universe = tmp_path / "universe.csv"
+    universe.write_text(
+        "symbol,exchange,sector,enabled\n"
+        + "".join(f"S{i:03d},NSE,IT,1\n" for i in range(40))
+    )
+
+    market_data = load_config("config/market_data.json")
+    market_data["cache"]["enabled"] = False
+    (tmp_path / "market_data.json").write_text(json.dumps(market_data))
+
+    orchestrator = RecommendationOrchestrator(mode="batch")
+    orchestrator.universe_loader = StockUniverseLoader(str(universe))
+    orchestrator.market_loader = MarketDataLoader(str(tmp_path / "market_data.json"))
+    orchestrator.market_loader.provider = SyntheticDataProvider(days=260, seed=1)
+    orchestrator.daily_cache = None
+    orchestrator.fundamentals_config = {}
+    orchestrator.fundamentals_store = FundamentalsStore(str(tmp_path / "f.db"))
+    orchestrator.logger = CollectingLogger()
+
+    outcomes = []
+    orchestrator.run(on_outcome=outcomes.append)
+
+    rejected = {o["symbol"] for o in outcomes if o.get("rejected_at")}
+    logged = {
+        r["symbol"]: r for r in orchestrator.logger.records
+        if r.get("record_type") == "rejection"
+    }
+
+    assert rejected
+    assert rejected <= set(logged)
+    assert all(logged[s]["blocking_reasons"] for s in rejected)
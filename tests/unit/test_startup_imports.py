@@ -0,0 +1,74 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+PROVIDER_LIBRARIES = ("yfinance", "NorenRestApiPy")
+
+# Generous; pandas alone is ~0.5s. Catches heavy imports creeping back.
+STARTUP_BUDGET_SECONDS = 3.0
+
+
+def _run(code: str) -> dict:
+    """
+    Runs `code` in a fresh interpreter; it prints one JSON line.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _loaded(*modules) -> str:
+    return f"[m for m in {modules!r} if m in sys.modules]"
+
+
+def test_cli_module_loads_without_pandas():
+    result = _run(f"""
+import json, sys
+import main
+print(json.dumps({{"loaded": {_loaded("pandas", *PROVIDER_LIBRARIES)}}}))
+""")
+
+    assert result["loaded"] == []
+
+
+def test_orchestrator_startup_skips_provider_libraries():
+    result = _run(f"""
+import json, sys, time
+start = time.perf_counter()
+from src.core.recommendation_orchestrator import RecommendationOrchestrator
+from src.data_layer.shoonya.shoonya_client_factory import ShoonyaClientFactory
+RecommendationOrchestrator()
+print(json.dumps({{
+    "loaded": {_loaded(*PROVIDER_LIBRARIES)},
+    "seconds": time.perf_counter() - start
+}}))
+""")
+
+    assert result["loaded"] == []
+    assert result["seconds"] < STARTUP_BUDGET_SECONDS
+
+
+def test_selected_provider_is_imported_on_first_use(tmp_path):
+    config = tmp_path / "market_data.json"
+    config.write_text(json.dumps({
+        "provider": "yahoo",
+        "defaults": {"lookback_days": 30},
+        "cache": {"enabled": False}
+    }))
+
+    result = _run(f"""
+import json, sys
+from src.data_layer.market_data_loader import MarketDataLoader
+loader = MarketDataLoader({str(config)!r})
+before = {_loaded(*PROVIDER_LIBRARIES)}
+loader.provider
+print(json.dumps({{"before": before, "after": {_loaded(*PROVIDER_LIBRARIES)}}}))
+""")
+
+    assert result["before"] == []
+    assert result["after"] == ["yfinance"]
@@ -0,0 +1,85 @@
+import pytest
+import pandas as pd
+from src.data_layer.indicator_engine import IndicatorEngine
+from src.core.streaming_pipeline import StreamingPipeline
+
+
+class FakeLoader:
+
+    def __init__(self):
+        self.batches = []
+
+    def fetch(self, symbols, refresh=False):
+        self.batches.append(list(symbols))
+
+        return {
+            s: pd.DataFrame({
+                "date": pd.date_range("2024-01-01", periods=30),
+                "open": 1.0, "high": 2.0, "low": 0.5,
+                "close": 1.5, "volume": 1000.0
+            })
+            for s in symbols if s != "MISSING"
+        }
+
+
+class FakeSymbolPipeline:
+
+    def evaluate(self, symbol, df, run_context):
+        eligible = symbol != "S1"
+        return {
+            "symbol": symbol,
+            "eligible": eligible,
+            "blocking_reasons": [] if eligible else ["NOT_IN_UPTREND"],
+            "score": len(df),
+            "buy_plan": {},
+            "evidence": {"symbol": symbol}
+        }
+
+
+class FakeLogger:
+
+    def __init__(self):
+        self.logged = []
+
+    def log(self, evidence):
+        self.logged.append(evidence["symbol"])
+
+
+def test_streaming_pipeline_runs_all_stages_in_batches():
+    loader = FakeLoader()
+    logger = FakeLogger()
+    seen = []
+
+    pipeline = StreamingPipeline(
+        market_loader=loader,
+        indicator_engine=IndicatorEngine(),
+        symbol_pipeline=FakeSymbolPipeline(),
+        logger=logger,
+        config={
+            "fetch_batch_size": 2,
+            "queue_sizes": {"indicators": 1, "evaluate": 1, "log": 1},
+            "concurrency": {"indicators": 2, "evaluate": 3}
+        }
+    )
+
+    symbols = ["S0", "S1", "MISSING", "S3", "S4"]
+    outcomes = pipeline.run(symbols, {}, on_outcome=seen.append)
+
+    assert loader.batches == [["S0", "S1"], ["MISSING", "S3"], ["S4"]]
+    assert [o["symbol"] for o in outcomes] == ["S0", "S1", "S3", "S4"]
+    assert len(seen) == 4
+    assert sorted(logger.logged) == ["S0", "S3", "S4"]
+
+
+def test_streaming_pipeline_propagates_stage_errors():
+    class Broken(FakeSymbolPipeline):
+        def evaluate(self, symbol, df, run_context):
+            raise RuntimeError("boom")
+
+    pipeline = StreamingPipeline(
+        FakeLoader(), IndicatorEngine(), Broken(), FakeLogger(),
+        config={"fetch_batch_size": 1, "queue_sizes": {"evaluate": 1}}
+    )
+
+    with pytest.raises(RuntimeError, match="boom"):
+        pipeline.run([f"S{i}" for i in range(10)], {})
@@ -0,0 +1,40 @@
+from src.data_layer.indicator_engine import IndicatorEngine
+from src.data_layer.providers.synthetic_provider import (
+    SyntheticDataProvider,
+    generate_synthetic_ohlcv
+)
+from src.setups.setup_engine import SetupDetectionEngine
+from src.setups.trend_analyzer import TrendAnalyzer
+
+
+def test_synthetic_data_is_deterministic():
+    symbols = ["AAA", "BBB"]
+
+    first = generate_synthetic_ohlcv(symbols, 60, seed=3)
+    second = generate_synthetic_ohlcv(symbols, 60, seed=3)
+
+    assert first["AAA"].equals(second["AAA"])
+    assert not first["AAA"].equals(generate_synthetic_ohlcv(symbols, 60, seed=4)["AAA"])
+
+    provider = SyntheticDataProvider(days=60, seed=1)
+    alone = provider.fetch_ohlcv(["AAA"], 90)["AAA"]
+    together = provider.fetch_ohlcv(["BBB", "AAA"], 90)["AAA"]
+    assert alone.equals(together)
+
+
+def test_synthetic_universe_fires_every_setup_type():
+    symbols = [f"S{i}" for i in range(300)]
+    panel = IndicatorEngine().compute_panel(
+        generate_synthetic_ohlcv(symbols, 260, seed=7)
+    )
+
+    trend = TrendAnalyzer("config/trend_rules.json")
+    engine = SetupDetectionEngine()
+
+    fired = {
+        setup["setup_type"]
+        for s in panel
+        for setup in engine.detect_setups(panel[s], trend.analyze(panel[s]))
+    }
+
+    assert fired == {"BREAKOUT", "PULLBACK", "RSI_REVERSAL"}
@@ -0,0 +1,48 @@
+from src.core.symbol_pipeline import SymbolPipeline
+from src.core.top_k import TopKSelector
+from src.data_layer.indicator_engine import IndicatorEngine
+from src.data_layer.providers.synthetic_provider import generate_synthetic_ohlcv
+
+
+def test_selector_keeps_best_scores_with_stable_ties():
+    selector = TopKSelector(2)
+    scores = [("A", 50), ("B", 70), ("C", 70), ("D", 10), ("E", 90)]
+
+    evicted = [
+        selector.push({"symbol": s, "eligible": True, "score": score})
+        for s, score in scores
+    ]
+    selector.push({"symbol": "X", "eligible": False})
+
+    assert [o["symbol"] for o in selector.ranked()] == ["E", "B"]
+    assert [o["symbol"] for o in evicted if o] == ["A", "D", "C"]
+
+
+def test_deferred_outcomes_finalize_to_the_full_result():
+    symbols = [f"S{i}" for i in range(60)]
+    panel = IndicatorEngine().compute_panel(
+        generate_synthetic_ohlcv(symbols, 260, seed=8)
+    )
+    pipeline = SymbolPipeline.from_config()
+    context = {"market_regime": {"regime": "BULLISH"}}
+
+    full = [pipeline.evaluate(s, panel[s], context) for s in panel]
+    expected = sorted(
+        (o for o in full if o["eligible"]), key=lambda o: o["score"], reverse=True
+    )[:3]
+
+    selector = TopKSelector(3)
+    for s in panel:
+        outcome = pipeline.evaluate(s, panel[s], {**context, "defer_plans": True})
+        if outcome["eligible"]:
+            assert SymbolPipeline.log_record(outcome) is None
+
+        evicted = selector.push(outcome)
+        if evicted:
+            record = pipeline.score_only(evicted)["evidence"]
+            assert record["record_type"] == "score_only"
+
+    kept = [pipeline.finalize(o) for o in selector.ranked()]
+
+    assert [o["symbol"] for o in kept] == [o["symbol"] for o in expected]
+    assert [o["buy_plan"] for o in kept] == [o["buy_plan"] for o in expected]
@@ -0,0 +1,54 @@
+import pandas as pd
+from src.data_layer.providers import yahoo_provider
+from src.data_layer.providers.yahoo_provider import YahooFinanceProvider
+
+
+def _bulk_frame(tickers, periods=5):
+    index = pd.date_range("2024-01-01", periods=periods, name="Date")
+    fields = ["Open", "High", "Low", "Close", "Volume"]
+
+    frames = {
+        t: pd.DataFrame(
+            {f: [float(i) for i in range(periods)] for f in fields},
+            index=index
+        )
+        for t in tickers
+    }
+    return pd.concat(frames, axis=1)
+
+
+def test_bulk_download_is_chunked_and_split(monkeypatch):
+    calls = []
+
+    def fake_download(tickers, **kwargs):
+        calls.append(list(tickers))
+        return _bulk_frame(tickers)
+
+    monkeypatch.setattr(yahoo_provider.yf, "download", fake_download)
+
+    provider = YahooFinanceProvider(bulk=True, chunk_size=2)
+    data = provider.fetch_ohlcv(["AAA", "BBB", "CCC"], 30)
+
+    assert calls == [["AAA.NS", "BBB.NS"], ["CCC.NS"]]
+    assert set(data) == {"AAA", "BBB", "CCC"}
+    assert list(data["AAA"].columns) == [
+        "date", "open", "high", "low", "close", "volume"
+    ]
+    assert len(data["CCC"]) == 5
+
+
+def test_bulk_split_drops_missing_tickers():
+    raw = _bulk_frame(["AAA.NS", "BBB.NS"])
+    raw.loc[:, ("BBB.NS", "Close")] = float("nan")
+
+    provider = YahooFinanceProvider(bulk=True)
+    data = provider._split_bulk_frame(raw, ["AAA", "BBB", "ZZZ"])
+
+    assert list(data) == ["AAA"]
+
+
+def test_index_symbols_skip_exchange_suffix():
+    provider = YahooFinanceProvider(exchange_suffix=".NS")
+
+    assert provider._ticker("TCS") == "TCS.NS"
+    assert provider._ticker("^NSEI") == "^NSEI"